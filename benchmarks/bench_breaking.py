@@ -0,0 +1,49 @@
+import copy
+
+import pytest
+
+from benchmarks.generators import generate_data_contract, to_yaml
+from datacontract.breaking.breaking import models_breaking_changes
+from datacontract.breaking.breaking_change import Severity
+from datacontract.data_contract import DataContract
+from datacontract.lint import resolve
+
+
+def change_fields(data_contract: dict) -> dict:
+    """Remove, retype, rename and add a field of every model, to have changes to report."""
+    changed = copy.deepcopy(data_contract)
+    for model in changed["models"].values():
+        fields = model["fields"]
+        fields.pop("field_0")
+        fields["field_2"]["type"] = "long"
+        fields["field_1_renamed"] = fields.pop("field_1")
+        fields["field_added"] = {"type": "string"}
+    return changed
+
+
+@pytest.mark.parametrize("models,fields", [(1, 10), (10, 50), (50, 200)])
+def bench_changelog(benchmark, tmp_path, models, fields):
+    old = generate_data_contract(models, fields, nested_depth=1)
+    new = change_fields(old)
+    (tmp_path / "old.yaml").write_text(to_yaml(old))
+    (tmp_path / "new.yaml").write_text(to_yaml(new))
+    old_data_contract = DataContract(data_contract_file=str(tmp_path / "old.yaml"))
+    new_data_contract = DataContract(data_contract_file=str(tmp_path / "new.yaml"))
+
+    result = benchmark(old_data_contract.changelog, new_data_contract)
+    assert result.breaking_changes
+
+
+@pytest.mark.parametrize("changed_models", [0, 1, 50])
+def bench_models_breaking_changes(benchmark, changed_models):
+    """Compare the models of two resolved contracts of 50 models of 200 fields, of which `changed_models` differ."""
+    old = generate_data_contract(50, 200, nested_depth=1)
+    changed = change_fields(old)
+    new = copy.deepcopy(old)
+    for model_name in list(new["models"])[:changed_models]:
+        new["models"][model_name] = changed["models"][model_name]
+    old_models = resolve.resolve_data_contract(data_contract_str=to_yaml(old)).models
+    new_models = resolve.resolve_data_contract(data_contract_str=to_yaml(new)).models
+
+    result = benchmark(models_breaking_changes, old_models, new_models, "datacontract.yaml", list(Severity))
+    assert bool(result) == (changed_models > 0)
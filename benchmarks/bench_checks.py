@@ -0,0 +1,18 @@
+from datacontract.engines.data_contract_checks import create_checks
+from datacontract.export.sodacl_converter import to_sodacl_yaml
+from datacontract.lint import resolve
+from datacontract.model.data_contract_specification import Server
+from datacontract.model.run import Run
+
+
+def bench_create_checks(benchmark, data_contract_yaml):
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_yaml)
+    server = Server(type="duckdb")
+    benchmark(create_checks, data_contract, server)
+
+
+def bench_to_sodacl_yaml(benchmark, data_contract_yaml):
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_yaml)
+    run = Run.create_run()
+    run.checks.extend(create_checks(data_contract, Server(type="duckdb")))
+    benchmark(to_sodacl_yaml, run)
@@ -0,0 +1,19 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize("args", [["--help"], ["lint", "--help"]], ids=["help", "lint-help"])
+def bench_cli_startup(benchmark, args):
+    def run_cli():
+        subprocess.run([sys.executable, "-m", "datacontract.cli", *args], check=True, capture_output=True)
+
+    benchmark.pedantic(run_cli, rounds=5, warmup_rounds=1)
+
+
+def bench_import(benchmark):
+    def import_data_contract():
+        subprocess.run([sys.executable, "-c", "import datacontract.data_contract"], check=True, capture_output=True)
+
+    benchmark.pedantic(import_data_contract, rounds=5, warmup_rounds=1)
@@ -0,0 +1,18 @@
+import pytest
+
+from benchmarks.generators import generate_local_data_contract
+from datacontract.data_contract import DataContract
+
+
+@pytest.mark.parametrize("engine", ["soda", "duckdb"])
+@pytest.mark.parametrize("format", ["parquet", "csv", "json"])
+def bench_test_local(benchmark, tmp_path, format, engine):
+    rows = 100_000
+    data_contract_yaml = generate_local_data_contract(tmp_path, rows, format)
+
+    def test():
+        return DataContract(data_contract_str=data_contract_yaml, engine=engine).test()
+
+    run = benchmark.pedantic(test, rounds=3, warmup_rounds=1)
+    assert run.result == "passed", [(check.name, check.reason) for check in run.checks if check.result != "passed"]
+    benchmark.extra_info["rows"] = rows
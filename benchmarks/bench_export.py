@@ -0,0 +1,27 @@
+import pytest
+
+from benchmarks.conftest import FIXTURES
+from datacontract.data_contract import DataContract
+from datacontract.export.exporter import ExportFormat
+
+# formats that need further arguments, which are benchmarked with the arguments of their tests
+EXPORT_ARGUMENTS = {
+    ExportFormat.rdf: {"rdf_base": None},
+    ExportFormat.great_expectations: {"model": "orders"},
+    ExportFormat.dbt_staging_sql: {"model": "orders"},
+    ExportFormat.sql_query: {"model": "orders"},
+    ExportFormat.custom: {"template": FIXTURES / "custom" / "export" / "template.sql"},
+}
+
+
+@pytest.mark.parametrize("export_format", list(ExportFormat), ids=lambda export_format: export_format.value)
+def bench_export(benchmark, export_format):
+    data_contract_file = str(FIXTURES / "export" / "datacontract.yaml")
+    data_contract = DataContract(data_contract_file=data_contract_file)
+    data_contract.get_data_contract_specification()
+    kwargs = EXPORT_ARGUMENTS.get(export_format, {})
+    try:
+        data_contract.export(export_format, **kwargs)
+    except Exception as e:
+        pytest.skip(f"Cannot export to {export_format.value}: {e}")
+    benchmark(data_contract.export, export_format, **kwargs)
@@ -0,0 +1,22 @@
+import pytest
+
+from benchmarks.generators import generate_local_data_contract
+from datacontract.engines.fastjsonschema.check_jsonschema import check_jsonschema
+from datacontract.lint import resolve
+from datacontract.model.run import Run
+
+
+@pytest.mark.parametrize("rows", [1_000, 100_000])
+def bench_check_jsonschema(benchmark, tmp_path, rows):
+    data_contract_yaml = generate_local_data_contract(tmp_path, rows, "json")
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_yaml)
+    server = data_contract.servers["production"]
+
+    def validate():
+        run = Run.create_run()
+        check_jsonschema(run, data_contract, server)
+        return run
+
+    run = benchmark(validate)
+    assert all(check.result == "passed" for check in run.checks)
+    benchmark.extra_info["rows"] = rows
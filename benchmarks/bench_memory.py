@@ -0,0 +1,43 @@
+import gc
+import tracemalloc
+
+import pytest
+
+from benchmarks.generators import generate_data_contract
+from datacontract.model.construct import construct_model
+from datacontract.model.data_contract_specification import DataContractSpecification
+
+# 100 models with 1000 fields each, with one level of nested fields
+CONTRACT_SIZE = (100, 1000, 1)
+
+MODES = {
+    "pydantic": lambda data: DataContractSpecification(**data),
+    "construct": lambda data: construct_model(DataContractSpecification, data),
+    "read-only": lambda data: construct_model(DataContractSpecification, data, read_only=True),
+}
+
+
+@pytest.fixture(scope="module")
+def data_contract_100k_fields() -> dict:
+    return generate_data_contract(*CONTRACT_SIZE)
+
+
+@pytest.mark.parametrize("mode", list(MODES))
+def bench_memory_100k_fields(benchmark, data_contract_100k_fields, mode):
+    """The memory of the models of a data contract, recorded as `memory_mb` in the extra info of the results."""
+    build = MODES[mode]
+
+    def measure():
+        gc.collect()
+        tracemalloc.start()
+        try:
+            data_contract = build(data_contract_100k_fields)
+            gc.collect()
+            memory, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return data_contract, memory
+
+    data_contract, memory = benchmark.pedantic(measure, rounds=1, iterations=1)
+    benchmark.extra_info["memory_mb"] = round(memory / 1024 / 1024, 1)
+    assert len(data_contract.models) == CONTRACT_SIZE[0]
@@ -0,0 +1,36 @@
+import pytest
+
+from benchmarks.conftest import FIXTURES
+from benchmarks.generators import generate_data_contract, to_yaml
+from datacontract import snapshot
+from datacontract.lint import resolve
+
+
+def bench_resolve_fixture(benchmark):
+    data_contract_file = str(FIXTURES / "export" / "datacontract.yaml")
+    benchmark(resolve.resolve_data_contract, data_contract_location=data_contract_file)
+
+
+def bench_resolve_generated(benchmark, data_contract_yaml):
+    benchmark(resolve.resolve_data_contract, data_contract_str=data_contract_yaml)
+
+
+@pytest.fixture(scope="module")
+def data_contract_50k_fields_yaml() -> str:
+    return to_yaml(generate_data_contract(models=50, fields=1000, nested_depth=0))
+
+
+@pytest.mark.parametrize("strict", [True, False], ids=["strict", "fast"])
+def bench_resolve_50k_fields(benchmark, data_contract_50k_fields_yaml, strict):
+    benchmark.pedantic(
+        resolve.resolve_data_contract,
+        kwargs={"data_contract_str": data_contract_50k_fields_yaml, "strict": strict},
+        rounds=3,
+        iterations=1,
+    )
+
+
+def bench_load_snapshot_50k_fields(benchmark, data_contract_50k_fields_yaml):
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_50k_fields_yaml)
+    content = snapshot.dumps_snapshot(data_contract, data_contract_50k_fields_yaml)
+    benchmark.pedantic(snapshot.loads_snapshot, args=(content,), rounds=3, iterations=1)
@@ -0,0 +1,36 @@
+import pytest
+import yaml
+
+from benchmarks.generators import generate_data_contract
+from datacontract import yaml_io
+
+# the pure Python implementation (before) and the libyaml based one of yaml_io (after)
+LOADERS = {"python": yaml.safe_load, "libyaml": yaml_io.safe_load}
+
+
+@pytest.fixture(scope="module")
+def large_data_contract() -> dict:
+    return generate_data_contract(50, 200, nested_depth=2)
+
+
+@pytest.mark.parametrize("implementation", list(LOADERS))
+def bench_safe_load(benchmark, large_data_contract, implementation):
+    data_contract_str = yaml.safe_dump(large_data_contract, sort_keys=False)
+    benchmark.extra_info["bytes"] = len(data_contract_str)
+
+    result = benchmark(LOADERS[implementation], data_contract_str)
+    assert result == large_data_contract
+
+
+def bench_safe_dump(benchmark, large_data_contract):
+    # dumping stays pure Python, see yaml_io
+    result = benchmark(yaml_io.safe_dump, large_data_contract, sort_keys=False)
+    assert result == yaml.safe_dump(large_data_contract, sort_keys=False)
+
+
+def bench_safe_load_cached(benchmark, large_data_contract):
+    data_contract_str = yaml.safe_dump(large_data_contract, sort_keys=False)
+    cache = yaml_io.YamlParseCache()
+    cache.safe_load(data_contract_str)
+
+    benchmark(cache.safe_load, data_contract_str)
@@ -0,0 +1,20 @@
+from pathlib import Path
+
+import pytest
+
+from benchmarks.generators import generate_data_contract, to_yaml
+
+FIXTURES = Path(__file__).parent.parent / "tests" / "fixtures"
+
+# (models, fields per model, nesting depth) of the generated contracts
+CONTRACT_SIZES = {
+    "small": (1, 10, 0),
+    "medium": (10, 50, 1),
+    "large": (50, 200, 2),
+}
+
+
+@pytest.fixture(scope="session", params=list(CONTRACT_SIZES))
+def data_contract_yaml(request) -> str:
+    models, fields, nested_depth = CONTRACT_SIZES[request.param]
+    return to_yaml(generate_data_contract(models, fields, nested_depth))
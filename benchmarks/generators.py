@@ -0,0 +1,129 @@
+"""Synthetic data contracts and data files of configurable size for the benchmarks."""
+
+import json
+import random
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import duckdb
+import yaml
+
+# the DuckDB types of the generated values, so that the written files match the field types of the contract
+DUCKDB_TYPES = {
+    "string": "VARCHAR",
+    "long": "BIGINT",
+    "double": "DOUBLE",
+    "boolean": "BOOLEAN",
+    "timestamp": "TIMESTAMPTZ",
+    "date": "DATE",
+}
+
+FIELD_TEMPLATES = [
+    {"type": "string", "required": True, "unique": True, "maxLength": 12, "pattern": "^ID-[0-9]+$"},
+    {"type": "string", "enum": ["new", "shipped", "delivered", "returned"]},
+    {"type": "long", "required": True, "minimum": 0, "maximum": 1000000},
+    {"type": "double", "minimum": 0},
+    {"type": "boolean"},
+    {"type": "timestamp", "required": True},
+    {"type": "date"},
+    {"type": "string", "minLength": 1, "maxLength": 100},
+]
+
+
+def generate_fields(fields: int, nested_depth: int = 0) -> dict:
+    generated = {}
+    for i in range(fields):
+        template = FIELD_TEMPLATES[i % len(FIELD_TEMPLATES)]
+        generated[f"field_{i}"] = {"description": f"Field {i}", **template}
+    if nested_depth > 0:
+        generated["nested"] = {
+            "type": "object",
+            "fields": generate_fields(max(1, fields // 4), nested_depth - 1),
+        }
+    return generated
+
+
+def generate_data_contract(
+    models: int = 1, fields: int = 20, nested_depth: int = 0, server: dict | None = None
+) -> dict:
+    """Generate a data contract with `models` models of `fields` fields each, optionally with nested objects."""
+    data_contract = {
+        "dataContractSpecification": "1.1.0",
+        "id": f"benchmark-{models}-{fields}-{nested_depth}",
+        "info": {"title": "Benchmark", "version": "1.0.0", "owner": "benchmarks"},
+        "models": {
+            f"model_{m}": {
+                "description": f"Model {m}",
+                "type": "table",
+                "fields": generate_fields(fields, nested_depth),
+            }
+            for m in range(models)
+        },
+    }
+    if server is not None:
+        data_contract["servers"] = {"production": server}
+    return data_contract
+
+
+def to_yaml(data_contract: dict) -> str:
+    return yaml.dump(data_contract, sort_keys=False)
+
+
+def generate_value(field: dict, row: int, rng: random.Random):
+    field_type = field["type"]
+    if field_type == "string":
+        if "enum" in field:
+            return rng.choice(field["enum"])
+        if "pattern" in field:
+            return f"ID-{row}"
+        return "".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(1, 20)))
+    if field_type == "long":
+        return rng.randint(0, 1000000)
+    if field_type == "double":
+        return round(rng.uniform(0, 10000), 2)
+    if field_type == "boolean":
+        return rng.random() < 0.5
+    if field_type == "timestamp":
+        return (datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=rng.randint(0, 10**7))).isoformat()
+    if field_type == "date":
+        return (date(2024, 1, 1) + timedelta(days=rng.randint(0, 365))).isoformat()
+    return None
+
+
+def generate_rows(fields: dict, rows: int, seed: int = 42):
+    """Yield `rows` rows that are valid for the (flat) fields, deterministically for a seed."""
+    rng = random.Random(seed)
+    for row in range(rows):
+        yield {name: generate_value(field, row, rng) for name, field in fields.items() if field["type"] != "object"}
+
+
+def write_data(directory: Path, model_name: str, fields: dict, rows: int, format: str) -> Path:
+    """Write `rows` rows of the model as a json (newline delimited), csv, or parquet file and return its path."""
+    directory.mkdir(parents=True, exist_ok=True)
+    json_path = directory / f"{model_name}.json"
+    with open(json_path, "w") as file:
+        for row in generate_rows(fields, rows):
+            file.write(json.dumps(row) + "\n")
+    if format == "json":
+        return json_path
+    path = directory / f"{model_name}.{format}"
+    copy_options = "(FORMAT PARQUET)" if format == "parquet" else "(FORMAT CSV, HEADER)"
+    columns = {name: DUCKDB_TYPES[field["type"]] for name, field in fields.items() if field["type"] in DUCKDB_TYPES}
+    con = duckdb.connect()
+    con.execute(
+        f"COPY (SELECT * FROM read_json('{json_path}', format='newline_delimited', columns={columns})) "
+        f"TO '{path}' {copy_options}"
+    )
+    con.close()
+    return path
+
+
+def generate_local_data_contract(directory: Path, rows: int, format: str, fields: int = 8) -> str:
+    """Generate a data contract for a single model with a local server, and its data, and return the contract yaml."""
+    model_fields = generate_fields(fields)
+    path = write_data(directory, "model_0", model_fields, rows, format)
+    server = {"type": "local", "path": str(path), "format": format}
+    if format == "json":
+        server["delimiter"] = "new_line"
+    data_contract = generate_data_contract(models=1, fields=fields, server=server)
+    return to_yaml(data_contract)
@@ -1,14 +1,26 @@
 import logging
 import os
+import time
 from typing import Annotated, Optional
 
 import typer
-from fastapi import Body, Depends, FastAPI, HTTPException, Query, status
+from fastapi import Body, Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.responses import PlainTextResponse
 from fastapi.security.api_key import APIKeyHeader
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Gauge, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily
 
 from datacontract.data_contract import DataContract, ExportFormat
+from datacontract.engines.soda.connections.duckdb_connection import (
+    enable_duckdb_connection_pool,
+    get_duckdb_connection_pool,
+)
+from datacontract.engines.soda.connections.warehouse_session_pool import (
+    enable_warehouse_session_pool,
+    get_warehouse_session_pool,
+)
 from datacontract.model.run import Run
+from datacontract.yaml_io import enable_yaml_parse_cache
 
 DATA_CONTRACT_EXAMPLE_PAYLOAD = """dataContractSpecification: 1.1.0
 id: urn:datacontract:checkout:orders-latest
@@ -90,6 +102,66 @@ app = FastAPI(
     ],
 )
 
+# keep duckdb connections with loaded extensions, registered secrets and created views alive across requests
+enable_duckdb_connection_pool(
+    max_size=int(os.getenv("DATACONTRACT_DUCKDB_POOL_SIZE", 8)),
+    max_idle_seconds=float(os.getenv("DATACONTRACT_DUCKDB_POOL_MAX_IDLE_SECONDS", 600)),
+)
+
+# keep authenticated sessions to snowflake, postgres, mysql, sqlserver, trino and others alive across requests
+enable_warehouse_session_pool(
+    max_size=int(os.getenv("DATACONTRACT_WAREHOUSE_POOL_SIZE", 8)),
+    max_idle_seconds=float(os.getenv("DATACONTRACT_WAREHOUSE_POOL_MAX_IDLE_SECONDS", 600)),
+)
+
+# parse the data contracts that are tested or exported repeatedly only once
+enable_yaml_parse_cache(max_size=int(os.getenv("DATACONTRACT_YAML_CACHE_SIZE", 128)))
+
+REQUEST_DURATION = Histogram(
+    "datacontract_api_request_duration_seconds",
+    "Duration of API requests in seconds.",
+    ["method", "path", "status"],
+)
+TESTS_IN_PROGRESS = Gauge("datacontract_api_tests_in_progress", "Number of data contract tests in progress.")
+
+
+class ConnectionPoolCollector:
+    """Exposes the leases of the connection pools that were served by a pooled connection (hits) or not (misses)."""
+
+    def collect(self):
+        hits = CounterMetricFamily(
+            "datacontract_connection_pool_hits", "Leases served by a pooled connection.", labels=["pool"]
+        )
+        misses = CounterMetricFamily(
+            "datacontract_connection_pool_misses", "Leases that required a new connection.", labels=["pool"]
+        )
+        for name, pool in [("duckdb", get_duckdb_connection_pool()), ("warehouse", get_warehouse_session_pool())]:
+            if pool is not None:
+                hits.add_metric([name], pool.hits)
+                misses.add_metric([name], pool.misses)
+        yield hits
+        yield misses
+
+
+REGISTRY.register(ConnectionPoolCollector())
+
+
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    # the route template instead of the requested path, to keep the number of label values bounded
+    route = request.scope.get("route")
+    path = route.path if route is not None else "unknown"
+    REQUEST_DURATION.labels(request.method, path, str(response.status_code)).observe(time.perf_counter() - start)
+    return response
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics() -> Response:
+    return Response(content=generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
+
+
 api_key_header = APIKeyHeader(
     name="x-api-key",
     auto_error=False,  # this makes authentication optional
@@ -170,7 +242,8 @@ async def test(
     check_api_key(api_key)
     logging.info("Testing data contract...")
     logging.info(body)
-    return DataContract(data_contract_str=body, server=server).test()
+    with TESTS_IN_PROGRESS.track_inprogress():
+        return DataContract(data_contract_str=body, server=server, read_only=True).test()
 
 
 @app.post(
@@ -243,7 +316,7 @@ def export(
         ),
     ] = None,
 ):
-    result = DataContract(data_contract_str=body, server=server).export(
+    result = DataContract(data_contract_str=body, server=server, read_only=True).export(
         export_format=format,
         model=model,
         rdf_base=rdf_base,
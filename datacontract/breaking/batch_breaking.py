@@ -0,0 +1,215 @@
+import fnmatch
+import hashlib
+import logging
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from datacontract.breaking.breaking import _get_rule, data_contract_breaking_changes
+from datacontract.breaking.breaking_change import BreakingChange, BreakingChanges, Location, Severity
+from datacontract.lint import resolve
+from datacontract.model.data_contract_specification import DataContractSpecification
+from datacontract.model.exceptions import DataContractException
+
+
+@dataclass
+class ContractFile:
+    """A data contract file of a directory or a git revision."""
+
+    path: str
+    content: str
+    digest: str
+
+
+def read_directory_contract_files(directory: str | Path, pattern: str = "*.yaml") -> list[ContractFile]:
+    """Read the data contract files of a directory, whose relative path matches the pattern, e.g., `*.yaml`.
+
+    In the pattern, `*` also matches `/`, so that `*.yaml` matches all yaml files of all subdirectories.
+    """
+    directory = Path(directory)
+    contract_files = []
+    for path in sorted(directory.rglob("*")):
+        relative_path = path.relative_to(directory).as_posix()
+        if not path.is_file() or not fnmatch.fnmatchcase(relative_path, pattern):
+            continue
+        content = path.read_text(encoding="utf-8")
+        if _is_data_contract(content):
+            contract_files.append(
+                ContractFile(relative_path, content, hashlib.sha1(content.encode("utf-8")).hexdigest())
+            )
+    return contract_files
+
+
+def read_git_contract_files(revision: str, repository: str | Path = ".", pattern: str = "*.yaml") -> list[ContractFile]:
+    """
+    Read the data contract files of a git revision, whose path matches the pattern, e.g., `*.yaml`.
+
+    The files are read with git plumbing commands from the local repository, without a checkout or a remote:
+    one `git ls-tree` for the paths and one `git cat-file --batch` for the contents of all files.
+    """
+    tree = _git(repository, ["ls-tree", "-r", "-z", "--full-tree", revision])
+    blobs = []
+    for entry in tree.split(b"\0"):
+        if not entry:
+            continue
+        metadata, path = entry.split(b"\t", 1)
+        _, object_type, object_id = metadata.split(b" ")
+        path = path.decode("utf-8")
+        if object_type == b"blob" and fnmatch.fnmatchcase(path, pattern):
+            blobs.append((path, object_id.decode("ascii")))
+    if not blobs:
+        return []
+
+    output = _git(repository, ["cat-file", "--batch"], input="".join(f"{object_id}\n" for _, object_id in blobs))
+    contract_files = []
+    offset = 0
+    for path, object_id in blobs:
+        header_end = output.index(b"\n", offset)
+        size = int(output[offset:header_end].split(b" ")[2])
+        content = output[header_end + 1 : header_end + 1 + size].decode("utf-8")
+        offset = header_end + 1 + size + 1
+        if _is_data_contract(content):
+            contract_files.append(ContractFile(path, content, object_id))
+    return contract_files
+
+
+def batch_breaking_changes(
+    old_files: list[ContractFile],
+    new_files: list[ContractFile],
+    include_severities: [Severity] = (Severity.ERROR, Severity.WARNING),
+    max_workers: int = 4,
+) -> BreakingChanges:
+    """
+    Identify the changes between two sets of data contract files, paired by the id of the data contracts.
+
+    Files that are unchanged at the same path are skipped. Every other file is resolved once, and all pairs are
+    diffed concurrently. Data contracts that were added, removed, or cannot be resolved are reported as changes
+    of the whole contract.
+    """
+    old_digests = {contract_file.path: contract_file.digest for contract_file in old_files}
+    unchanged_paths = {
+        contract_file.path for contract_file in new_files if old_digests.get(contract_file.path) == contract_file.digest
+    }
+    old_files = [contract_file for contract_file in old_files if contract_file.path not in unchanged_paths]
+    new_files = [contract_file for contract_file in new_files if contract_file.path not in unchanged_paths]
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="datacontract-breaking") as executor:
+        # resolve each distinct content once, even if it occurs at several paths or in both sets
+        contents = {contract_file.digest: contract_file.content for contract_file in old_files + new_files}
+        resolved = dict(zip(contents, executor.map(_resolve, contents.values())))
+
+        results = list[BreakingChange]()
+        old_contracts = _by_id(old_files, resolved)
+        new_contracts = _by_id(new_files, resolved)
+        for contract_file in new_files:
+            error = resolved[contract_file.digest]
+            if isinstance(error, DataContractException):
+                results.extend(
+                    _contract_change(
+                        "contract_invalid",
+                        f"cannot resolve the data contract: {error.reason}",
+                        contract_file.path,
+                        include_severities,
+                    )
+                )
+
+        pairs = []
+        for contract_id, (new_file, new) in new_contracts.items():
+            if contract_id not in old_contracts:
+                results.extend(
+                    _contract_change(
+                        "contract_added", f"added the data contract `{contract_id}`", new_file.path, include_severities
+                    )
+                )
+                continue
+            _, old = old_contracts[contract_id]
+            pairs.append((old, new, new_file.path))
+        for contract_id, (old_file, _) in old_contracts.items():
+            if contract_id not in new_contracts:
+                results.extend(
+                    _contract_change(
+                        "contract_removed",
+                        f"removed the data contract `{contract_id}`",
+                        old_file.path,
+                        include_severities,
+                    )
+                )
+
+        for breaking_changes in executor.map(
+            lambda pair: data_contract_breaking_changes(pair[0], pair[1], pair[2], include_severities), pairs
+        ):
+            results.extend(breaking_changes)
+
+    return BreakingChanges(breaking_changes=results)
+
+
+def _resolve(content: str) -> DataContractSpecification | DataContractException:
+    try:
+        return resolve.resolve_data_contract(data_contract_str=content, inline_definitions=True)
+    except DataContractException as e:
+        return e
+    except Exception as e:
+        return DataContractException(
+            type="lint",
+            name="Check that data contract YAML is valid",
+            reason=str(e),
+            engine="datacontract",
+            original_exception=e,
+        )
+
+
+def _by_id(
+    contract_files: list[ContractFile], resolved: dict[str, DataContractSpecification | DataContractException]
+) -> dict[str, tuple[ContractFile, DataContractSpecification]]:
+    contracts = {}
+    for contract_file in contract_files:
+        data_contract = resolved[contract_file.digest]
+        if isinstance(data_contract, DataContractException):
+            continue
+        if data_contract.id in contracts:
+            logging.warning(
+                f"Data contract {data_contract.id} is defined in {contracts[data_contract.id][0].path} "
+                f"and {contract_file.path}, using {contract_file.path}"
+            )
+        contracts[data_contract.id] = (contract_file, data_contract)
+    return contracts
+
+
+def _contract_change(
+    rule_name: str, description: str, path: str, include_severities: [Severity]
+) -> list[BreakingChange]:
+    severity = _get_rule(rule_name)
+    if severity not in include_severities:
+        return []
+    return [
+        BreakingChange(
+            description=description,
+            check_name=rule_name,
+            severity=severity,
+            location=Location(path=path, composition=["id"]),
+        )
+    ]
+
+
+def _is_data_contract(content: str) -> bool:
+    # cheap check to skip other yaml files, such as dbt or CI configuration, before parsing
+    return "dataContractSpecification" in content or "kind: DataContract" in content
+
+
+def _git(repository: str | Path, args: list[str], input: str = None) -> bytes:
+    try:
+        return subprocess.run(
+            ["git", "-C", str(repository), *args],
+            input=input.encode("utf-8") if input is not None else None,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError as e:
+        raise DataContractException(
+            type="breaking",
+            name="Read data contracts from git",
+            reason=f"git {' '.join(args[:2])} failed: {e.stderr.decode('utf-8', errors='replace').strip()}",
+            engine="datacontract",
+            original_exception=e,
+        )
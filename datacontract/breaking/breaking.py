@@ -1,6 +1,65 @@
 from datacontract.breaking.breaking_change import BreakingChange, Location, Severity
 from datacontract.breaking.breaking_rules import BreakingRules
-from datacontract.model.data_contract_specification import Contact, DeprecatedQuality, Field, Info, Model, Terms
+from datacontract.breaking.content_hash import ContentHashes
+from datacontract.breaking.field_matching import match_renamed_fields
+from datacontract.model.data_contract_specification import (
+    Contact,
+    DataContractSpecification,
+    DeprecatedQuality,
+    Field,
+    Info,
+    Model,
+    Terms,
+)
+
+
+def data_contract_breaking_changes(
+    old: DataContractSpecification,
+    new: DataContractSpecification,
+    new_path: str,
+    include_severities: [Severity],
+    content_hashes: ContentHashes = None,
+) -> list[BreakingChange]:
+    results = list[BreakingChange]()
+
+    results.extend(
+        info_breaking_changes(
+            old_info=old.info,
+            new_info=new.info,
+            new_path=new_path,
+            include_severities=include_severities,
+        )
+    )
+
+    results.extend(
+        terms_breaking_changes(
+            old_terms=old.terms,
+            new_terms=new.terms,
+            new_path=new_path,
+            include_severities=include_severities,
+        )
+    )
+
+    results.extend(
+        quality_breaking_changes(
+            old_quality=old.quality,
+            new_quality=new.quality,
+            new_path=new_path,
+            include_severities=include_severities,
+        )
+    )
+
+    results.extend(
+        models_breaking_changes(
+            old_models=old.models,
+            new_models=new.models,
+            new_path=new_path,
+            include_severities=include_severities,
+            content_hashes=content_hashes,
+        )
+    )
+
+    return results
 
 
 def info_breaking_changes(
@@ -290,9 +349,12 @@ def models_breaking_changes(
     new_models: dict[str, Model],
     new_path: str,
     include_severities: [Severity],
+    content_hashes: ContentHashes = None,
 ) -> list[BreakingChange]:
     composition = ["models"]
     results = list[BreakingChange]()
+    if content_hashes is None:
+        content_hashes = ContentHashes()
 
     for model_name, new_model in new_models.items():
         if model_name not in old_models.keys():
@@ -323,13 +385,18 @@ def models_breaking_changes(
                 )
             continue
 
+        new_model = new_models[model_name]
+        if content_hashes.same_model(old_model, new_model):
+            continue
+
         results.extend(
             model_breaking_changes(
                 old_model=old_model,
-                new_model=new_models[model_name],
+                new_model=new_model,
                 new_path=new_path,
                 composition=composition + [model_name],
                 include_severities=include_severities,
+                content_hashes=content_hashes,
             )
         )
 
@@ -337,7 +404,12 @@ def models_breaking_changes(
 
 
 def model_breaking_changes(
-    old_model: Model, new_model: Model, new_path: str, composition: list[str], include_severities: [Severity]
+    old_model: Model,
+    new_model: Model,
+    new_path: str,
+    composition: list[str],
+    include_severities: [Severity],
+    content_hashes: ContentHashes = None,
 ) -> list[BreakingChange]:
     results = list[BreakingChange]()
 
@@ -384,6 +456,7 @@ def model_breaking_changes(
             new_path=new_path,
             composition=composition + ["fields"],
             include_severities=include_severities,
+            content_hashes=content_hashes,
         )
     )
 
@@ -396,11 +469,21 @@ def fields_breaking_changes(
     new_path: str,
     composition: list[str],
     include_severities: [Severity],
+    content_hashes: ContentHashes = None,
 ) -> list[BreakingChange]:
     results = list[BreakingChange]()
+    if content_hashes is None:
+        content_hashes = ContentHashes()
+
+    renamed_fields = match_renamed_fields(
+        removed_fields={name: field for name, field in old_fields.items() if name not in new_fields},
+        added_fields={name: field for name, field in new_fields.items() if name not in old_fields},
+        content_hashes=content_hashes,
+    )
+    renamed_field_names = set(renamed_fields.values())
 
     for field_name, new_field in new_fields.items():
-        if field_name not in old_fields.keys():
+        if field_name not in old_fields.keys() and field_name not in renamed_field_names:
             rule_name = "field_added"
             severity = _get_rule(rule_name)
             if severity in include_severities:
@@ -414,27 +497,47 @@ def fields_breaking_changes(
                 )
 
     for field_name, old_field in old_fields.items():
+        new_field_name = field_name
         if field_name not in new_fields.keys():
-            rule_name = "field_removed"
+            new_field_name = renamed_fields.get(field_name)
+            if new_field_name is None:
+                rule_name = "field_removed"
+                severity = _get_rule(rule_name)
+                if severity in include_severities:
+                    results.append(
+                        BreakingChange(
+                            description="removed the field",
+                            check_name=rule_name,
+                            severity=severity,
+                            location=Location(path=new_path, composition=composition + [field_name]),
+                        )
+                    )
+                continue
+
+            rule_name = "field_renamed"
             severity = _get_rule(rule_name)
             if severity in include_severities:
                 results.append(
                     BreakingChange(
-                        description="removed the field",
+                        description=f"renamed the field from `{field_name}`",
                         check_name=rule_name,
                         severity=severity,
-                        location=Location(path=new_path, composition=composition + [field_name]),
+                        location=Location(path=new_path, composition=composition + [new_field_name]),
                     )
                 )
+
+        new_field = new_fields[new_field_name]
+        if content_hashes.same_field(old_field, new_field):
             continue
 
         results.extend(
             field_breaking_changes(
                 old_field=old_field,
-                new_field=new_fields[field_name],
-                composition=composition + [field_name],
+                new_field=new_field,
+                composition=composition + [new_field_name],
                 new_path=new_path,
                 include_severities=include_severities,
+                content_hashes=content_hashes,
             )
         )
     return results
@@ -446,8 +549,11 @@ def field_breaking_changes(
     composition: list[str],
     new_path: str,
     include_severities: [Severity],
+    content_hashes: ContentHashes = None,
 ) -> list[BreakingChange]:
     results = list[BreakingChange]()
+    if content_hashes is None:
+        content_hashes = ContentHashes()
 
     field_definition_fields = vars(new_field) | new_field.model_extra | old_field.model_extra
     for field_definition_field in field_definition_fields.keys():
@@ -465,11 +571,14 @@ def field_breaking_changes(
                     new_path=new_path,
                     composition=composition + [field_definition_field],
                     include_severities=include_severities,
+                    content_hashes=content_hashes,
                 )
             )
             continue
 
         if field_definition_field == "items" and old_field.type == "array" and new_field.type == "array":
+            if old_value is not None and new_value is not None and content_hashes.same_field(old_value, new_value):
+                continue
             results.extend(
                 field_breaking_changes(
                     old_field=old_value,
@@ -477,6 +586,7 @@ def field_breaking_changes(
                     composition=composition + ["items"],
                     new_path=new_path,
                     include_severities=include_severities,
+                    content_hashes=content_hashes,
                 )
             )
             continue
@@ -528,17 +638,23 @@ def field_breaking_changes(
     return results
 
 
+# the severity of each rule, extended with the resolved rule names of extension properties on first use
+_rule_severities: dict[str, Severity] = {
+    name: value for name, value in vars(BreakingRules).items() if isinstance(value, Severity)
+}
+
+
 def _get_rule(rule_name) -> Severity:
-    try:
-        return getattr(BreakingRules, rule_name)
-    except AttributeError:
-        try:
-            first, *_, last = rule_name.split("_")
-            short_rule = "__".join([first, last])
-            return getattr(BreakingRules, short_rule)
-        except AttributeError:
-            print(f"WARNING: Breaking Rule not found for {rule_name}!")
-            return Severity.ERROR
+    severity = _rule_severities.get(rule_name)
+    if severity is not None:
+        return severity
+    first, *_, last = rule_name.split("_")
+    severity = _rule_severities.get("__".join([first, last]))
+    if severity is None:
+        print(f"WARNING: Breaking Rule not found for {rule_name}!")
+        return Severity.ERROR
+    _rule_severities[rule_name] = severity
+    return severity
 
 
 def _camel_to_snake(s):
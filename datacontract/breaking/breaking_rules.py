@@ -2,6 +2,11 @@ from datacontract.breaking.breaking_change import Severity
 
 
 class BreakingRules:
+    # data contract rules, for batches of data contracts
+    contract_added = Severity.INFO
+    contract_removed = Severity.ERROR
+    contract_invalid = Severity.ERROR
+
     # model rules
     model_added = Severity.INFO
     model_removed = Severity.ERROR
@@ -19,6 +24,7 @@ class BreakingRules:
     # field rules
     field_added = Severity.INFO
     field_removed = Severity.ERROR
+    field_renamed = Severity.ERROR
 
     field_ref_added = Severity.WARNING
     field_ref_removed = Severity.WARNING
@@ -0,0 +1,43 @@
+import hashlib
+
+from datacontract.model.data_contract_specification import Field, Model
+
+
+class ContentHashes:
+    """
+    Content hashes of models and (nested) fields, to skip identical subtrees when comparing data contracts.
+
+    The hash of a node covers all of its properties, including extension properties, nested fields and items.
+    It is computed from the JSON serialization of the node's own properties, which is done natively by Pydantic,
+    and the memoized hashes of its nested fields and items, so that hashing a tree is linear in its size and
+    comparing two nodes is O(1) after their first comparison. Subtrees that differ only in the order of their
+    properties have different hashes, and are compared property by property.
+    """
+
+    def __init__(self):
+        # keyed by id, holding a reference to the node so that the id is not reused while the hashes are alive
+        self._hashes: dict[int, tuple[Model | Field, bytes]] = {}
+
+    def node_hash(self, node: Model | Field) -> bytes:
+        cached = self._hashes.get(id(node))
+        if cached is not None:
+            return cached[1]
+        digest = hashlib.blake2b(
+            node.model_dump_json(exclude_none=True, by_alias=True, exclude={"fields", "items"}).encode(), digest_size=16
+        )
+        for field_name, field in (node.fields or {}).items():
+            digest.update(b"\x00fields\x00" + field_name.encode() + b"\x00")
+            digest.update(self.node_hash(field))
+        items = getattr(node, "items", None)
+        if items is not None:
+            digest.update(b"\x00items\x00")
+            digest.update(self.node_hash(items))
+        node_hash = digest.digest()
+        self._hashes[id(node)] = (node, node_hash)
+        return node_hash
+
+    def same_model(self, old_model: Model, new_model: Model) -> bool:
+        return self.node_hash(old_model) == self.node_hash(new_model)
+
+    def same_field(self, old_field: Field, new_field: Field) -> bool:
+        return self.node_hash(old_field) == self.node_hash(new_field)
@@ -0,0 +1,96 @@
+import json
+
+from datacontract.breaking.content_hash import ContentHashes
+from datacontract.model.data_contract_specification import Field
+
+# the properties that make up the structure of a field, other than its name and documentation
+SIGNATURE_PROPERTIES = {
+    "type",
+    "format",
+    "required",
+    "primaryKey",
+    "unique",
+    "references",
+    "pattern",
+    "minLength",
+    "maxLength",
+    "minimum",
+    "exclusiveMinimum",
+    "maximum",
+    "exclusiveMaximum",
+    "enum",
+    "precision",
+    "scale",
+    "keys",
+    "values",
+}
+# properties that most fields share, so that a signature of only these does not identify a renamed field
+COMMON_SIGNATURE_PROPERTIES = {"type", "required"}
+
+
+def match_renamed_fields(
+    removed_fields: dict[str, Field],
+    added_fields: dict[str, Field],
+    content_hashes: ContentHashes,
+) -> dict[str, str]:
+    """
+    Match fields that were removed from a level of a data contract to fields that were added to it, as renames.
+
+    A removed and an added field are matched if they are identical, refer to the same definition, or have the same
+    structural signature, in that order. A signature of only a type, and whether the field is required, is too
+    common to pair two otherwise different fields, so such fields are only matched if they are identical. A match is only made if it is unambiguous, i.e., exactly one removed and
+    one added field of the level share the content, reference, or signature. Each pass builds an index of the
+    removed fields, so that matching is linear in the number of fields.
+    Returns the new field name for each renamed field name.
+    """
+    renamed = dict[str, str]()
+    if not removed_fields or not added_fields:
+        return renamed
+
+    for to_key in (content_hashes.node_hash, _to_ref, _to_signature):
+        removed_by_key = _index(removed_fields, renamed.keys(), to_key)
+        added_by_key = _index(added_fields, renamed.values(), to_key)
+        for key, added_names in added_by_key.items():
+            removed_names = removed_by_key.get(key)
+            if removed_names is not None and len(removed_names) == 1 and len(added_names) == 1:
+                renamed[removed_names[0]] = added_names[0]
+    return renamed
+
+
+def _index(fields: dict[str, Field], matched_names, to_key) -> dict[object, list[str]]:
+    index = dict[object, list[str]]()
+    for field_name, field in fields.items():
+        if field_name in matched_names:
+            continue
+        key = to_key(field)
+        if key is not None:
+            index.setdefault(key, []).append(field_name)
+    return index
+
+
+def _to_ref(field: Field) -> str | None:
+    return field.ref
+
+
+def _to_signature(field: Field) -> str | None:
+    if field.type is None:
+        return None
+    signature = _signature(field)
+    if signature.keys() <= COMMON_SIGNATURE_PROPERTIES:
+        return None
+    return json.dumps(signature, sort_keys=True)
+
+
+def _signature(field: Field) -> dict | None:
+    if field.type is None:
+        return None
+    signature = field.model_dump(mode="json", include=SIGNATURE_PROPERTIES, exclude_none=True)
+    if signature.get("enum") == []:
+        del signature["enum"]
+    if "enum" in signature:
+        signature["enum"] = sorted(signature["enum"], key=str)
+    if field.fields:
+        signature["fields"] = {name: _signature(nested_field) for name, nested_field in field.fields.items()}
+    if field.items is not None:
+        signature["items"] = _signature(field.items)
+    return signature
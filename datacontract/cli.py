@@ -2,6 +2,7 @@ import os
 from importlib import metadata
 from pathlib import Path
 from typing import Iterable, List, Optional
+from urllib.parse import urlparse
 
 import typer
 from click import Context
@@ -9,16 +10,26 @@ from rich.console import Console
 from typer.core import TyperGroup
 from typing_extensions import Annotated
 
+from datacontract.breaking.batch_breaking import (
+    batch_breaking_changes,
+    read_directory_contract_files,
+    read_git_contract_files,
+)
+from datacontract.breaking.breaking_change import Severity
 from datacontract.catalog.catalog import create_data_contract_html, create_index_html
 from datacontract.data_contract import DataContract, ExportFormat
+from datacontract.engines.incremental import IncrementalTest
 from datacontract.imports.importer import ImportFormat
 from datacontract.init.init_template import get_init_template
 from datacontract.integration.datamesh_manager import (
     publish_data_contract_to_datamesh_manager,
 )
 from datacontract.lint.resolve import resolve_data_contract_dict
+from datacontract.lint.resources import read_resource
+from datacontract.model.exceptions import DataContractException
 from datacontract.output.output_format import OutputFormat
 from datacontract.output.test_results_writer import write_test_result
+from datacontract.snapshot import SNAPSHOT_SUFFIX, is_snapshot_current
 
 console = Console()
 
@@ -107,6 +118,58 @@ def lint(
     write_test_result(run, console, output_format, output)
 
 
+@app.command(name="compile")
+def compile_(
+    locations: Annotated[
+        List[str],
+        typer.Argument(help="The locations (url or path) of the data contract yamls."),
+    ] = None,
+    output: Annotated[
+        Path,
+        typer.Option(help="The directory to write the snapshots to. Defaults to the directory of each data contract."),
+    ] = None,
+    schema: Annotated[
+        str,
+        typer.Option(help="The location (url or path) of the Data Contract Specification JSON Schema"),
+    ] = None,
+    force: Annotated[
+        bool,
+        typer.Option(help="Compile the data contracts, even if their snapshots are up to date."),
+    ] = False,
+):
+    """
+    Compile data contracts into binary snapshots that load without resolving them again.
+
+    A snapshot (.dcsnap) can be used as the location of a data contract in all other commands.
+    """
+    failed = False
+    for location in locations or ["datacontract.yaml"]:
+        snapshot_location = _snapshot_location(location, output)
+        try:
+            if not force and is_snapshot_current(snapshot_location, read_resource(location)):
+                console.print(f"✅ {snapshot_location} is up to date")
+                continue
+            DataContract(data_contract_file=location, schema_location=schema).compile(snapshot_location)
+            console.print(f"📦 compiled {location} to {snapshot_location}")
+        except DataContractException as e:
+            console.print(f"🔴 {location}: {e.reason}")
+            failed = True
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _snapshot_location(location: str, output: Path | None) -> Path:
+    if location.startswith("http://") or location.startswith("https://"):
+        # snapshots of remote data contracts are written to the working directory
+        path = Path(urlparse(location).path)
+        directory = output if output is not None else Path(".")
+    else:
+        path = Path(location)
+        directory = output if output is not None else path.parent
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / (path.stem + SNAPSHOT_SUFFIX)
+
+
 @app.command()
 def test(
     location: Annotated[
@@ -139,19 +202,69 @@ def test(
         bool,
         typer.Option(help="SSL verification when publishing the data contract."),
     ] = True,
+    partition_filter: Annotated[
+        Optional[str],
+        typer.Option(
+            help="SQL condition on hive partition columns to test only matching partitions of file-based servers, "
+            "e.g., \"dt >= '2025-01-01'\"."
+        ),
+    ] = None,
+    incremental_column: Annotated[
+        Optional[str],
+        typer.Option(
+            help="Hive partition column to test incrementally: only partitions since the last successful run are "
+            "tested."
+        ),
+    ] = None,
+    incremental_state: Annotated[
+        str,
+        typer.Option(help="The file where the watermarks of incremental tests are stored."),
+    ] = ".datacontract/incremental-state.json",
+    max_parallel_servers: Annotated[
+        int,
+        typer.Option(help="The maximum number of servers that are tested concurrently with `--server all`."),
+    ] = 4,
+    server_timeout: Annotated[
+        Optional[float],
+        typer.Option(help="The maximum time in seconds for testing a single server with `--server all`."),
+    ] = None,
+    max_parallel_models: Annotated[
+        int,
+        typer.Option(
+            help="The maximum number of models whose quality checks are executed concurrently, "
+            "each with its own database session."
+        ),
+    ] = 1,
+    engine: Annotated[
+        str,
+        typer.Option(
+            help="The engine that executes the checks: `soda` (soda-core) or `duckdb`, which executes the checks "
+            "natively with DuckDB on local, s3, gcs, and azure servers."
+        ),
+    ] = "soda",
 ):
     """
     Run schema and quality tests on configured servers.
     """
     console.print(f"Testing {location}")
-    if server == "all":
-        server = None
+    incremental = None
+    if partition_filter is not None or incremental_column is not None:
+        incremental = IncrementalTest(
+            partition_filter=partition_filter,
+            watermark_column=incremental_column,
+            state_file=incremental_state,
+        )
     run = DataContract(
         data_contract_file=location,
         schema_location=schema,
         publish_url=publish,
         server=server,
         ssl_verification=ssl_verification,
+        incremental=incremental,
+        max_parallel_servers=max_parallel_servers,
+        server_timeout=server_timeout,
+        max_parallel_models=max_parallel_models,
+        engine=engine,
     ).test()
     if logs:
         _print_logs(run)
@@ -267,6 +380,10 @@ def import_(
     unity_table_full_name: Annotated[
         Optional[str], typer.Option(help="Full name of a table in the unity catalog")
     ] = None,
+    unity_schema_full_name: Annotated[
+        Optional[str],
+        typer.Option(help="Full name of a schema in the unity catalog, to import all tables of the schema"),
+    ] = None,
     dbt_model: Annotated[
         Optional[List[str]],
         typer.Option(
@@ -289,6 +406,22 @@ def import_(
         Optional[str],
         typer.Option(help="Table name to assign to the model created from the Iceberg schema."),
     ] = None,
+    csv_sample_size: Annotated[
+        Optional[int],
+        typer.Option(
+            help="Number of rows to infer the column types of a CSV file from, read from its head and random chunks (leave empty for all rows)."
+        ),
+    ] = None,
+    csv_type_inference: Annotated[
+        Optional[str],
+        typer.Option(help="How to infer the column types of a CSV file: pandas or duckdb."),
+    ] = "pandas",
+    csv_profile: Annotated[
+        bool,
+        typer.Option(
+            help="Compute the minimum, maximum, null rate and distinct count of the columns of a CSV file in one pass, to seed the field constraints."
+        ),
+    ] = False,
     template: Annotated[
         Optional[str],
         typer.Option(help="The location (url or path) of the Data Contract Specification Template"),
@@ -312,10 +445,14 @@ def import_(
         bigquery_project=bigquery_project,
         bigquery_dataset=bigquery_dataset,
         unity_table_full_name=unity_table_full_name,
+        unity_schema_full_name=unity_schema_full_name,
         dbt_model=dbt_model,
         dbml_schema=dbml_schema,
         dbml_table=dbml_table,
         iceberg_table=iceberg_table,
+        csv_sample_size=csv_sample_size,
+        csv_type_inference=csv_type_inference,
+        csv_profile=csv_profile,
     )
     if output is None:
         console.print(result.to_yaml(), markup=False, soft_wrap=True)
@@ -429,6 +566,61 @@ def changelog(
     console.print(result.changelog_str())
 
 
+@app.command(name="breaking-batch")
+def breaking_batch(
+    old: Annotated[
+        str,
+        typer.Argument(help="The directory of the old data contracts, or the old git revision with --git."),
+    ],
+    new: Annotated[
+        str,
+        typer.Argument(help="The directory of the new data contracts, or the new git revision with --git."),
+    ],
+    git: Annotated[
+        bool,
+        typer.Option(help="Read the data contracts from git revisions, e.g., `origin/main` and `HEAD`."),
+    ] = False,
+    repository: Annotated[
+        Path,
+        typer.Option(help="The git repository to read the revisions from."),
+    ] = Path("."),
+    pattern: Annotated[
+        str,
+        typer.Option(
+            help="The glob pattern of the paths of the data contract files, e.g., `contracts/*.yaml`. "
+            "`*` also matches subdirectories."
+        ),
+    ] = "*.yaml",
+    changelog: Annotated[
+        bool,
+        typer.Option(help="Print all changes, including info changes, instead of only the breaking changes."),
+    ] = False,
+    max_parallel: Annotated[
+        int,
+        typer.Option(help="The maximum number of data contracts that are resolved and compared concurrently."),
+    ] = 4,
+):
+    """
+    Identifies breaking changes between all data contracts of two directories or git revisions. Prints to stdout.
+    """
+    if git:
+        old_files = read_git_contract_files(old, repository, pattern)
+        new_files = read_git_contract_files(new, repository, pattern)
+    else:
+        old_files = read_directory_contract_files(old, pattern)
+        new_files = read_directory_contract_files(new, pattern)
+
+    include_severities = [Severity.ERROR, Severity.WARNING]
+    if changelog:
+        include_severities.append(Severity.INFO)
+    result = batch_breaking_changes(old_files, new_files, include_severities, max_workers=max_parallel)
+
+    console.print(result.changelog_str() if changelog else result.breaking_str())
+
+    if not result.passed_checks():
+        raise typer.Exit(code=1)
+
+
 @app.command()
 def diff(
     location_old: Annotated[
@@ -481,6 +673,88 @@ def api(
     uvicorn.run(app="datacontract.api:app", port=port, host=host, reload=True, log_config=LOGGING_CONFIG)
 
 
+@app.command(name="serve-scheduler")
+def serve_scheduler(
+    directory: Annotated[
+        Path,
+        typer.Argument(help="The directory with the data contract yaml files."),
+    ] = Path("."),
+    pattern: Annotated[
+        str,
+        typer.Option(help="The glob pattern of the data contract files in the directory."),
+    ] = "**/*.yaml",
+    interval: Annotated[
+        float,
+        typer.Option(
+            help="The interval in seconds between the tests of a data contract. "
+            "A period in servicelevels.frequency.interval of the data contract, e.g., `1h`, takes precedence."
+        ),
+    ] = 3600,
+    max_parallel_tests: Annotated[
+        int,
+        typer.Option(help="The maximum number of data contracts that are tested concurrently."),
+    ] = 4,
+    server: Annotated[
+        str,
+        typer.Option(
+            help="The server configuration to run the schema and quality tests. "
+            "Use the key of the server object in the data contract yaml file "
+            "to refer to a server, e.g., `production`, or `all` for all "
+            "servers (default)."
+        ),
+    ] = "all",
+    publish: Annotated[str, typer.Option(help="The url to publish the results after each test")] = None,
+    output: Annotated[
+        Path,
+        typer.Option(help="The directory where the test results of each data contract should be written to."),
+    ] = None,
+    output_format: Annotated[OutputFormat, typer.Option(help="The target format for the test results.")] = None,
+    ssl_verification: Annotated[
+        bool,
+        typer.Option(help="SSL verification when publishing the data contract."),
+    ] = True,
+    engine: Annotated[
+        str,
+        typer.Option(help="The engine that executes the checks: `soda` (soda-core) or `duckdb`."),
+    ] = "soda",
+    once: Annotated[
+        bool,
+        typer.Option(help="Test all data contracts once and exit."),
+    ] = False,
+):
+    """
+    Test all data contracts of a directory on an interval in a long-running process.
+
+    Data contracts are resolved once and reloaded when their file changes.
+    Connections to the servers are kept alive across tests.
+    """
+    from datacontract.scheduler.contract_scheduler import ContractScheduler
+
+    scheduler = ContractScheduler(
+        directory=directory,
+        interval_seconds=interval,
+        max_parallel_tests=max_parallel_tests,
+        pattern=pattern,
+        server=server,
+        publish_url=publish,
+        ssl_verification=ssl_verification,
+        output_format=output_format,
+        output_directory=output,
+        engine=engine,
+        console=console,
+    )
+    if once:
+        runs = scheduler.run_once()
+        scheduler.shutdown()
+        if any(run.result not in ["passed", "warning"] for run in runs):
+            raise typer.Exit(code=1)
+        return
+    try:
+        scheduler.run_forever()
+    except KeyboardInterrupt:
+        scheduler.stop()
+
+
 def _print_logs(run):
     console.print("\nLogs:")
     for log in run.logs:
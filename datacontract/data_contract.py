@@ -1,19 +1,15 @@
-import logging
 import typing
+from pathlib import Path
 
 if typing.TYPE_CHECKING:
     from pyspark.sql import SparkSession
 
 from duckdb.duckdb import DuckDBPyConnection
 
-from datacontract.breaking.breaking import (
-    info_breaking_changes,
-    models_breaking_changes,
-    quality_breaking_changes,
-    terms_breaking_changes,
-)
-from datacontract.breaking.breaking_change import BreakingChange, BreakingChanges, Severity
-from datacontract.engines.data_contract_test import execute_data_contract_test
+from datacontract.breaking.breaking import data_contract_breaking_changes
+from datacontract.breaking.breaking_change import BreakingChanges, Severity
+from datacontract.engines.data_contract_test import add_exception_check, execute_data_contract_test
+from datacontract.engines.incremental import IncrementalTest
 from datacontract.export.exporter import ExportFormat
 from datacontract.export.exporter_factory import exporter_factory
 from datacontract.imports.importer_factory import importer_factory
@@ -26,9 +22,12 @@ from datacontract.lint.linters.field_reference_linter import FieldReferenceLinte
 from datacontract.lint.linters.notice_period_linter import NoticePeriodLinter
 from datacontract.lint.linters.quality_schema_linter import QualityUsesSchemaLinter
 from datacontract.lint.linters.valid_constraints_linter import ValidFieldConstraintsLinter
+from datacontract.lint.resources import read_resource
 from datacontract.model.data_contract_specification import DataContractSpecification
 from datacontract.model.exceptions import DataContractException
 from datacontract.model.run import Check, ResultEnum, Run
+from datacontract.snapshot import write_snapshot
+from datacontract.telemetry import trace_span, traced
 
 
 class DataContract:
@@ -45,6 +44,12 @@ class DataContract:
         inline_definitions: bool = True,
         inline_quality: bool = True,
         ssl_verification: bool = True,
+        incremental: IncrementalTest = None,
+        max_parallel_servers: int = 4,
+        server_timeout: float = None,
+        max_parallel_models: int = 1,
+        engine: str = "soda",
+        read_only: bool = False,
     ):
         self._data_contract_file = data_contract_file
         self._data_contract_str = data_contract_str
@@ -57,6 +62,12 @@ class DataContract:
         self._inline_definitions = inline_definitions
         self._inline_quality = inline_quality
         self._ssl_verification = ssl_verification
+        self._incremental = incremental
+        self._max_parallel_servers = max_parallel_servers
+        self._server_timeout = server_timeout
+        self._max_parallel_models = max_parallel_models
+        self._engine = engine
+        self._read_only = read_only
         self.all_linters = {
             QualityUsesSchemaLinter(),
             FieldPatternLinter(),
@@ -71,6 +82,7 @@ class DataContract:
         template_str = get_init_template(template)
         return resolve.resolve_data_contract(data_contract_str=template_str, schema_location=schema)
 
+    @traced("datacontract.lint")
     def lint(self, enabled_linters: typing.Union[str, set[str]] = "all") -> Run:
         """Lint the data contract by deserializing the contract and checking the schema, as well as calling the configured linters.
 
@@ -86,8 +98,9 @@ class DataContract:
                 self._schema_location,
                 inline_definitions=self._inline_definitions,
                 inline_quality=self._inline_quality,
+                strict=True,
             )
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="lint",
                     result=ResultEnum.passed,
@@ -105,9 +118,9 @@ class DataContract:
                 raise RuntimeError(f"Unknown argument enabled_linters={enabled_linters} for lint()")
             for linter in linters_to_check:
                 try:
-                    run.checks.extend(linter.lint(data_contract))
+                    run.add_checks(linter.lint(data_contract))
                 except Exception as e:
-                    run.checks.append(
+                    run.add_check(
                         Check(
                             type="general",
                             result=ResultEnum.error,
@@ -119,12 +132,12 @@ class DataContract:
             run.dataContractId = data_contract.id
             run.dataContractVersion = data_contract.info.version
         except DataContractException as e:
-            run.checks.append(
+            run.add_check(
                 Check(type=e.type, result=e.result, name=e.name, reason=e.reason, engine=e.engine, details="")
             )
             run.log_error(str(e))
         except Exception as e:
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="general",
                     result=ResultEnum.error,
@@ -137,49 +150,43 @@ class DataContract:
         run.finish()
         return run
 
+    @traced("datacontract.test")
     def test(self) -> Run:
         run = Run.create_run()
         try:
             run.log_info("Testing data contract")
-            data_contract = resolve.resolve_data_contract(
-                self._data_contract_file,
-                self._data_contract_str,
-                self._data_contract,
-                self._schema_location,
-                inline_definitions=self._inline_definitions,
-                inline_quality=self._inline_quality,
-            )
-
-            execute_data_contract_test(data_contract, run, self._server, self._spark, self._duckdb_connection)
-
-        except DataContractException as e:
-            run.checks.append(
-                Check(
-                    type=e.type,
-                    name=e.name,
-                    result=e.result,
-                    reason=e.reason,
-                    model=e.model,
-                    engine=e.engine,
-                    details="",
+            with run.timed("resolve"):
+                data_contract = resolve.resolve_data_contract(
+                    self._data_contract_file,
+                    self._data_contract_str,
+                    self._data_contract,
+                    self._schema_location,
+                    inline_definitions=self._inline_definitions,
+                    inline_quality=self._inline_quality,
+                    read_only=self._read_only,
                 )
+
+            execute_data_contract_test(
+                data_contract,
+                run,
+                self._server,
+                self._spark,
+                self._duckdb_connection,
+                self._incremental,
+                self._max_parallel_servers,
+                self._server_timeout,
+                self._max_parallel_models,
+                self._engine,
             )
-            run.log_error(str(e))
+
         except Exception as e:
-            run.checks.append(
-                Check(
-                    type="general",
-                    result=ResultEnum.error,
-                    name="Test Data Contract",
-                    reason=str(e),
-                    engine="datacontract",
-                )
-            )
-            logging.exception("Exception occurred")
-            run.log_error(str(e))
+            add_exception_check(run, e)
 
         run.finish()
 
+        if self._incremental is not None:
+            self._incremental.commit(run)
+
         if self._publish_url is not None:
             publish_test_results_to_datamesh_manager(run, self._publish_url, self._ssl_verification)
 
@@ -194,46 +201,12 @@ class DataContract:
         old = self.get_data_contract_specification()
         new = other.get_data_contract_specification()
 
-        breaking_changes = list[BreakingChange]()
-
-        breaking_changes.extend(
-            info_breaking_changes(
-                old_info=old.info,
-                new_info=new.info,
-                new_path=other._data_contract_file,
-                include_severities=include_severities,
-            )
-        )
-
-        breaking_changes.extend(
-            terms_breaking_changes(
-                old_terms=old.terms,
-                new_terms=new.terms,
-                new_path=other._data_contract_file,
-                include_severities=include_severities,
+        return BreakingChanges(
+            breaking_changes=data_contract_breaking_changes(
+                old=old, new=new, new_path=other._data_contract_file, include_severities=include_severities
             )
         )
 
-        breaking_changes.extend(
-            quality_breaking_changes(
-                old_quality=old.quality,
-                new_quality=new.quality,
-                new_path=other._data_contract_file,
-                include_severities=include_severities,
-            )
-        )
-
-        breaking_changes.extend(
-            models_breaking_changes(
-                old_models=old.models,
-                new_models=new.models,
-                new_path=other._data_contract_file,
-                include_severities=include_severities,
-            )
-        )
-
-        return BreakingChanges(breaking_changes=breaking_changes)
-
     def get_data_contract_specification(self) -> DataContractSpecification:
         return resolve.resolve_data_contract(
             data_contract_location=self._data_contract_file,
@@ -242,7 +215,26 @@ class DataContract:
             schema_location=self._schema_location,
             inline_definitions=self._inline_definitions,
             inline_quality=self._inline_quality,
+            read_only=self._read_only,
+        )
+
+    def compile(self, snapshot_location: str | Path) -> DataContractSpecification:
+        """Resolve and validate the data contract, and write it as a snapshot that is loaded without resolving it again."""
+        if self._data_contract_str is not None:
+            source = self._data_contract_str
+        elif self._data_contract_file is not None:
+            source = read_resource(self._data_contract_file)
+        else:
+            source = self.get_data_contract_specification().to_yaml()
+        data_contract = resolve.resolve_data_contract(
+            data_contract_str=source,
+            schema_location=self._schema_location,
+            inline_definitions=self._inline_definitions,
+            inline_quality=self._inline_quality,
+            strict=True,
         )
+        write_snapshot(snapshot_location, data_contract, source, self._data_contract_file)
+        return data_contract
 
     def export(self, export_format: ExportFormat, model: str = "all", sql_server_type: str = "auto", **kwargs) -> str:
         data_contract = resolve.resolve_data_contract(
@@ -252,15 +244,17 @@ class DataContract:
             schema_location=self._schema_location,
             inline_definitions=self._inline_definitions,
             inline_quality=self._inline_quality,
+            read_only=self._read_only,
         )
 
-        return exporter_factory.create(export_format).export(
-            data_contract=data_contract,
-            model=model,
-            server=self._server,
-            sql_server_type=sql_server_type,
-            export_args=kwargs,
-        )
+        with trace_span("datacontract.export", export_format=str(export_format), model=model):
+            return exporter_factory.create(export_format).export(
+                data_contract=data_contract,
+                model=model,
+                server=self._server,
+                sql_server_type=sql_server_type,
+                export_args=kwargs,
+            )
 
     def import_from_source(
         self,
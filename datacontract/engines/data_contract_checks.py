@@ -2,8 +2,7 @@ import uuid
 from typing import List
 from venv import logger
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.export.sql_type_converter import convert_to_sql_type
 from datacontract.model.data_contract_specification import DataContractSpecification, Quality, Server
 from datacontract.model.run import Check
@@ -126,7 +125,7 @@ def check_field_is_present(model_name, field_name, quote_field_name: bool) -> Ch
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -157,7 +156,7 @@ def check_field_type(model_name: str, field_name: str, expected_type: str, quote
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -188,7 +187,7 @@ def check_field_required(model_name: str, field_name: str, quote_field_name: boo
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -219,7 +218,7 @@ def check_field_unique(model_name: str, field_name: str, quote_field_name: bool
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -251,7 +250,7 @@ def check_field_min_length(model_name: str, field_name: str, min_length: int, qu
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -283,7 +282,7 @@ def check_field_max_length(model_name: str, field_name: str, max_length: int, qu
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -315,7 +314,7 @@ def check_field_minimum(model_name: str, field_name: str, minimum: int, quote_fi
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -347,7 +346,7 @@ def check_field_maximum(model_name: str, field_name: str, maximum: int, quote_fi
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -379,7 +378,7 @@ def check_field_not_equal(model_name: str, field_name: str, value: int, quote_fi
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -411,7 +410,7 @@ def check_field_enum(model_name: str, field_name: str, enum: list, quote_field_n
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -443,7 +442,7 @@ def check_field_regex(model_name: str, field_name: str, pattern: str, quote_fiel
         field=field_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -488,7 +487,7 @@ def check_quality_list(model_name, field_name, quality_list: List[Quality]) -> L
                     field=field_name,
                     engine="soda",
                     language="sodacl",
-                    implementation=yaml.dump(sodacl_check_dict),
+                    implementation=yaml_io.dump(sodacl_check_dict),
                 )
             )
         count += 1
@@ -614,7 +613,7 @@ def to_servicelevel_freshness_check(data_contract_spec: DataContractSpecificatio
         model=model_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -667,7 +666,7 @@ def to_servicelevel_retention_check(data_contract_spec) -> Check | None:
         model=model_name,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(sodacl_check_dict),
+        implementation=yaml_io.dump(sodacl_check_dict),
     )
 
 
@@ -721,7 +720,7 @@ def to_quality_check(data_contract_spec) -> Check | None:
     if data_contract_spec.quality.type.lower() != "sodacl":
         return None
     if isinstance(data_contract_spec.quality.specification, str):
-        quality_specification = yaml.safe_load(data_contract_spec.quality.specification)
+        quality_specification = yaml_io.safe_load(data_contract_spec.quality.specification)
     else:
         quality_specification = data_contract_spec.quality.specification
 
@@ -734,5 +733,5 @@ def to_quality_check(data_contract_spec) -> Check | None:
         model=None,
         engine="soda",
         language="sodacl",
-        implementation=yaml.dump(quality_specification),
+        implementation=yaml_io.dump(quality_specification),
     )
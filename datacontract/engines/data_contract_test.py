@@ -1,8 +1,14 @@
+import logging
+import threading
+import time
 import typing
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 
 from duckdb.duckdb import DuckDBPyConnection
 
 from datacontract.engines.data_contract_checks import create_checks
+from datacontract.engines.duckdb.check_duckdb_execute import check_duckdb_execute, supports_duckdb_engine
+from datacontract.engines.incremental import IncrementalTest
 
 if typing.TYPE_CHECKING:
     from pyspark.sql import SparkSession
@@ -12,9 +18,15 @@ from datacontract.engines.datacontract.check_that_datacontract_contains_valid_se
 )
 from datacontract.engines.fastjsonschema.check_jsonschema import check_jsonschema
 from datacontract.engines.soda.check_soda_execute import check_soda_execute
+from datacontract.export.sodacl_converter import to_sodacl_dict
 from datacontract.model.data_contract_specification import DataContractSpecification, Server
 from datacontract.model.exceptions import DataContractException
-from datacontract.model.run import ResultEnum, Run
+from datacontract.model.run import Check, Log, ResultEnum, Run
+from datacontract.telemetry import trace_span
+
+ALL_SERVERS = "all"
+ENGINE_SODA = "soda"
+ENGINE_DUCKDB = "duckdb"
 
 
 def execute_data_contract_test(
@@ -23,7 +35,20 @@ def execute_data_contract_test(
     server_name: str = None,
     spark: "SparkSession" = None,
     duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+    max_parallel_servers: int = 4,
+    server_timeout: float = None,
+    max_parallel_models: int = 1,
+    engine: str = ENGINE_SODA,
 ):
+    if engine not in [ENGINE_SODA, ENGINE_DUCKDB]:
+        raise DataContractException(
+            type="general",
+            name="Check that engine is supported",
+            result=ResultEnum.error,
+            reason=f"Engine {engine} is not supported, use {ENGINE_SODA} or {ENGINE_DUCKDB}",
+            engine="datacontract",
+        )
     if data_contract_specification.models is None or len(data_contract_specification.models) == 0:
         raise DataContractException(
             type="lint",
@@ -32,6 +57,22 @@ def execute_data_contract_test(
             reason="Models block is missing. Skip executing tests.",
             engine="datacontract",
         )
+    if server_name == ALL_SERVERS:
+        servers = data_contract_specification.servers or {}
+        if len(servers) > 1:
+            execute_data_contract_test_on_all_servers(
+                data_contract_specification,
+                run,
+                spark,
+                duckdb_connection,
+                incremental,
+                max_parallel_servers,
+                server_timeout,
+                max_parallel_models,
+                engine,
+            )
+            return
+        server_name = None
     if (
         server_name is None
         and data_contract_specification.servers is not None
@@ -39,6 +80,31 @@ def execute_data_contract_test(
     ):
         server_name = list(data_contract_specification.servers.keys())[0]
     server = get_server(data_contract_specification, server_name)
+    with trace_span("datacontract.test.server", server=server_name, server_type=server.type):
+        execute_server_test(
+            data_contract_specification,
+            run,
+            server_name,
+            server,
+            spark,
+            duckdb_connection,
+            incremental,
+            max_parallel_models,
+            engine,
+        )
+
+
+def execute_server_test(
+    data_contract_specification: DataContractSpecification,
+    run: Run,
+    server_name: str,
+    server: Server,
+    spark: "SparkSession" = None,
+    duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+    max_parallel_models: int = 1,
+    engine: str = ENGINE_SODA,
+):
     run.log_info(f"Running tests for data contract {data_contract_specification.id} with server {server_name}")
     run.dataContractId = data_contract_specification.id
     run.dataContractVersion = data_contract_specification.info.version
@@ -46,13 +112,196 @@ def execute_data_contract_test(
     run.outputPortId = server.outputPortId
     run.server = server_name
 
-    run.checks.extend(create_checks(data_contract_specification, server))
+    with run.timed("check_generation"):
+        run.add_checks(create_checks(data_contract_specification, server))
 
     # TODO check server is supported type for nicer error messages
     # TODO check server credentials are complete for nicer error messages
     if server.format == "json" and server.type != "kafka":
-        check_jsonschema(run, data_contract_specification, server)
-    check_soda_execute(run, data_contract_specification, server, spark, duckdb_connection)
+        with run.timed("execute"):
+            check_jsonschema(run, data_contract_specification, server)
+    if engine == ENGINE_DUCKDB:
+        if supports_duckdb_engine(server):
+            check_duckdb_execute(
+                run, data_contract_specification, server, duckdb_connection, incremental, max_parallel_models
+            )
+            if len(to_sodacl_dict(run)) == 0:
+                return
+        else:
+            run.log_warn(f"Engine duckdb does not support {server.type} {server.format}, using soda-core instead")
+    check_soda_execute(
+        run, data_contract_specification, server, spark, duckdb_connection, incremental, max_parallel_models
+    )
+
+
+def execute_data_contract_test_on_all_servers(
+    data_contract_specification: DataContractSpecification,
+    run: Run,
+    spark: "SparkSession" = None,
+    duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+    max_parallel_servers: int = 4,
+    server_timeout: float = None,
+    max_parallel_models: int = 1,
+    engine: str = ENGINE_SODA,
+):
+    """Test every server of the data contract concurrently and merge the results into one run.
+
+    Each server is tested in its own run, and its checks are attributed to the server before merging.
+    Servers are tested one after another when a Spark session or DuckDB connection is provided,
+    as these cannot be shared between threads.
+    A server that exceeds `server_timeout` seconds is reported with an error. Its test is not interrupted, but runs
+    in a daemon thread, so that it does not keep the process alive when it exits.
+    """
+    server_names = list(data_contract_specification.servers.keys())
+    run.log_info(f"Running tests for data contract {data_contract_specification.id} with servers {server_names}")
+    run.dataContractId = data_contract_specification.id
+    run.dataContractVersion = data_contract_specification.info.version
+
+    if spark is not None or duckdb_connection is not None:
+        max_parallel_servers = 1
+    # the start times of the servers that are being tested
+    started = {}
+    started_lock = threading.Lock()
+
+    def test_server(server_name: str) -> Run:
+        with started_lock:
+            started[server_name] = time.monotonic()
+        server_run = Run.create_run()
+        try:
+            execute_data_contract_test(
+                data_contract_specification,
+                server_run,
+                server_name,
+                spark,
+                duckdb_connection,
+                incremental,
+                max_parallel_models=max_parallel_models,
+                engine=engine,
+            )
+        except Exception as e:
+            add_exception_check(server_run, e)
+        finally:
+            with started_lock:
+                started.pop(server_name, None)
+        server_run.finish()
+        return server_run
+
+    server_runs = {}
+    slots = threading.BoundedSemaphore(max(1, max_parallel_servers))
+    futures = {_submit_daemon(slots, test_server, server_name): server_name for server_name in server_names}
+    pending = set(futures)
+    while len(pending) > 0:
+        done, pending = wait(
+            pending, timeout=_next_timeout(started, started_lock, server_timeout), return_when=FIRST_COMPLETED
+        )
+        for future in done:
+            server_runs[futures[future]] = future.result()
+        if server_timeout is None:
+            continue
+        now = time.monotonic()
+        for future in list(pending):
+            server_name = futures[future]
+            with started_lock:
+                server_started = started.get(server_name)
+                timed_out = server_started is not None and now - server_started > server_timeout
+                if timed_out:
+                    started.pop(server_name)
+            if timed_out:
+                pending.remove(future)
+                server_runs[server_name] = _timed_out_run(server_name, server_timeout)
+
+    for server_name in server_names:
+        merge_server_run(run, server_runs[server_name], server_name)
+
+
+def _submit_daemon(slots: threading.BoundedSemaphore, function, *args) -> Future:
+    """
+    Run the function in a daemon thread as soon as one of the slots is free.
+
+    Unlike the threads of an executor, daemon threads are not joined when the process exits, which would wait for
+    the tests that timed out.
+    """
+    future = Future()
+
+    def run():
+        with slots:
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    threading.Thread(target=run, name="datacontract-test", daemon=True).start()
+    return future
+
+
+def _next_timeout(started: dict, started_lock: threading.Lock, server_timeout: float | None) -> float | None:
+    """The time until the next server that is being tested times out. Finished and timed out servers are removed."""
+    if server_timeout is None:
+        return None
+    with started_lock:
+        if len(started) == 0:
+            return server_timeout
+        now = time.monotonic()
+        return max(0.0, min(server_timeout - (now - server_started) for server_started in started.values()))
+
+
+def _timed_out_run(server_name: str, server_timeout: float) -> Run:
+    server_run = Run.create_run()
+    server_run.log_error(f"Test of server {server_name} timed out after {server_timeout} seconds")
+    server_run.add_check(
+        Check(
+            type="general",
+            name="Test Data Contract",
+            result=ResultEnum.error,
+            reason=f"Timed out after {server_timeout} seconds",
+            engine="datacontract",
+        )
+    )
+    return server_run
+
+
+def merge_server_run(run: Run, server_run: Run, server_name: str):
+    """Add the checks, logs and metrics of a single server run to the run, attributing them to the server."""
+    for check in server_run.checks:
+        check.server = server_name
+    run.add_checks(server_run.checks)
+    run.merge_metrics(server_run, prefix=server_name)
+    run.logs.extend(
+        Log.model_construct(level=log.level, message=f"[{server_name}] {log.message}", timestamp=log.timestamp)
+        for log in server_run.logs
+    )
+
+
+def add_exception_check(run: Run, e: Exception):
+    """Record an exception that aborted the test as a check of the run."""
+    if isinstance(e, DataContractException):
+        run.add_check(
+            Check(
+                type=e.type,
+                name=e.name,
+                result=e.result,
+                reason=e.reason,
+                model=e.model,
+                engine=e.engine,
+                details="",
+            )
+        )
+        run.log_error(str(e))
+    else:
+        run.add_check(
+            Check(
+                type="general",
+                result=ResultEnum.error,
+                name="Test Data Contract",
+                reason=str(e),
+                engine="datacontract",
+            )
+        )
+        logging.exception("Exception occurred")
+        run.log_error(str(e))
 
 
 def get_server(data_contract_specification: DataContractSpecification, server_name: str = None) -> Server | None:
@@ -9,7 +9,7 @@ def check_that_datacontract_file_exists(run: Run, file_path: str):
     if file_path.startswith("http://") or file_path.startswith("https://"):
         return
     if not os.path.exists(file_path):
-        run.checks.append(
+        run.add_check(
             Check(
                 type="lint",
                 name="Check that data contract file exists",
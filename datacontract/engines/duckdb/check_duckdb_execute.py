@@ -0,0 +1,428 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from typing import Any, Callable
+
+from duckdb.duckdb import DuckDBPyConnection
+
+from datacontract import yaml_io
+from datacontract.engines.incremental import IncrementalTest, to_sql_literal
+from datacontract.engines.soda.connections.duckdb_connection import open_duckdb_connection
+from datacontract.model.data_contract_specification import DataContractSpecification, Server
+from datacontract.model.run import Check, ResultEnum, Run
+from datacontract.telemetry import trace_span, traced
+
+DUCKDB_SERVER_TYPES = ["s3", "gcs", "azure", "local"]
+DUCKDB_SERVER_FORMATS = ["json", "parquet", "csv", "delta"]
+
+DURATION_PATTERN = re.compile(r"(\d+)([dhms])")
+DURATION_SECONDS = {"d": 86400, "h": 3600, "m": 60, "s": 1}
+THRESHOLD_PATTERN = re.compile(r"^(=|!=|>=|<=|>|<)\s*(\S+)$")
+BETWEEN_PATTERN = re.compile(r"^(not )?between (\S+) and (\S+)$")
+RETENTION_FIELD_PATTERN = re.compile(r"MIN\(([^)]+)\)")
+
+
+@dataclass
+class DuckDBCheck:
+    """
+    A check of the run translated to DuckDB SQL.
+
+    Schema checks compare `field` and `expected_type` with the columns of the model. Metric checks compute
+    `expression` as an aggregate over the model, batched with the other metric checks of the same model.
+    Query checks execute `query` on their own. `evaluate` turns the computed value into a result and a reason.
+    """
+
+    check: Check
+    field: str | None = None
+    expected_type: str | None = None
+    expression: str | None = None
+    query: str | None = None
+    evaluate: Callable[[Any], tuple[ResultEnum, str | None]] | None = None
+
+
+def supports_duckdb_engine(server: Server) -> bool:
+    if server is None:
+        return False
+    if server.type == "kafka":
+        return server.format in ["avro", "json"]
+    return server.type in DUCKDB_SERVER_TYPES and server.format in DUCKDB_SERVER_FORMATS
+
+
+@traced("datacontract.engine.duckdb")
+def check_duckdb_execute(
+    run: Run,
+    data_contract: DataContractSpecification,
+    server: Server,
+    duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+    max_parallel_models: int = 1,
+):
+    """Execute the sodacl checks of the run natively on DuckDB, without soda-core.
+
+    Checks are translated from their sodacl implementation into one aggregate query per model plus one query per
+    quality check. Executed checks are marked with engine `duckdb`. Checks that cannot be translated, such as
+    custom sodacl quality specifications, keep engine `soda` and are left for soda-core.
+    """
+    if data_contract is None:
+        run.log_warn("Cannot run engine duckdb, as data contract is invalid")
+        return
+
+    checks_by_model: dict[str, list[DuckDBCheck]] = {}
+    for check in run.checks:
+        if check.result is not None or check.model not in data_contract.models:
+            continue
+        duckdb_check = to_duckdb_check(check)
+        if duckdb_check is not None:
+            checks_by_model.setdefault(check.model, []).append(duckdb_check)
+    if len(checks_by_model) == 0:
+        return
+
+    run.log_info(f"Running engine duckdb on {server.type} {server.format}")
+    with ExitStack() as resources:
+        with run.timed("connect"), trace_span("datacontract.connect", server_type=server.type):
+            con = resources.enter_context(
+                open_duckdb_connection(data_contract, server, run, duckdb_connection, incremental)
+            )
+        with run.timed("execute"):
+            if max_parallel_models > 1 and len(checks_by_model) > 1:
+
+                def execute_model_on_cursor(item):
+                    with con.cursor() as cursor:
+                        execute_model_checks(run, cursor, item[0], item[1])
+
+                with ThreadPoolExecutor(
+                    max_workers=min(max_parallel_models, len(checks_by_model)),
+                    thread_name_prefix="datacontract-duckdb",
+                ) as executor:
+                    list(executor.map(execute_model_on_cursor, checks_by_model.items()))
+            else:
+                for model_name, duckdb_checks in checks_by_model.items():
+                    execute_model_checks(run, con, model_name, duckdb_checks)
+
+    for duckdb_checks in checks_by_model.values():
+        for duckdb_check in duckdb_checks:
+            duckdb_check.check.engine = "duckdb"
+
+
+def execute_model_checks(run: Run, con: DuckDBPyConnection, model_name: str, duckdb_checks: list[DuckDBCheck]):
+    """Execute the checks of a model and record its time and the rows scanned in the run metrics."""
+    start = time.perf_counter()
+    rows_scanned = execute_checks(con, model_name, duckdb_checks)
+    run.add_model_metrics(model_name, time.perf_counter() - start, rows_scanned)
+
+
+def execute_checks(con: DuckDBPyConnection, model_name: str, duckdb_checks: list[DuckDBCheck]) -> int | None:
+    start = time.perf_counter()
+    try:
+        describe = con.execute(f"DESCRIBE {quote_identifier(model_name)}").fetchall()
+    except Exception as e:
+        for duckdb_check in duckdb_checks:
+            set_result(duckdb_check.check, ResultEnum.error, str(e))
+        return None
+    columns = {column_name.lower(): column_type for column_name, column_type, *_ in describe}
+    describe_seconds = time.perf_counter() - start
+
+    metric_checks = []
+    for duckdb_check in duckdb_checks:
+        if duckdb_check.query is not None:
+            execute_query_check(con, duckdb_check)
+        elif duckdb_check.expression is None:
+            execute_schema_check(duckdb_check, columns)
+            add_duration(duckdb_check.check, describe_seconds)
+        elif duckdb_check.field is not None and duckdb_check.field.lower() not in columns:
+            set_result(
+                duckdb_check.check,
+                ResultEnum.unknown,
+                f"Field {duckdb_check.field} is not present in {model_name}",
+            )
+        else:
+            metric_checks.append(duckdb_check)
+    return execute_metric_checks(con, model_name, metric_checks)
+
+
+def execute_schema_check(duckdb_check: DuckDBCheck, columns: dict[str, str]):
+    actual_type = columns.get(duckdb_check.field.lower())
+    if actual_type is None:
+        set_result(duckdb_check.check, ResultEnum.failed, f"Field {duckdb_check.field} is missing")
+        return
+    if duckdb_check.expected_type is None:
+        set_result(duckdb_check.check, ResultEnum.passed)
+        return
+    diagnostics = {"expected_type": duckdb_check.expected_type, "actual_type": actual_type}
+    if normalize_type(actual_type) == normalize_type(duckdb_check.expected_type):
+        set_result(duckdb_check.check, ResultEnum.passed, diagnostics=diagnostics)
+    else:
+        set_result(
+            duckdb_check.check,
+            ResultEnum.failed,
+            f"Type Mismatch, Expected Type: {duckdb_check.expected_type}; Actual Type: {actual_type}",
+            diagnostics,
+        )
+
+
+def execute_metric_checks(con: DuckDBPyConnection, model_name: str, metric_checks: list[DuckDBCheck]) -> int | None:
+    """Compute all metrics of a model in a single scan, or one by one if the batched query fails.
+
+    Returns the number of rows scanned by the batched query. The time of a query is attributed to each of its checks.
+    """
+    if len(metric_checks) == 0:
+        return None
+    sql = to_metrics_sql(model_name, metric_checks, with_row_count=True)
+    start = time.perf_counter()
+    try:
+        row_count, *values = con.execute(sql).fetchone()
+    except Exception:
+        for duckdb_check in metric_checks:
+            single_sql = to_metrics_sql(model_name, [duckdb_check])
+            start = time.perf_counter()
+            try:
+                evaluate(duckdb_check, con.execute(single_sql).fetchone()[0], single_sql)
+            except Exception as e:
+                set_result(duckdb_check.check, ResultEnum.error, str(e), {"query": single_sql})
+            add_duration(duckdb_check.check, time.perf_counter() - start)
+        return None
+    duration_seconds = time.perf_counter() - start
+    for duckdb_check, value in zip(metric_checks, values):
+        evaluate(duckdb_check, value, sql)
+        add_duration(duckdb_check.check, duration_seconds)
+    return row_count
+
+
+def execute_query_check(con: DuckDBPyConnection, duckdb_check: DuckDBCheck):
+    start = time.perf_counter()
+    try:
+        row = con.execute(duckdb_check.query).fetchone()
+    except Exception as e:
+        set_result(duckdb_check.check, ResultEnum.error, str(e), {"query": duckdb_check.query})
+    else:
+        evaluate(duckdb_check, None if row is None else row[0], duckdb_check.query)
+    add_duration(duckdb_check.check, time.perf_counter() - start)
+
+
+def to_metrics_sql(model_name: str, metric_checks: list[DuckDBCheck], with_row_count: bool = False) -> str:
+    expressions = [duckdb_check.expression for duckdb_check in metric_checks]
+    if with_row_count:
+        expressions.insert(0, "COUNT(*)")
+    return f"SELECT {', '.join(expressions)} FROM {quote_identifier(model_name)}"
+
+
+def evaluate(duckdb_check: DuckDBCheck, value, query: str):
+    result, reason = duckdb_check.evaluate(value)
+    set_result(duckdb_check.check, result, reason, {"value": to_diagnostics_value(value), "query": query})
+
+
+def set_result(check: Check, result: ResultEnum, reason: str = None, diagnostics: dict = None):
+    check.result = result
+    check.reason = reason
+    check.diagnostics = diagnostics
+
+
+def add_duration(check: Check, seconds: float):
+    check.diagnostics = {**(check.diagnostics or {}), "durationSeconds": seconds}
+
+
+def to_duckdb_check(check: Check) -> DuckDBCheck | None:
+    """Translate a sodacl check created by `create_checks`, or return None if it is not supported."""
+    if check.engine != "soda" or check.language != "sodacl" or check.implementation is None:
+        return None
+    sodacl_dict = yaml_io.safe_load(check.implementation)
+    if not isinstance(sodacl_dict, dict) or len(sodacl_dict) != 1:
+        return None
+    sodacl_checks = next(iter(sodacl_dict.values()))
+    if not isinstance(sodacl_checks, list) or len(sodacl_checks) != 1 or len(sodacl_checks[0]) != 1:
+        return None
+    ((sodacl_key, sodacl_config),) = sodacl_checks[0].items()
+    sodacl_config = sodacl_config or {}
+    column = quote_identifier(check.field) if check.field is not None else None
+
+    if check.type == "field_is_present":
+        (field,) = sodacl_config["fail"]["when required column missing"]
+        return DuckDBCheck(check=check, field=field)
+    if check.type == "field_type":
+        ((field, expected_type),) = sodacl_config["fail"]["when wrong column type"].items()
+        return DuckDBCheck(check=check, field=field, expected_type=expected_type)
+    if check.type == "field_required":
+        return to_count_check(check, f"{column} IS NULL", "missing values")
+    if check.type == "field_unique":
+        return DuckDBCheck(
+            check=check,
+            field=check.field,
+            expression=f"COUNT({column}) - COUNT(DISTINCT {column})",
+            evaluate=lambda value: evaluate_zero(value, "duplicate values"),
+        )
+    if check.type == "field_min_length":
+        min_length = sodacl_config["valid min length"]
+        return to_invalid_count_check(
+            check, f"length(CAST({column} AS VARCHAR)) < {min_length}", f"values shorter than {min_length}"
+        )
+    if check.type == "field_max_length":
+        max_length = sodacl_config["valid max length"]
+        return to_invalid_count_check(
+            check, f"length(CAST({column} AS VARCHAR)) > {max_length}", f"values longer than {max_length}"
+        )
+    if check.type == "field_minimum":
+        minimum = sodacl_config["valid min"]
+        return to_invalid_count_check(check, f"{column} < {to_sql_literal(minimum)}", f"values less than {minimum}")
+    if check.type == "field_maximum":
+        maximum = sodacl_config["valid max"]
+        return to_invalid_count_check(check, f"{column} > {to_sql_literal(maximum)}", f"values greater than {maximum}")
+    if check.type == "field_not_equal":
+        values = sodacl_config["invalid values"]
+        return to_invalid_count_check(check, f"{column} IN ({to_sql_literals(values)})", f"values equal to {values}")
+    if check.type == "field_enum":
+        values = sodacl_config["valid values"]
+        return to_invalid_count_check(check, f"{column} NOT IN ({to_sql_literals(values)})", f"values not in {values}")
+    if check.type == "field_regex":
+        pattern = sodacl_config["valid regex"]
+        return to_invalid_count_check(
+            check,
+            f"NOT regexp_matches(CAST({column} AS VARCHAR), {to_sql_literal(pattern)})",
+            f"values not matching {pattern}",
+        )
+    if check.type in ["field_quality_sql", "model_quality_sql"]:
+        threshold = sodacl_key.removeprefix(f"{check.key} ")
+        return DuckDBCheck(
+            check=check,
+            query=sodacl_config[f"{check.key} query"],
+            evaluate=lambda value: evaluate_threshold(value, threshold),
+        )
+    if check.type == "servicelevel_freshness":
+        match = re.fullmatch(r"freshness\((.+)\) < (\S+)", sodacl_key)
+        if match is None:
+            return None
+        field, threshold = match.groups()
+        return DuckDBCheck(
+            check=check,
+            field=field,
+            expression=f"MAX({quote_identifier(field)})",
+            evaluate=lambda value: evaluate_freshness(value, duration_to_seconds(threshold)),
+        )
+    if check.type == "servicelevel_retention":
+        expression = next((value for key, value in sodacl_config.items() if key.endswith(" expression")), "")
+        match = RETENTION_FIELD_PATTERN.search(expression)
+        if match is None:
+            return None
+        field = match.group(1)
+        period_in_seconds = int(sodacl_key.split(" < ")[1])
+        return DuckDBCheck(
+            check=check,
+            field=field,
+            expression=f"MIN({quote_identifier(field)})",
+            evaluate=lambda value: evaluate_retention(value, period_in_seconds),
+        )
+    return None
+
+
+def to_count_check(check: Check, condition: str, description: str) -> DuckDBCheck:
+    return DuckDBCheck(
+        check=check,
+        field=check.field,
+        expression=f"COUNT(*) FILTER (WHERE {condition})",
+        evaluate=lambda value: evaluate_zero(value, description),
+    )
+
+
+def to_invalid_count_check(check: Check, invalid_condition: str, description: str) -> DuckDBCheck:
+    """Count the non-missing values that match the invalid condition, like soda-core's invalid_count."""
+    column = quote_identifier(check.field)
+    return DuckDBCheck(
+        check=check,
+        field=check.field,
+        expression=f"COUNT(*) FILTER (WHERE {column} IS NOT NULL AND {invalid_condition})",
+        evaluate=lambda value: evaluate_zero(value, description),
+    )
+
+
+def evaluate_zero(value, description: str) -> tuple[ResultEnum, str | None]:
+    if value == 0:
+        return ResultEnum.passed, None
+    return ResultEnum.failed, f"Found {value} {description}"
+
+
+def evaluate_threshold(value, threshold: str) -> tuple[ResultEnum, str | None]:
+    if value is None:
+        return ResultEnum.failed, f"Query returned no value, expected {threshold}"
+    passed = None
+    match = THRESHOLD_PATTERN.match(threshold)
+    if match is not None:
+        operator, expected = match.group(1), to_number(match.group(2))
+        passed = {
+            "=": value == expected,
+            "!=": value != expected,
+            ">": value > expected,
+            ">=": value >= expected,
+            "<": value < expected,
+            "<=": value <= expected,
+        }[operator]
+    match = BETWEEN_PATTERN.match(threshold)
+    if match is not None:
+        negated, lower, upper = match.group(1), to_number(match.group(2)), to_number(match.group(3))
+        passed = (lower <= value <= upper) != (negated is not None)
+    if passed is None:
+        return ResultEnum.unknown, f"Unsupported threshold {threshold}"
+    if passed:
+        return ResultEnum.passed, None
+    return ResultEnum.failed, f"Value: {value} Expected: {threshold}"
+
+
+def evaluate_freshness(value, threshold_in_seconds: int) -> tuple[ResultEnum, str | None]:
+    if value is None:
+        return ResultEnum.failed, "No values found"
+    age_in_seconds = seconds_since(value)
+    if age_in_seconds < threshold_in_seconds:
+        return ResultEnum.passed, None
+    return (
+        ResultEnum.failed,
+        f"Newest entry is {int(age_in_seconds)} seconds old, expected less than {threshold_in_seconds}",
+    )
+
+
+def evaluate_retention(value, period_in_seconds: int) -> tuple[ResultEnum, str | None]:
+    if value is None:
+        return ResultEnum.unknown, "No values found"
+    age_in_seconds = seconds_since(value)
+    if age_in_seconds < period_in_seconds:
+        return ResultEnum.passed, None
+    return (
+        ResultEnum.failed,
+        f"Oldest entry is {int(age_in_seconds)} seconds old, expected less than {period_in_seconds}",
+    )
+
+
+def to_number(value: str) -> int | float:
+    return float(value) if "." in value else int(value)
+
+
+def seconds_since(value: date | datetime) -> float:
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (datetime.now(timezone.utc) - value).total_seconds()
+
+
+def duration_to_seconds(duration: str) -> int:
+    return sum(int(amount) * DURATION_SECONDS[unit] for amount, unit in DURATION_PATTERN.findall(duration.lower()))
+
+
+def normalize_type(sql_type: str) -> str:
+    return re.sub(r"\s+", " ", sql_type.strip().lower()).replace(", ", ",")
+
+
+def quote_identifier(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def to_sql_literals(values: list) -> str:
+    return ", ".join(to_sql_literal(value) for value in values)
+
+
+def to_diagnostics_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, (bool, int, float, str)) or value is None:
+        return value
+    return str(value)
@@ -12,6 +12,7 @@ from datacontract.export.jsonschema_converter import to_jsonschema
 from datacontract.model.data_contract_specification import DataContractSpecification, Server
 from datacontract.model.exceptions import DataContractException
 from datacontract.model.run import Check, ResultEnum, Run
+from datacontract.telemetry import traced
 
 # Thread-safe cache for primaryKey fields.
 _primary_key_cache = {}
@@ -64,7 +65,7 @@ def process_exceptions(run, exceptions: List[DataContractException]):
 
     # Add all exceptions up to the limit - 1 to `run.checks`.
     DEFAULT_ERROR_MESSAGE = "An error occurred during validation phase. See the logs for more details."
-    run.checks.extend(
+    run.add_checks(
         [
             Check(
                 type=exception.type,
@@ -213,12 +214,13 @@ def process_s3_file(run, server, schema, model_name, validate):
     process_exceptions(run, exceptions)
 
 
+@traced("datacontract.engine.jsonschema")
 def check_jsonschema(run: Run, data_contract: DataContractSpecification, server: Server):
     run.log_info("Running engine jsonschema")
 
     # Early exit conditions
     if server.format != "json":
-        run.checks.append(
+        run.add_check(
             Check(
                 type="schema",
                 name="Check that JSON has valid schema",
@@ -251,7 +253,7 @@ def check_jsonschema(run: Run, data_contract: DataContractSpecification, server:
         elif server.type == "s3":
             process_s3_file(run, server, schema, model_name, validate)
         elif server.type == "gcs":
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="schema",
                     name="Check that JSON has valid schema",
@@ -262,7 +264,7 @@ def check_jsonschema(run: Run, data_contract: DataContractSpecification, server:
                 )
             )
         elif server.type == "azure":
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="schema",
                     name="Check that JSON has valid schema",
@@ -273,7 +275,7 @@ def check_jsonschema(run: Run, data_contract: DataContractSpecification, server:
                 )
             )
         else:
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="schema",
                     name="Check that JSON has valid schema",
@@ -285,7 +287,7 @@ def check_jsonschema(run: Run, data_contract: DataContractSpecification, server:
             )
             return
 
-        run.checks.append(
+        run.add_check(
             Check(
                 type="schema",
                 name="Check that JSON has valid schema",
@@ -0,0 +1,106 @@
+import json
+import logging
+import os
+import re
+from dataclasses import dataclass, field
+
+import duckdb
+
+from datacontract.model.run import ResultEnum, Run
+
+HIVE_PARTITION_PATTERN = re.compile(r"([^/=]+)=([^/]*)")
+
+
+@dataclass
+class IncrementalTest:
+    """
+    Restricts tests on hive-partitioned file servers (local, s3, gcs, azure) to a subset of partitions.
+
+    `partition_filter` is a SQL condition on partition columns, e.g. `dt >= '2025-01-01'`, that is applied to all models.
+    With `watermark_column`, only partitions whose value is greater than or equal to the highest value seen in the
+    last successful run are tested. The highest values are persisted per data contract, server, and model in
+    `state_file` after each run that passed.
+    """
+
+    partition_filter: str | None = None
+    watermark_column: str | None = None
+    state_file: str = ".datacontract/incremental-state.json"
+    _pending_watermarks: dict = field(default_factory=dict, init=False, repr=False)
+
+    def to_condition(self, data_contract_id: str, server_name: str, model_name: str) -> str | None:
+        conditions = []
+        if self.partition_filter:
+            conditions.append(f"({self.partition_filter})")
+        if self.watermark_column:
+            watermark = self.load_watermarks().get(to_watermark_key(data_contract_id, server_name, model_name))
+            if watermark is not None:
+                conditions.append(f'"{self.watermark_column}" >= {to_sql_literal(watermark)}')
+        if len(conditions) == 0:
+            return None
+        return " AND ".join(conditions)
+
+    def collect_watermark(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        data_contract_id: str,
+        server_name: str,
+        model_name: str,
+        model_path: str,
+    ):
+        """Determine the highest partition value of the model by listing its files, without reading them."""
+        if not self.watermark_column:
+            return
+        escaped_model_path = model_path.replace("'", "''")
+        files = con.sql(f"SELECT file FROM glob('{escaped_model_path}')").fetchall()
+        values = [partition_value(file, self.watermark_column) for (file,) in files]
+        values = [value for value in values if value is not None]
+        if len(values) == 0:
+            logging.info(f"No partitions with column {self.watermark_column} found in {model_path}")
+            return
+        key = to_watermark_key(data_contract_id, server_name, model_name)
+        self._pending_watermarks[key] = max(values, key=lambda value: (isinstance(value, str), value))
+
+    def commit(self, run: Run):
+        """Persist the collected watermarks, if the run was successful."""
+        if len(self._pending_watermarks) == 0:
+            return
+        if run.result not in [ResultEnum.passed, ResultEnum.warning]:
+            run.log_info("Test was not successful, incremental watermarks are not updated")
+            return
+        watermarks = self.load_watermarks()
+        watermarks.update(self._pending_watermarks)
+        directory = os.path.dirname(self.state_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(watermarks, f, indent=2, sort_keys=True)
+        run.log_info(f"Updated incremental watermarks in {self.state_file}")
+        self._pending_watermarks = {}
+
+    def load_watermarks(self) -> dict:
+        if not os.path.exists(self.state_file):
+            return {}
+        with open(self.state_file, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+
+def to_watermark_key(data_contract_id: str, server_name: str, model_name: str) -> str:
+    return f"{data_contract_id}/{server_name}/{model_name}"
+
+
+def partition_value(file: str, column: str) -> int | str | None:
+    for name, value in HIVE_PARTITION_PATTERN.findall(file):
+        if name == column:
+            try:
+                return int(value)
+            except ValueError:
+                return value
+    return None
+
+
+def to_sql_literal(value: bool | int | float | str) -> str:
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, (int, float)):
+        return str(value)
+    return "'" + str(value).replace("'", "''") + "'"
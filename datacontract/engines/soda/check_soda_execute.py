@@ -1,53 +1,150 @@
 import logging
+import os
+import threading
 import typing
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Callable
 
 if typing.TYPE_CHECKING:
     from pyspark.sql import SparkSession
+    from soda.scan import Scan
 
 from duckdb.duckdb import DuckDBPyConnection
 
+from datacontract.engines.incremental import IncrementalTest
 from datacontract.engines.soda.connections.bigquery import to_bigquery_soda_configuration
 from datacontract.engines.soda.connections.databricks import to_databricks_soda_configuration
-from datacontract.engines.soda.connections.duckdb_connection import get_duckdb_connection
+from datacontract.engines.soda.connections.duckdb_connection import open_duckdb_connection
 from datacontract.engines.soda.connections.kafka import create_spark_session, read_kafka_topic
-from datacontract.engines.soda.connections.postgres import to_postgres_soda_configuration
 from datacontract.engines.soda.connections.mysql import to_mysql_soda_configuration
+from datacontract.engines.soda.connections.postgres import to_postgres_soda_configuration
 from datacontract.engines.soda.connections.snowflake import to_snowflake_soda_configuration
 from datacontract.engines.soda.connections.sqlserver import to_sqlserver_soda_configuration
 from datacontract.engines.soda.connections.trino import to_trino_soda_configuration
-from datacontract.export.sodacl_converter import to_sodacl_yaml
+from datacontract.engines.soda.connections.warehouse_session_pool import (
+    add_warehouse_session,
+    get_scan_data_source,
+    get_warehouse_session_pool,
+    supports_warehouse_sessions,
+    to_session_key,
+)
+from datacontract.export.sodacl_converter import to_sodacl_yaml, to_sodacl_yaml_blocks
 from datacontract.model.data_contract_specification import DataContractSpecification, Server
 from datacontract.model.run import Check, Log, ResultEnum, Run
+from datacontract.telemetry import trace_span, traced
 
+_soda_usage_stats_disabled = False
+_soda_config_lock = threading.Lock()
 
+
+@traced("datacontract.engine.soda")
 def check_soda_execute(
     run: Run,
     data_contract: DataContractSpecification,
     server: Server,
     spark: "SparkSession" = None,
     duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+    max_parallel_models: int = 1,
 ):
-    from soda.common.config_helper import ConfigHelper
+    """Execute the sodacl checks of the run with soda-core.
 
-    ConfigHelper.get_instance().upsert_value("send_anonymous_usage_stats", False)
-    from soda.scan import Scan
+    With `max_parallel_models` > 1, the checks are split by their `checks for <model>` block, and one scan
+    per block is executed concurrently. Each scan uses its own DuckDB cursor or its own warehouse session.
+    """
+    disable_soda_usage_stats()
 
     if data_contract is None:
         run.log_warn("Cannot run engine soda-core, as data contract is invalid")
         return
 
     run.log_info("Running engine soda-core")
-    scan = Scan()
 
+    # connections leased from a pool are held until all scans are executed
+    with ExitStack() as resources:
+        with run.timed("connect"), trace_span("datacontract.connect", server_type=server.type):
+            add_data_source = configure_data_source(
+                run, data_contract, server, resources, spark, duckdb_connection, incremental
+            )
+        if add_data_source is None:
+            return
+
+        sodacl_blocks = to_sodacl_yaml_blocks(run)
+        with run.timed("execute"):
+            if max_parallel_models > 1 and len(sodacl_blocks) > 1:
+                run.log_info(f"Executing {len(sodacl_blocks)} soda scans with up to {max_parallel_models} in parallel")
+                with ThreadPoolExecutor(
+                    max_workers=min(max_parallel_models, len(sodacl_blocks)), thread_name_prefix="datacontract-soda"
+                ) as executor:
+                    scans = list(
+                        executor.map(
+                            lambda sodacl_yaml_str: execute_scan(add_data_source, sodacl_yaml_str, concurrent=True),
+                            sodacl_blocks,
+                        )
+                    )
+            else:
+                scans = [execute_scan(add_data_source, to_sodacl_yaml(run), concurrent=False)]
+
+    with run.timed("merge"):
+        for scan in scans:
+            merge_scan_results(run, scan)
+            add_scan_metrics(run, scan)
+
+    if any(scan.has_error_logs() for scan in scans):
+        run.log_warn("Engine soda-core has errors. See the logs for details.")
+        run.add_check(
+            Check(
+                type="general",
+                name="Data Contract Tests",
+                result=ResultEnum.warning,
+                reason="Engine soda-core has errors. See the logs for details.",
+                engine="soda-core",
+            )
+        )
+        return
+
+
+def disable_soda_usage_stats():
+    """Disable soda-core usage stats once per process.
+
+    The soda-core config is a singleton that is not thread-safe to create and is persisted to a file on update,
+    so it is configured under a lock when servers or models are tested concurrently.
+    """
+    global _soda_usage_stats_disabled
+    with _soda_config_lock:
+        if _soda_usage_stats_disabled:
+            return
+        from soda.common.config_helper import ConfigHelper
+
+        ConfigHelper.get_instance().upsert_value("send_anonymous_usage_stats", False)
+        _soda_usage_stats_disabled = True
+
+
+def configure_data_source(
+    run: Run,
+    data_contract: DataContractSpecification,
+    server: Server,
+    resources: ExitStack,
+    spark: "SparkSession" = None,
+    duckdb_connection: DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+) -> Callable[["Scan", bool], None] | None:
+    """Connect to the server and return a function that adds the data source to a scan, or None if unsupported.
+
+    The returned function is called with concurrent=True for scans executed in parallel,
+    which then get their own DuckDB cursor instead of sharing the connection.
+    """
     if server.type in ["s3", "gcs", "azure", "local"]:
         if server.format in ["json", "parquet", "csv", "delta"]:
             run.log_info(f"Configuring engine soda-core to connect to {server.type} {server.format} with duckdb")
-            con = get_duckdb_connection(data_contract, server, run, duckdb_connection)
-            scan.add_duckdb_connection(duckdb_connection=con, data_source_name=server.type)
-            scan.set_data_source_name(server.type)
+            con = resources.enter_context(
+                open_duckdb_connection(data_contract, server, run, duckdb_connection, incremental)
+            )
+            return to_duckdb_data_source(con, server.type, resources)
         else:
-            run.checks.append(
+            run.add_check(
                 Check(
                     type="general",
                     name="Check that format is supported",
@@ -57,63 +154,49 @@ def check_soda_execute(
                 )
             )
             run.log_warn(f"Format {server.format} not yet supported by datacontract CLI")
-            return
+            return None
     elif server.type == "snowflake":
-        soda_configuration_str = to_snowflake_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
+        return to_configuration_data_source(server.type, to_snowflake_soda_configuration(server), resources)
     elif server.type == "bigquery":
-        soda_configuration_str = to_bigquery_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
+        return to_configuration_data_source(server.type, to_bigquery_soda_configuration(server), resources)
     elif server.type == "postgres":
-        soda_configuration_str = to_postgres_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
+        return to_configuration_data_source(server.type, to_postgres_soda_configuration(server), resources)
     elif server.type == "mysql":
-        soda_configuration_str = to_mysql_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
+        return to_configuration_data_source(server.type, to_mysql_soda_configuration(server), resources)
     elif server.type == "databricks":
         if spark is not None:
             run.log_info("Connecting to databricks via spark")
-            scan.add_spark_session(spark, data_source_name=server.type)
-            scan.set_data_source_name(server.type)
             database_name = ".".join(filter(None, [server.catalog, server.schema_]))
             spark.sql(f"USE {database_name}")
+            return to_spark_data_source(spark, server.type)
         else:
             run.log_info("Connecting to databricks directly")
-            soda_configuration_str = to_databricks_soda_configuration(server)
-            scan.add_configuration_yaml_str(soda_configuration_str)
-            scan.set_data_source_name(server.type)
+            return to_configuration_data_source(server.type, to_databricks_soda_configuration(server), resources)
     elif server.type == "dataframe":
         if spark is None:
             run.log_warn(
                 "Server type dataframe only works with the Python library and requires a Spark session, "
                 "please provide one with the DataContract class"
             )
-            return
+            return None
         else:
             logging.info("Use Spark to connect to data source")
-            scan.add_spark_session(spark, data_source_name="datacontract-cli")
-            scan.set_data_source_name("datacontract-cli")
+            return to_spark_data_source(spark, "datacontract-cli")
     elif server.type == "kafka":
+        if spark is None and os.getenv("DATACONTRACT_KAFKA_READER", "spark") == "python":
+            run.log_info("Reading from kafka with the Python client into duckdb")
+            con = resources.enter_context(open_duckdb_connection(data_contract, server, run, duckdb_connection))
+            return to_duckdb_data_source(con, server.type, resources)
         if spark is None:
             spark = create_spark_session()
         read_kafka_topic(spark, data_contract, server)
-        scan.add_spark_session(spark, data_source_name=server.type)
-        scan.set_data_source_name(server.type)
+        return to_spark_data_source(spark, server.type)
     elif server.type == "sqlserver":
-        soda_configuration_str = to_sqlserver_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
+        return to_configuration_data_source(server.type, to_sqlserver_soda_configuration(server), resources)
     elif server.type == "trino":
-        soda_configuration_str = to_trino_soda_configuration(server)
-        scan.add_configuration_yaml_str(soda_configuration_str)
-        scan.set_data_source_name(server.type)
-
+        return to_configuration_data_source(server.type, to_trino_soda_configuration(server), resources)
     else:
-        run.checks.append(
+        run.add_check(
             Check(
                 type="general",
                 name="Check that server type is supported",
@@ -123,19 +206,61 @@ def check_soda_execute(
             )
         )
         run.log_warn(f"Server type {server.type} not yet supported by datacontract CLI")
-        return
+        return None
+
+
+def to_duckdb_data_source(con: DuckDBPyConnection, data_source_name: str, resources: ExitStack):
+    def add_duckdb_data_source(scan, concurrent):
+        scan_con = con
+        if concurrent:
+            scan_con = con.cursor()
+            resources.callback(scan_con.close)
+        scan.add_duckdb_connection(duckdb_connection=scan_con, data_source_name=data_source_name)
+        scan.set_data_source_name(data_source_name)
+
+    return add_duckdb_data_source
+
+
+def to_configuration_data_source(data_source_name: str, soda_configuration_str: str, resources: ExitStack):
+    # every scan opens its own session from the configuration, unless a pooled session can be reused
+    def add_configuration_data_source(scan, concurrent):
+        scan.add_configuration_yaml_str(soda_configuration_str)
+        scan.set_data_source_name(data_source_name)
+        pool = get_warehouse_session_pool()
+        if pool is None or not supports_warehouse_sessions(scan):
+            return
+        key = to_session_key(soda_configuration_str)
+        session = pool.acquire(key)
+        if session is not None:
+            add_warehouse_session(scan, session)
+        resources.callback(lambda: pool.release(key, get_scan_data_source(scan, data_source_name)))
+
+    return add_configuration_data_source
+
+
+def to_spark_data_source(spark: "SparkSession", data_source_name: str):
+    def add_spark_data_source(scan, concurrent):
+        scan.add_spark_session(spark, data_source_name=data_source_name)
+        scan.set_data_source_name(data_source_name)
+
+    return add_spark_data_source
 
-    sodacl_yaml_str = to_sodacl_yaml(run)
-    # print("sodacl_yaml_str:\n" + sodacl_yaml_str)
+
+def execute_scan(add_data_source, sodacl_yaml_str: str, concurrent: bool) -> "Scan":
+    from soda.scan import Scan
+
+    scan = Scan()
+    add_data_source(scan, concurrent)
     scan.add_sodacl_yaml_str(sodacl_yaml_str)
 
     # Execute the scan
     logging.info("Starting soda scan with checks:\n" + sodacl_yaml_str)
     scan.execute()
     logging.info("Finished soda scan")
+    return scan
 
-    # pprint.PrettyPrinter(indent=2).pprint(scan.build_scan_results())
 
+def merge_scan_results(run: Run, scan: "Scan"):
     scan_results = scan.get_scan_results()
     for scan_result in scan_results.get("checks"):
         name = scan_result.get("name")
@@ -148,7 +273,7 @@ def check_soda_execute(
                 name=name,
                 engine="soda-core",
             )
-            run.checks.append(check)
+            run.add_check(check)
         check.result = to_result(scan_result)
         check.reason = ", ".join(scan_result.get("outcomeReasons"))
         check.diagnostics = scan_result.get("diagnostics")
@@ -163,26 +288,53 @@ def check_soda_execute(
             )
         )
 
-    if scan.has_error_logs():
-        run.log_warn("Engine soda-core has errors. See the logs for details.")
-        run.checks.append(
-            Check(
-                type="general",
-                name="Data Contract Tests",
-                result=ResultEnum.warning,
-                reason="Engine soda-core has errors. See the logs for details.",
-                engine="soda-core",
-            )
-        )
+
+def add_scan_metrics(run: Run, scan: "Scan"):
+    """Attribute the time of the soda-core queries to the checks and models that used them.
+
+    A query shared by several checks, such as the aggregation query of a model, counts for each of these checks.
+    The queries are internals of soda-core, so the metrics are skipped if they are not available.
+    """
+    try:
+        queries_by_model = {}
+        for query in getattr(scan, "_queries", None) or []:
+            table = getattr(query, "table", None)
+            if table is not None:
+                queries_by_model.setdefault(getattr(table, "table_name", None), {})[id(query)] = query
+        check_durations = []
+        for soda_check in getattr(scan, "_checks", None) or []:
+            check = run.get_check_by_key(getattr(soda_check, "name", None))
+            if check is None:
+                continue
+            queries = {
+                id(query): query
+                for metric in (getattr(soda_check, "metrics", None) or {}).values()
+                for query in getattr(metric, "queries", None) or []
+            }
+            check_durations.append((check, to_duration_seconds(queries.values())))
+            if check.model is not None:
+                queries_by_model.setdefault(check.model, {}).update(queries)
+        durations_by_model = {
+            model_name: to_duration_seconds(queries.values())
+            for model_name, queries in queries_by_model.items()
+            if model_name is not None
+        }
+    except Exception as e:
+        logging.debug(f"Skipping the query metrics of soda-core: {e}")
         return
+    for check, duration_seconds in check_durations:
+        check.diagnostics = {**(check.diagnostics or {}), "durationSeconds": duration_seconds}
+    for model_name, duration_seconds in durations_by_model.items():
+        run.add_model_metrics(model_name, duration_seconds)
 
 
-def get_check(run, scan_result) -> Check | None:
-    check_by_name = next((c for c in run.checks if c.key == scan_result.get("name")), None)
-    if check_by_name is not None:
-        return check_by_name
+def to_duration_seconds(queries) -> float:
+    durations = (getattr(query, "duration", None) for query in queries)
+    return sum(duration.total_seconds() for duration in durations if duration is not None)
 
-    return None
+
+def get_check(run, scan_result) -> Check | None:
+    return run.get_check_by_key(scan_result.get("name"))
 
 
 def to_result(c) -> ResultEnum:
@@ -1,6 +1,6 @@
 import os
 
-import yaml
+from datacontract import yaml_io
 
 
 # https://docs.soda.io/soda/connect-bigquery.html#authentication-methods
@@ -23,5 +23,5 @@ def to_bigquery_soda_configuration(server):
         }
     }
 
-    soda_configuration_str = yaml.dump(soda_configuration)
+    soda_configuration_str = yaml_io.dump(soda_configuration)
     return soda_configuration_str
@@ -1,6 +1,6 @@
 import os
 
-import yaml
+from datacontract import yaml_io
 
 
 def to_databricks_soda_configuration(server):
@@ -25,5 +25,5 @@ def to_databricks_soda_configuration(server):
         }
     }
 
-    soda_configuration_str = yaml.dump(soda_configuration)
+    soda_configuration_str = yaml_io.dump(soda_configuration)
     return soda_configuration_str
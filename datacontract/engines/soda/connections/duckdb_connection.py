@@ -1,72 +1,399 @@
+import glob
+import hashlib
+import logging
 import os
-from typing import Any
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from dataclasses import field as dataclass_field
+from typing import Any, Iterator
 
 import duckdb
 
+from datacontract.engines.incremental import IncrementalTest
+from datacontract.engines.soda.connections.kafka import read_kafka_topic_into_duckdb
 from datacontract.export.csv_type_converter import convert_to_duckdb_csv_type
 from datacontract.model.data_contract_specification import DataContractSpecification, Server
 from datacontract.model.run import Run
 
+# environment variables that affect the connection setup, part of the pool key so that changes get a new connection
+CONNECTION_ENVIRONMENT_VARIABLES = [
+    "DATACONTRACT_S3_REGION",
+    "DATACONTRACT_S3_ACCESS_KEY_ID",
+    "DATACONTRACT_S3_SECRET_ACCESS_KEY",
+    "DATACONTRACT_S3_SESSION_TOKEN",
+    "DATACONTRACT_GCS_KEY_ID",
+    "DATACONTRACT_GCS_SECRET",
+    "DATACONTRACT_AZURE_TENANT_ID",
+    "DATACONTRACT_AZURE_CLIENT_ID",
+    "DATACONTRACT_AZURE_CLIENT_SECRET",
+    "DATACONTRACT_DUCKDB_CACHE_DIRECTORY",
+]
+
+_delta_extension_updated = False
+_delta_extension_lock = threading.Lock()
+
+
+@dataclass
+class DuckDBConnectionState:
+    """A DuckDB connection and the setup that was already applied to it."""
+
+    connection: duckdb.DuckDBPyConnection
+    key: str | None = None
+    secrets_configured: bool = False
+    cache_configured: bool = False
+    views: dict[str, str] = dataclass_field(default_factory=dict)
+    file_bytes: dict[str, int | None] = dataclass_field(default_factory=dict)
+    last_used: float = dataclass_field(default_factory=time.monotonic)
+
 
 def get_duckdb_connection(
     data_contract: DataContractSpecification,
     server: Server,
     run: Run,
     duckdb_connection: duckdb.DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
 ):
     if duckdb_connection is None:
         con = duckdb.connect(database=":memory:")
     else:
         con = duckdb_connection
+    return setup_duckdb_connection(DuckDBConnectionState(connection=con), data_contract, server, run, incremental)
+
+
+def setup_duckdb_connection(
+    state: DuckDBConnectionState,
+    data_contract: DataContractSpecification,
+    server: Server,
+    run: Run,
+    incremental: IncrementalTest = None,
+) -> duckdb.DuckDBPyConnection:
+    """Register secrets and create a view per model. Steps already applied to the connection are skipped."""
+    con = state.connection
+
+    if server.type == "kafka":
+        # messages are consumed anew for each test, so the table is never reused
+        read_kafka_topic_into_duckdb(con, data_contract, server, run)
+        return con
+
+    if not state.cache_configured:
+        setup_file_cache(con, server, run)
+        state.cache_configured = True
 
     path: str = ""
     if server.type == "local":
         path = server.path
     if server.type == "s3":
         path = server.location
-        setup_s3_connection(con, server)
+        if not state.secrets_configured:
+            setup_s3_connection(con, server)
     if server.type == "gcs":
         path = server.location
-        setup_gcs_connection(con, server)
+        if not state.secrets_configured:
+            setup_gcs_connection(con, server)
     if server.type == "azure":
         path = server.location
-        setup_azure_connection(con, server)
+        if not state.secrets_configured:
+            setup_azure_connection(con, server)
+    state.secrets_configured = True
+
+    if server.format == "delta":
+        update_delta_extension(con)
+
     for model_name, model in data_contract.models.items():
         model_path = path
         if "{model}" in model_path:
             model_path = model_path.format(model=model_name)
-        run.log_info(f"Creating table {model_name} for {model_path}")
-
-        if server.format == "json":
-            json_format = "auto"
-            if server.delimiter == "new_line":
-                json_format = "newline_delimited"
-            elif server.delimiter == "array":
-                json_format = "array"
-            con.sql(f"""
-                        CREATE VIEW "{model_name}" AS SELECT * FROM read_json_auto('{model_path}', format='{json_format}', hive_partitioning=1);
-                        """)
-        elif server.format == "parquet":
-            con.sql(f"""
-                        CREATE VIEW "{model_name}" AS SELECT * FROM read_parquet('{model_path}', hive_partitioning=1);
-                        """)
-        elif server.format == "csv":
-            columns = to_csv_types(model)
-            run.log_info("Using columns: " + str(columns))
-            if columns is None:
-                con.sql(
-                    f"""CREATE VIEW "{model_name}" AS SELECT * FROM read_csv('{model_path}', hive_partitioning=1);"""
-                )
-            else:
-                con.sql(
-                    f"""CREATE VIEW "{model_name}" AS SELECT * FROM read_csv('{model_path}', hive_partitioning=1, columns={columns});"""
-                )
-        elif server.format == "delta":
-            con.sql("update extensions;")  # Make sure we have the latest delta extension
-            con.sql(f"""CREATE VIEW "{model_name}" AS SELECT * FROM delta_scan('{model_path}');""")
+
+        condition = None
+        if incremental is not None:
+            incremental.collect_watermark(con, run.dataContractId, run.server, model_name, model_path)
+            condition = incremental.to_condition(run.dataContractId, run.server, model_name)
+            if condition is not None:
+                run.log_info(f"Testing only partitions of {model_name} matching {condition}")
+
+        view_sql = to_view_sql(model_name, model, model_path, server, run, condition)
+        if view_sql is None:
+            continue
+        if state.views.get(model_name) == view_sql:
+            run.log_info(f"Reusing table {model_name} for {model_path}")
+        else:
+            run.log_info(f"Creating table {model_name} for {model_path}")
+            con.sql(view_sql)
+            state.views[model_name] = view_sql
+            state.file_bytes[model_name] = to_file_bytes(server, model_path, condition)
+        run.add_model_metrics(model_name, bytes_read=state.file_bytes.get(model_name))
     return con
 
 
+def to_file_bytes(server: Server, model_path: str, condition: str = None) -> int | None:
+    """
+    Return the total size of the local files a model is read from, or None if unknown.
+
+    Remote files are not listed a second time just for the metric, and with an incremental condition, only some
+    partitions are read, so the size is only known for complete scans of local files other than delta tables.
+    """
+    if server.type != "local" or server.format == "delta" or condition is not None:
+        return None
+    try:
+        return sum(os.path.getsize(file) for file in glob.glob(model_path, recursive=True) if os.path.isfile(file))
+    except OSError as e:
+        logging.info(f"Cannot determine the size of {model_path}: {e}")
+        return None
+
+
+def to_view_sql(model_name: str, model, model_path: str, server: Server, run: Run, condition: str = None) -> str | None:
+    where = "" if condition is None else f" WHERE {condition}"
+    if server.format == "json":
+        json_format = "auto"
+        if server.delimiter == "new_line":
+            json_format = "newline_delimited"
+        elif server.delimiter == "array":
+            json_format = "array"
+        return f"""CREATE OR REPLACE VIEW "{model_name}" AS SELECT * FROM read_json_auto('{model_path}', format='{json_format}', hive_partitioning=1){where};"""
+    elif server.format == "parquet":
+        return f"""CREATE OR REPLACE VIEW "{model_name}" AS SELECT * FROM read_parquet('{model_path}', hive_partitioning=1){where};"""
+    elif server.format == "csv":
+        columns = to_csv_types(model)
+        run.log_info("Using columns: " + str(columns))
+        if columns is None:
+            return f"""CREATE OR REPLACE VIEW "{model_name}" AS SELECT * FROM read_csv('{model_path}', hive_partitioning=1){where};"""
+        else:
+            return f"""CREATE OR REPLACE VIEW "{model_name}" AS SELECT * FROM read_csv('{model_path}', hive_partitioning=1, columns={columns}){where};"""
+    elif server.format == "delta":
+        return f"""CREATE OR REPLACE VIEW "{model_name}" AS SELECT * FROM delta_scan('{model_path}'){where};"""
+    return None
+
+
+def update_delta_extension(con: duckdb.DuckDBPyConnection):
+    """Make sure we have the latest delta extension. Extensions are installed per user, so this is done once per process."""
+    global _delta_extension_updated
+    with _delta_extension_lock:
+        if _delta_extension_updated:
+            return
+        con.sql("update extensions;")
+        _delta_extension_updated = True
+
+
+def setup_file_cache(con: duckdb.DuckDBPyConnection, server: Server, run: Run):
+    """
+    Cache file metadata, object listings and remote reads, if DATACONTRACT_DUCKDB_CACHE_DIRECTORY is set.
+
+    Parquet metadata and HTTP metadata are cached in memory, which pays off when connections are reused.
+    For remote servers, the cache_httpfs extension additionally persists object listings, metadata and
+    range reads in the cache directory, so that repeated tests on the same files are mostly served locally.
+    The cache directory is pruned to DATACONTRACT_DUCKDB_CACHE_MAX_SIZE_MB (default 1024), oldest files first.
+    """
+    cache_directory = os.getenv("DATACONTRACT_DUCKDB_CACHE_DIRECTORY")
+    if cache_directory is None or cache_directory == "":
+        return
+
+    con.sql("SET enable_object_cache = true;")
+    if server.type not in ["s3", "gcs", "azure"]:
+        return
+    con.sql("SET enable_http_metadata_cache = true;")
+
+    max_size_mb = float(os.getenv("DATACONTRACT_DUCKDB_CACHE_MAX_SIZE_MB", 1024))
+    os.makedirs(cache_directory, exist_ok=True)
+    prune_cache_directory(cache_directory, int(max_size_mb * 1024 * 1024))
+
+    try:
+        con.sql("INSTALL cache_httpfs FROM community;")
+        con.sql("LOAD cache_httpfs;")
+    except duckdb.Error as e:
+        run.log_warn(f"Persistent file cache is not available, using in-memory caches only: {e}")
+        return
+
+    escaped_cache_directory = cache_directory.replace("'", "''")
+    settings = {
+        "cache_httpfs_type": "'on_disk'",
+        "cache_httpfs_cache_directory": f"'{escaped_cache_directory}'",
+        "cache_httpfs_enable_metadata_cache": "true",
+        "cache_httpfs_enable_glob_cache": "true",
+    }
+    for name, value in settings.items():
+        try:
+            con.sql(f"SET {name} = {value};")
+        except duckdb.Error as e:
+            run.log_warn(f"Cannot set {name} for the persistent file cache: {e}")
+    run.log_info(f"Using persistent file cache in {cache_directory}")
+
+
+def prune_cache_directory(cache_directory: str, max_bytes: int):
+    """Delete the least recently modified files until the cache directory is at most max_bytes in size."""
+    files = []
+    total_bytes = 0
+    for root, _, file_names in os.walk(cache_directory):
+        for file_name in file_names:
+            file_path = os.path.join(root, file_name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, file_path))
+            total_bytes += stat.st_size
+
+    if total_bytes <= max_bytes:
+        return
+    for _, size, file_path in sorted(files):
+        try:
+            os.remove(file_path)
+        except OSError:
+            continue
+        total_bytes -= size
+        if total_bytes <= max_bytes:
+            break
+
+
+def to_pool_key(server: Server) -> str:
+    credentials = [os.getenv(name) for name in CONNECTION_ENVIRONMENT_VARIABLES]
+    key_str = server.model_dump_json() + str(credentials)
+    return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+
+class DuckDBConnectionPool:
+    """
+    Keeps DuckDB connections alive across test runs, keyed by server configuration and credentials.
+
+    A pooled connection keeps its extensions loaded, its secrets registered and its views created,
+    so subsequent tests against the same server only recreate views whose definition changed.
+    Each connection is leased to one test at a time. Idle connections are evicted after `max_idle_seconds`,
+    and the least recently used idle connection is closed when the pool exceeds `max_size`.
+    """
+
+    def __init__(self, max_size: int = 8, max_idle_seconds: float = 600):
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: list[DuckDBConnectionState] = []
+        self._leased = 0
+        self._lock = threading.Lock()
+        # leases served by a pooled connection, and leases that needed a new connection
+        self.hits = 0
+        self.misses = 0
+
+    @contextmanager
+    def connection(
+        self,
+        data_contract: DataContractSpecification,
+        server: Server,
+        run: Run,
+        incremental: IncrementalTest = None,
+    ) -> Iterator[duckdb.DuckDBPyConnection]:
+        state = self.acquire(to_pool_key(server))
+        healthy = False
+        try:
+            con = setup_duckdb_connection(state, data_contract, server, run, incremental)
+            yield con
+            healthy = True
+        finally:
+            self.release(state, healthy)
+
+    def acquire(self, key: str) -> DuckDBConnectionState:
+        with self._lock:
+            self._evict_idle()
+            for i in range(len(self._idle) - 1, -1, -1):
+                state = self._idle[i]
+                if state.key != key:
+                    continue
+                del self._idle[i]
+                if self._is_healthy(state):
+                    self._leased += 1
+                    self.hits += 1
+                    return state
+                self._close(state)
+            self._leased += 1
+            self.misses += 1
+        return DuckDBConnectionState(connection=duckdb.connect(database=":memory:"), key=key)
+
+    def release(self, state: DuckDBConnectionState, healthy: bool = True):
+        with self._lock:
+            self._leased -= 1
+            if not healthy or not self._is_healthy(state):
+                self._close(state)
+                return
+            state.last_used = time.monotonic()
+            self._idle.append(state)
+            while len(self._idle) > 0 and len(self._idle) + self._leased > self.max_size:
+                self._close(self._idle.pop(0))
+
+    def evict_idle(self):
+        with self._lock:
+            self._evict_idle()
+
+    def close(self):
+        with self._lock:
+            for state in self._idle:
+                self._close(state)
+            self._idle = []
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._idle) + self._leased
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        expired = [state for state in self._idle if now - state.last_used > self.max_idle_seconds]
+        for state in expired:
+            self._idle.remove(state)
+            self._close(state)
+
+    @staticmethod
+    def _is_healthy(state: DuckDBConnectionState) -> bool:
+        try:
+            state.connection.execute("SELECT 1").fetchone()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(state: DuckDBConnectionState):
+        try:
+            state.connection.close()
+        except Exception as e:
+            logging.warning(f"Failed to close pooled duckdb connection: {e}")
+
+
+_duckdb_connection_pool: DuckDBConnectionPool | None = None
+
+
+def enable_duckdb_connection_pool(max_size: int = 8, max_idle_seconds: float = 600) -> DuckDBConnectionPool:
+    """Enable pooling of DuckDB connections for all subsequent tests in this process."""
+    global _duckdb_connection_pool
+    if _duckdb_connection_pool is not None:
+        _duckdb_connection_pool.close()
+    _duckdb_connection_pool = DuckDBConnectionPool(max_size=max_size, max_idle_seconds=max_idle_seconds)
+    return _duckdb_connection_pool
+
+
+def disable_duckdb_connection_pool():
+    global _duckdb_connection_pool
+    if _duckdb_connection_pool is not None:
+        _duckdb_connection_pool.close()
+    _duckdb_connection_pool = None
+
+
+def get_duckdb_connection_pool() -> DuckDBConnectionPool | None:
+    return _duckdb_connection_pool
+
+
+@contextmanager
+def open_duckdb_connection(
+    data_contract: DataContractSpecification,
+    server: Server,
+    run: Run,
+    duckdb_connection: duckdb.DuckDBPyConnection = None,
+    incremental: IncrementalTest = None,
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """Lease a connection from the pool if pooling is enabled and no connection was provided, else create one."""
+    pool = get_duckdb_connection_pool()
+    if duckdb_connection is not None or pool is None:
+        yield get_duckdb_connection(data_contract, server, run, duckdb_connection, incremental)
+        return
+    with pool.connection(data_contract, server, run, incremental) as con:
+        yield con
+
+
 def to_csv_types(model) -> dict[Any, str | None] | None:
     if model is None:
         return None
@@ -145,7 +472,7 @@ def setup_gcs_connection(con, server):
         raise ValueError("Error: Environment variable DATACONTRACT_GCS_SECRET is not set")
 
     con.sql(f"""
-    CREATE SECRET gcs_secret (
+    CREATE OR REPLACE SECRET gcs_secret (
         TYPE GCS,
         KEY_ID '{key_id}',
         SECRET '{secret}'
@@ -171,7 +498,7 @@ def setup_azure_connection(con, server):
 
     if storage_account is not None:
         con.sql(f"""
-        CREATE SECRET azure_spn (
+        CREATE OR REPLACE SECRET azure_spn (
             TYPE AZURE,
             PROVIDER SERVICE_PRINCIPAL,
             TENANT_ID '{tenant_id}',
@@ -182,7 +509,7 @@ def setup_azure_connection(con, server):
         """)
     else:
         con.sql(f"""
-        CREATE SECRET azure_spn (
+        CREATE OR REPLACE SECRET azure_spn (
             TYPE AZURE,
             PROVIDER SERVICE_PRINCIPAL,
             TENANT_ID '{tenant_id}',
@@ -1,12 +1,23 @@
 import atexit
+import io
+import json
 import logging
 import os
 import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator
 
+import duckdb
+
+from datacontract.engines.data_contract_checks import period_to_seconds
+from datacontract.engines.incremental import to_sql_literal
 from datacontract.export.avro_converter import to_avro_schema_json
-from datacontract.model.data_contract_specification import DataContractSpecification, Field, Server
+from datacontract.export.sql_type_converter import convert_to_duckdb
+from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model, Server
 from datacontract.model.exceptions import DataContractException
-from datacontract.model.run import ResultEnum
+from datacontract.model.run import ResultEnum, Run
 
 
 def create_spark_session():
@@ -43,8 +54,158 @@ def create_spark_session():
     return spark
 
 
-def read_kafka_topic(spark, data_contract: DataContractSpecification, server: Server):
+@dataclass
+class KafkaReadOptions:
+    """
+    Bounds the messages that are read from a Kafka topic, so that tests on high-volume topics have a predictable cost.
+
+    `max_messages_per_partition` reads only the last N messages of each partition. `start_timestamp` and
+    `end_timestamp` (epoch milliseconds) or `max_age_seconds` restrict the read to a time window.
+    `starting_offsets` and `ending_offsets` are explicit offset ranges in the JSON format of Spark,
+    e.g. `{"my-topic":{"0":100,"1":-2}}`, and take precedence over the other bounds.
+    `min_partitions` splits the Kafka partitions into at least this many Spark tasks to read in parallel.
+    By default, the whole topic is read.
+    """
+
+    max_messages_per_partition: int | None = None
+    start_timestamp: int | None = None
+    end_timestamp: int | None = None
+    max_age_seconds: int | None = None
+    starting_offsets: str | None = None
+    ending_offsets: str | None = None
+    min_partitions: int | None = None
+
+    @classmethod
+    def from_env(cls) -> "KafkaReadOptions":
+        max_age = os.getenv("DATACONTRACT_KAFKA_MAX_AGE")
+        return cls(
+            max_messages_per_partition=_int_env("DATACONTRACT_KAFKA_MAX_MESSAGES_PER_PARTITION"),
+            start_timestamp=to_epoch_millis(os.getenv("DATACONTRACT_KAFKA_START_TIMESTAMP")),
+            end_timestamp=to_epoch_millis(os.getenv("DATACONTRACT_KAFKA_END_TIMESTAMP")),
+            max_age_seconds=period_to_seconds(max_age) if max_age else None,
+            starting_offsets=os.getenv("DATACONTRACT_KAFKA_STARTING_OFFSETS"),
+            ending_offsets=os.getenv("DATACONTRACT_KAFKA_ENDING_OFFSETS"),
+            min_partitions=_int_env("DATACONTRACT_KAFKA_MIN_PARTITIONS"),
+        )
+
+    def get_start_timestamp(self) -> int | None:
+        start_timestamps = [self.start_timestamp]
+        if self.max_age_seconds is not None:
+            start_timestamps.append(int(time.time() * 1000) - self.max_age_seconds * 1000)
+        return max((timestamp for timestamp in start_timestamps if timestamp is not None), default=None)
+
+    def to_spark_options(self, server: Server) -> dict[str, str]:
+        options = {"startingOffsets": "earliest"}
+        if self.min_partitions is not None:
+            options["minPartitions"] = str(self.min_partitions)
+        if self.starting_offsets is not None or self.ending_offsets is not None:
+            if self.starting_offsets is not None:
+                options["startingOffsets"] = self.starting_offsets
+            if self.ending_offsets is not None:
+                options["endingOffsets"] = self.ending_offsets
+            return options
+        if self.max_messages_per_partition is not None:
+            offset_ranges = get_partition_offset_ranges(server, self)
+            options["startingOffsets"] = json.dumps(
+                {server.topic: {str(partition): start for partition, (start, _) in offset_ranges.items()}}
+            )
+            options["endingOffsets"] = json.dumps(
+                {server.topic: {str(partition): end for partition, (_, end) in offset_ranges.items()}}
+            )
+            return options
+        start_timestamp = self.get_start_timestamp()
+        if start_timestamp is not None:
+            options["startingTimestamp"] = str(start_timestamp)
+        if self.end_timestamp is not None:
+            options["endingTimestamp"] = str(self.end_timestamp)
+        return options
+
+
+def get_partition_offset_ranges(server: Server, read_options: KafkaReadOptions) -> dict[int, tuple[int, int]]:
+    """Look up the [start, end) offsets to read per partition of the topic, honoring time window and message limit."""
+    from kafka import TopicPartition
+
+    consumer = create_kafka_consumer(server)
+    try:
+        partitions = [
+            TopicPartition(server.topic, partition) for partition in consumer.partitions_for_topic(server.topic) or []
+        ]
+        beginning_offsets = consumer.beginning_offsets(partitions)
+        end_offsets = consumer.end_offsets(partitions)
+        start_timestamp = read_options.get_start_timestamp()
+        if start_timestamp is not None:
+            start_offsets = consumer.offsets_for_times({partition: start_timestamp for partition in partitions})
+            for partition, offset_and_timestamp in start_offsets.items():
+                # no message after the start timestamp, so the partition is read from its end
+                beginning_offsets[partition] = (
+                    end_offsets[partition] if offset_and_timestamp is None else offset_and_timestamp.offset
+                )
+        if read_options.end_timestamp is not None:
+            end_timestamp_offsets = consumer.offsets_for_times(
+                {partition: read_options.end_timestamp for partition in partitions}
+            )
+            for partition, offset_and_timestamp in end_timestamp_offsets.items():
+                if offset_and_timestamp is not None:
+                    end_offsets[partition] = offset_and_timestamp.offset
+    finally:
+        consumer.close()
+
+    return {
+        partition.partition: to_offset_range(
+            beginning_offsets[partition], end_offsets[partition], read_options.max_messages_per_partition
+        )
+        for partition in partitions
+    }
+
+
+def create_kafka_consumer(server: Server):
+    try:
+        from kafka import KafkaConsumer
+    except ImportError as e:
+        raise DataContractException(
+            type="schema",
+            result=ResultEnum.failed,
+            name="kafka-python is missing",
+            reason="Install the extra datacontract-cli[kafka] to use kafka",
+            engine="datacontract",
+            original_exception=e,
+        )
+
+    return KafkaConsumer(bootstrap_servers=server.host, enable_auto_commit=False, **get_client_auth_options())
+
+
+def to_offset_range(beginning_offset: int, end_offset: int, max_messages: int | None) -> tuple[int, int]:
+    end_offset = max(beginning_offset, end_offset)
+    if max_messages is None:
+        return beginning_offset, end_offset
+    return max(beginning_offset, end_offset - max_messages), end_offset
+
+
+def to_epoch_millis(value: str | None) -> int | None:
+    """Parse epoch milliseconds or an ISO 8601 timestamp (UTC if no offset is given)."""
+    if value is None or value == "":
+        return None
+    if value.isdigit():
+        return int(value)
+    timestamp = datetime.fromisoformat(value)
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return int(timestamp.timestamp() * 1000)
+
+
+def _int_env(name: str) -> int | None:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def read_kafka_topic(
+    spark, data_contract: DataContractSpecification, server: Server, read_options: KafkaReadOptions = None
+):
     """Read and process data from a Kafka topic based on the server configuration."""
+    if read_options is None:
+        read_options = KafkaReadOptions.from_env()
 
     logging.info("Reading data from Kafka server %s topic %s", server.host, server.topic)
     df = (
@@ -52,7 +213,7 @@ def read_kafka_topic(spark, data_contract: DataContractSpecification, server: Se
         .options(**get_auth_options())
         .option("kafka.bootstrap.servers", server.host)
         .option("subscribe", server.topic)
-        .option("startingOffsets", "earliest")
+        .options(**read_options.to_spark_options(server))
         .load()
     )
 
@@ -73,6 +234,136 @@ def read_kafka_topic(spark, data_contract: DataContractSpecification, server: Se
             )
 
 
+def read_kafka_topic_into_duckdb(
+    con: duckdb.DuckDBPyConnection,
+    data_contract: DataContractSpecification,
+    server: Server,
+    run: Run,
+    read_options: KafkaReadOptions = None,
+):
+    """Read a bounded sample of the topic with the Python Kafka client into a DuckDB table, without Spark."""
+    if read_options is None:
+        read_options = KafkaReadOptions.from_env()
+    if server.format not in ["avro", "json"]:
+        raise DataContractException(
+            type="test",
+            name="Configuring Kafka checks",
+            result="warning",
+            reason=f"Kafka format '{server.format}' is not supported. Skip executing tests.",
+            engine="datacontract",
+        )
+
+    model_name, model = next(iter(data_contract.models.items()))
+    offset_ranges = get_partition_offset_ranges(server, read_options)
+    message_count = sum(end - start for start, end in offset_ranges.values())
+    run.log_info(f"Reading {message_count} messages from Kafka server {server.host} topic {server.topic}")
+    load_kafka_messages(con, model_name, model, server.format, consume_kafka_messages(server, offset_ranges))
+
+
+def consume_kafka_messages(
+    server: Server, offset_ranges: dict[int, tuple[int, int]], batch_size: int = 10000
+) -> Iterator[list[bytes]]:
+    """Yield the message values within the offset ranges per partition in batches."""
+    from kafka import TopicPartition
+
+    remaining = {
+        TopicPartition(server.topic, partition): end for partition, (start, end) in offset_ranges.items() if end > start
+    }
+    if len(remaining) == 0:
+        return
+
+    poll_timeout_seconds = float(os.getenv("DATACONTRACT_KAFKA_POLL_TIMEOUT_SECONDS", 10))
+    consumer = create_kafka_consumer(server)
+    try:
+        consumer.assign(list(remaining))
+        for topic_partition in remaining:
+            consumer.seek(topic_partition, offset_ranges[topic_partition.partition][0])
+        last_message_at = time.monotonic()
+        while len(remaining) > 0:
+            records = consumer.poll(timeout_ms=1000, max_records=batch_size)
+            values = []
+            for topic_partition, messages in records.items():
+                end = remaining.get(topic_partition)
+                if end is not None:
+                    values.extend(message.value for message in messages if message.offset < end)
+            # the last offsets of a partition can be control records that are never returned, so compare positions
+            for topic_partition in list(remaining):
+                if consumer.position(topic_partition) >= remaining[topic_partition]:
+                    consumer.pause(topic_partition)
+                    del remaining[topic_partition]
+            if len(values) > 0:
+                last_message_at = time.monotonic()
+                yield values
+            elif time.monotonic() - last_message_at > poll_timeout_seconds:
+                logging.warning(f"No messages received from Kafka topic {server.topic} for {poll_timeout_seconds}s")
+                break
+    finally:
+        consumer.close()
+
+
+def load_kafka_messages(
+    con: duckdb.DuckDBPyConnection, model_name: str, model: Model, format: str, message_batches: Iterable[list[bytes]]
+):
+    """
+    Load Avro or JSON messages into a DuckDB table of the model.
+
+    Each batch is converted to an Arrow record batch of JSON documents, which DuckDB parses into the column types
+    of the model. Like the Spark reader, messages that cannot be decoded result in a row with missing values.
+    """
+    import pyarrow as pa
+
+    decode = to_avro_decoder(model_name, model) if format == "avro" else to_json_decoder()
+    schema = pa.schema([("value", pa.string())])
+    table = pa.Table.from_batches(
+        (
+            pa.record_batch([pa.array([decode(value) for value in values], pa.string())], schema=schema)
+            for values in message_batches
+        ),
+        schema=schema,
+    )
+
+    structure = json.dumps(
+        {field_name: convert_to_duckdb(field) or "JSON" for field_name, field in model.fields.items()}
+    )
+    messages_view = f"{model_name}__kafka_messages"
+    json_object = "CASE WHEN json_valid(value) AND json_type(value) = 'OBJECT' THEN value END"
+    con.register(messages_view, table)
+    try:
+        con.sql(
+            f"""CREATE OR REPLACE TABLE "{model_name}" AS SELECT unnest(json_transform({json_object}, {to_sql_literal(structure)})) FROM "{messages_view}";"""
+        )
+    finally:
+        con.unregister(messages_view)
+
+
+def to_json_decoder() -> Callable[[bytes], str | None]:
+    def decode(value: bytes | None) -> str | None:
+        if value is None:
+            return None
+        return value.decode("utf-8", errors="replace")
+
+    return decode
+
+
+def to_avro_decoder(model_name: str, model: Model) -> Callable[[bytes], str | None]:
+    """Decode Avro messages with the 5-byte schema registry prefix (magic byte and schema id) to JSON."""
+    import avro.io
+    import avro.schema
+
+    reader = avro.io.DatumReader(avro.schema.parse(to_avro_schema_json(model_name, model)))
+
+    def decode(value: bytes | None) -> str | None:
+        if value is None:
+            return None
+        try:
+            record = reader.read(avro.io.BinaryDecoder(io.BytesIO(value[5:])))
+        except Exception:
+            return None
+        return json.dumps(record, default=str)
+
+    return decode
+
+
 def process_avro_format(df, model_name, model):
     try:
         from pyspark.sql.avro.functions import from_avro
@@ -153,6 +444,26 @@ def get_auth_options():
     }
 
 
+def get_client_auth_options():
+    """Retrieve Kafka authentication options for the Python Kafka client from environment variables."""
+    kafka_sasl_username = os.getenv("DATACONTRACT_KAFKA_SASL_USERNAME")
+    kafka_sasl_password = os.getenv("DATACONTRACT_KAFKA_SASL_PASSWORD")
+    kafka_sasl_mechanism = os.getenv("DATACONTRACT_KAFKA_SASL_MECHANISM", "PLAIN").upper()
+
+    if not kafka_sasl_username or not kafka_sasl_password:
+        return {}
+
+    if kafka_sasl_mechanism not in ["PLAIN", "SCRAM-SHA-256", "SCRAM-SHA-512"]:
+        raise ValueError(f"Unsupported SASL mechanism: {kafka_sasl_mechanism}")
+
+    return {
+        "security_protocol": "SASL_SSL",
+        "sasl_mechanism": kafka_sasl_mechanism,
+        "sasl_plain_username": kafka_sasl_username,
+        "sasl_plain_password": kafka_sasl_password,
+    }
+
+
 def to_struct_type(fields):
     try:
         from pyspark.sql.types import StructType
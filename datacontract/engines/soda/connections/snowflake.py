@@ -1,6 +1,6 @@
 import os
 
-import yaml
+from datacontract import yaml_io
 
 
 def to_snowflake_soda_configuration(server):
@@ -20,5 +20,5 @@ def to_snowflake_soda_configuration(server):
             **snowflake_soda_params,
         }
     }
-    soda_configuration_str = yaml.dump(soda_configuration)
+    soda_configuration_str = yaml_io.dump(soda_configuration)
     return soda_configuration_str
@@ -1,7 +1,6 @@
 import os
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.model.data_contract_specification import Server
 
 
@@ -39,5 +38,5 @@ def to_sqlserver_soda_configuration(server: Server) -> str:
         }
     }
 
-    soda_configuration_str = yaml.dump(soda_configuration)
+    soda_configuration_str = yaml_io.dump(soda_configuration)
     return soda_configuration_str
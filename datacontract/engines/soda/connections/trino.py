@@ -1,6 +1,6 @@
 import os
 
-import yaml
+from datacontract import yaml_io
 
 
 def to_trino_soda_configuration(server):
@@ -22,5 +22,5 @@ def to_trino_soda_configuration(server):
 
     soda_configuration = {f"data_source {server.type}": data_source}
 
-    soda_configuration_str = yaml.dump(soda_configuration)
+    soda_configuration_str = yaml_io.dump(soda_configuration)
     return soda_configuration_str
@@ -0,0 +1,171 @@
+import hashlib
+import logging
+import threading
+import time
+import typing
+from dataclasses import dataclass, field
+
+if typing.TYPE_CHECKING:
+    from soda.execution.data_source import DataSource
+    from soda.scan import Scan
+
+
+@dataclass
+class WarehouseSession:
+    """A connected soda-core data source of a warehouse server."""
+
+    key: str
+    data_source: "DataSource"
+    last_used: float = field(default_factory=time.monotonic)
+
+
+def to_session_key(soda_configuration_str: str) -> str:
+    # the soda configuration holds server type, host or account, database and the credentials
+    return hashlib.sha256(soda_configuration_str.encode("utf-8")).hexdigest()
+
+
+class WarehouseSessionPool:
+    """
+    Keeps authenticated warehouse sessions alive across test runs, keyed by the soda-core configuration.
+
+    Applies to servers that soda-core connects to itself, such as Snowflake, Postgres, MySQL, SQL Server and Trino,
+    so subsequent tests against the same server and credentials skip connecting and authenticating.
+    Each session is leased to one scan at a time. Idle sessions are closed after `max_idle_seconds`,
+    and the least recently used idle session is closed when the pool exceeds `max_size`.
+    """
+
+    def __init__(self, max_size: int = 8, max_idle_seconds: float = 600):
+        self.max_size = max_size
+        self.max_idle_seconds = max_idle_seconds
+        self._idle: list[WarehouseSession] = []
+        self._leased = 0
+        self._lock = threading.Lock()
+        # leases served by a pooled session, and leases where the scan had to connect
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, key: str) -> WarehouseSession | None:
+        """Lease an idle session, or return None when the scan has to connect itself."""
+        with self._lock:
+            self._evict_idle()
+            self._leased += 1
+            for i in range(len(self._idle) - 1, -1, -1):
+                session = self._idle[i]
+                if session.key != key:
+                    continue
+                del self._idle[i]
+                if self._is_healthy(session):
+                    self.hits += 1
+                    return session
+                self._close(session)
+            self.misses += 1
+            return None
+
+    def release(self, key: str, data_source: "DataSource | None"):
+        """Return the data source a scan used to the pool, if it is still connected."""
+        with self._lock:
+            self._leased -= 1
+            if data_source is None or data_source.connection is None:
+                return
+            session = WarehouseSession(key=key, data_source=data_source)
+            if not self._is_healthy(session):
+                self._close(session)
+                return
+            self._idle.append(session)
+            while len(self._idle) > 0 and len(self._idle) + self._leased > self.max_size:
+                self._close(self._idle.pop(0))
+
+    def evict_idle(self):
+        with self._lock:
+            self._evict_idle()
+
+    def close(self):
+        with self._lock:
+            for session in self._idle:
+                self._close(session)
+            self._idle = []
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._idle) + self._leased
+
+    def _evict_idle(self):
+        now = time.monotonic()
+        expired = [session for session in self._idle if now - session.last_used > self.max_idle_seconds]
+        for session in expired:
+            self._idle.remove(session)
+            self._close(session)
+
+    @staticmethod
+    def _is_healthy(session: WarehouseSession) -> bool:
+        connection = session.data_source.connection
+        try:
+            # end the transaction of the previous scan, so the next scan sees current data
+            connection.rollback()
+        except Exception:
+            pass
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close(session: WarehouseSession):
+        try:
+            session.data_source.disconnect()
+        except Exception as e:
+            logging.warning(f"Failed to close pooled warehouse session: {e}")
+
+
+def supports_warehouse_sessions(scan: "Scan") -> bool:
+    """
+    Whether the scan has the soda-core internals that pooled sessions are added through.
+
+    A pooled data source is added to the data sources of the scan, which soda-core does not close at the end of a
+    scan, as it only closes the connections it opened by name. Other soda-core versions run unpooled scans.
+    """
+    data_source_manager = getattr(scan, "_data_source_manager", None)
+    return hasattr(scan, "_logs") and isinstance(getattr(data_source_manager, "data_sources", None), dict)
+
+
+def add_warehouse_session(scan: "Scan", session: WarehouseSession):
+    """Let the scan use the data source of a pooled session instead of connecting."""
+    data_source = session.data_source
+    data_source.logs = scan._logs
+    data_source.data_source_scan = None
+    scan._data_source_manager.data_sources[data_source.data_source_name] = data_source
+
+
+def get_scan_data_source(scan: "Scan", data_source_name: str) -> "DataSource | None":
+    if not supports_warehouse_sessions(scan):
+        return None
+    return scan._data_source_manager.data_sources.get(data_source_name)
+
+
+_warehouse_session_pool: WarehouseSessionPool | None = None
+
+
+def enable_warehouse_session_pool(max_size: int = 8, max_idle_seconds: float = 600) -> WarehouseSessionPool:
+    """Enable pooling of warehouse sessions for all subsequent tests in this process."""
+    global _warehouse_session_pool
+    if _warehouse_session_pool is not None:
+        _warehouse_session_pool.close()
+    _warehouse_session_pool = WarehouseSessionPool(max_size=max_size, max_idle_seconds=max_idle_seconds)
+    return _warehouse_session_pool
+
+
+def disable_warehouse_session_pool():
+    global _warehouse_session_pool
+    if _warehouse_session_pool is not None:
+        _warehouse_session_pool.close()
+    _warehouse_session_pool = None
+
+
+def get_warehouse_session_pool() -> WarehouseSessionPool | None:
+    return _warehouse_session_pool
@@ -1,7 +1,6 @@
 from typing import Dict
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.export.exporter import Exporter
 from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model, Server
 
@@ -23,7 +22,7 @@ def to_data_caterer_generate_yaml(data_contract_spec: DataContractSpecification,
     for model_key, model_value in data_contract_spec.models.items():
         odcs_table = _to_data_caterer_generate_step(model_key, model_value, server_info)
         generation_task["steps"].append(odcs_table)
-    return yaml.dump(generation_task, indent=2, sort_keys=False, allow_unicode=True)
+    return yaml_io.dump(generation_task, indent=2, sort_keys=False, allow_unicode=True)
 
 
 def _get_server_info(data_contract_spec: DataContractSpecification, server):
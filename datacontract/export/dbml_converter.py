@@ -90,6 +90,8 @@ Note: {1}
 
 
 def generate_field(field_name: str, field: spec.Field, model_name: str, server: spec.Server) -> Tuple[str, str]:
+    required = field.required
+    unique = field.unique
     if field.primaryKey or field.primary:
         if field.required is not None:
             if not field.required:
@@ -101,7 +103,7 @@ def generate_field(field_name: str, field: spec.Field, model_name: str, server:
                     engine="datacontract",
                 )
         else:
-            field.required = True
+            required = True
         if field.unique is not None:
             if not field.unique:
                 raise DataContractException(
@@ -112,16 +114,16 @@ def generate_field(field_name: str, field: spec.Field, model_name: str, server:
                     engine="datacontract",
                 )
         else:
-            field.unique = True
+            unique = True
 
     field_attrs = []
     if field.primaryKey or field.primary:
         field_attrs.append("pk")
 
-    if field.unique:
+    if unique:
         field_attrs.append("unique")
 
-    if field.required:
+    if required:
         field_attrs.append("not null")
     else:
         field_attrs.append("null")
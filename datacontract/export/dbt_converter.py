@@ -1,7 +1,6 @@
 from typing import Dict, Optional
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.export.exporter import Exporter, _check_models_for_export
 from datacontract.export.sql_type_converter import convert_to_sql_type
 from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model
@@ -36,7 +35,7 @@ def to_dbt_models_yaml(data_contract_spec: DataContractSpecification, server: st
     for model_key, model_value in data_contract_spec.models.items():
         dbt_model = _to_dbt_model(model_key, model_value, data_contract_spec, adapter_type=server)
         dbt["models"].append(dbt_model)
-    return yaml.safe_dump(dbt, indent=2, sort_keys=False, allow_unicode=True)
+    return yaml_io.safe_dump(dbt, indent=2, sort_keys=False, allow_unicode=True)
 
 
 def to_dbt_staging_sql(data_contract_spec: DataContractSpecification, model_name: str, model_value: Model) -> str:
@@ -77,7 +76,7 @@ def to_dbt_sources_yaml(data_contract_spec: DataContractSpecification, server: s
     for model_key, model_value in data_contract_spec.models.items():
         dbt_model = _to_dbt_source_table(data_contract_spec, model_key, model_value, adapter_type)
         source["tables"].append(dbt_model)
-    return yaml.dump(dbt, indent=2, sort_keys=False, allow_unicode=True)
+    return yaml_io.dump(dbt, indent=2, sort_keys=False, allow_unicode=True)
 
 
 def _to_dbt_source_table(
@@ -8,8 +8,7 @@ import json
 from enum import Enum
 from typing import Any, Dict, List
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.export.exporter import (
     Exporter,
     _check_models_for_export,
@@ -282,7 +281,7 @@ def get_quality_checks(quality: Quality) -> Dict[str, Any]:
     if quality.type.lower() != "great-expectations":
         return {}
     if isinstance(quality.specification, str):
-        quality_specification = yaml.safe_load(quality.specification)
+        quality_specification = yaml_io.safe_load(quality.specification)
     else:
         quality_specification = quality.specification
     return quality_specification
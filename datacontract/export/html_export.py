@@ -4,9 +4,9 @@ from importlib.metadata import version
 
 import jinja_partials
 import pytz
-import yaml
 from jinja2 import Environment, PackageLoader, select_autoescape
 
+from datacontract import yaml_io
 from datacontract.export.exporter import Exporter
 from datacontract.model.data_contract_specification import DataContractSpecification
 
@@ -37,11 +37,11 @@ def to_html(data_contract_spec: DataContractSpecification) -> str:
         quality_specification = data_contract_spec.quality.specification
     elif data_contract_spec.quality is not None and isinstance(data_contract_spec.quality.specification, object):
         if data_contract_spec.quality.type == "great-expectations":
-            quality_specification = yaml.dump(
+            quality_specification = yaml_io.dump(
                 data_contract_spec.quality.specification, sort_keys=False, default_style="|"
             )
         else:
-            quality_specification = yaml.dump(data_contract_spec.quality.specification, sort_keys=False)
+            quality_specification = yaml_io.dump(data_contract_spec.quality.specification, sort_keys=False)
     else:
         quality_specification = None
 
@@ -1,7 +1,6 @@
 from typing import Dict
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.export.exporter import Exporter
 from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model
 
@@ -133,7 +132,7 @@ def to_odcs_v3_yaml(data_contract_spec: DataContractSpecification) -> str:
     if len(odcs["customProperties"]) == 0:
         del odcs["customProperties"]
 
-    return yaml.safe_dump(odcs, indent=2, sort_keys=False, allow_unicode=True)
+    return yaml_io.safe_dump(odcs, indent=2, sort_keys=False, allow_unicode=True)
 
 
 def to_odcs_schema(model_key, model_value: Model) -> dict:
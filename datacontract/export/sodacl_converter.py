@@ -1,5 +1,4 @@
-import yaml
-
+from datacontract import yaml_io
 from datacontract.engines.data_contract_checks import create_checks
 from datacontract.export.exporter import Exporter
 from datacontract.model.run import Run
@@ -13,12 +12,21 @@ class SodaExporter(Exporter):
 
 
 def to_sodacl_yaml(run: Run) -> str:
+    return yaml_io.dump(to_sodacl_dict(run))
+
+
+def to_sodacl_yaml_blocks(run: Run) -> list[str]:
+    """Split the sodacl checks into one yaml document per block, e.g., per `checks for <model>`."""
+    return [yaml_io.dump({key: value}) for key, value in to_sodacl_dict(run).items()]
+
+
+def to_sodacl_dict(run: Run) -> dict:
     sodacl_dict = {}
     for run_check in run.checks:
         if run_check.engine != "soda" or run_check.language != "sodacl":
             continue
         check_yaml_str = run_check.implementation
-        check_yaml_dict = yaml.safe_load(check_yaml_str)
+        check_yaml_dict = yaml_io.safe_load(check_yaml_str)
         for key, value in check_yaml_dict.items():
             if key in sodacl_dict:
                 if isinstance(sodacl_dict[key], list) and isinstance(value, list):
@@ -27,4 +35,4 @@ def to_sodacl_yaml(run: Run) -> str:
                     sodacl_dict[key].update(value)
             else:
                 sodacl_dict[key] = value
-    return yaml.dump(sodacl_dict)
+    return sodacl_dict
@@ -2,6 +2,7 @@ import json
 import logging
 from typing import List
 
+from datacontract.imports.concurrent_fetch import fetch_concurrently
 from datacontract.imports.importer import Importer
 from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model
 from datacontract.model.exceptions import DataContractException
@@ -59,14 +60,31 @@ def import_bigquery_from_api(
         )
 
     client = bigquery.Client(project=bigquery_project)
+    return import_bigquery_tables(
+        data_contract_specification, client, bigquery_project, bigquery_dataset, bigquery_tables
+    )
+
 
+def import_bigquery_tables(
+    data_contract_specification: DataContractSpecification,
+    client,
+    bigquery_project: str,
+    bigquery_dataset: str,
+    bigquery_tables: List[str] = None,
+    max_workers: int = 8,
+) -> DataContractSpecification:
+    """
+    Import tables of a dataset with a bigquery client, all tables of the dataset if no tables are given.
+
+    The metadata of the tables is fetched concurrently, with at most `max_workers` requests at a time, and requests
+    that hit a rate limit or a temporary error are retried. The models are added in the order of the tables.
+    """
     if bigquery_tables is None:
         bigquery_tables = fetch_table_names(client, bigquery_dataset)
 
-    for table in bigquery_tables:
+    def get_table(table: str):
         try:
             api_table = client.get_table("{}.{}.{}".format(bigquery_project, bigquery_dataset, table))
-
         except ValueError as e:
             raise DataContractException(
                 type="schema",
@@ -85,7 +103,10 @@ def import_bigquery_from_api(
                 reason=f"Table {table} bnot found on bigtable schema Project {bigquery_project}, dataset {bigquery_dataset}.",
                 engine="datacontract",
             )
+        return api_table
 
+    api_tables = fetch_concurrently(bigquery_tables, get_table, max_workers=max_workers)
+    for api_table in api_tables:
         convert_bigquery_schema(data_contract_specification, api_table.to_api_repr())
 
     return data_contract_specification
@@ -0,0 +1,59 @@
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+# HTTP status codes of rate limits and temporary server errors
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+# error codes of the Databricks API for the same
+TRANSIENT_ERROR_CODES = {"TEMPORARILY_UNAVAILABLE", "RESOURCE_EXHAUSTED", "REQUEST_LIMIT_EXCEEDED"}
+
+
+def fetch_concurrently(
+    keys: Iterable[K],
+    fetch: Callable[[K], V],
+    max_workers: int = 8,
+    retries: int = 3,
+    backoff_seconds: float = 1.0,
+    is_retryable: Callable[[Exception], bool] = None,
+) -> List[V]:
+    """
+    Fetch the metadata of many objects, e.g., tables, with at most `max_workers` concurrent requests.
+
+    Requests that fail with a transient error, such as a rate limit, are retried up to `retries` times with an
+    exponential backoff with jitter. Other errors, and errors after the last retry, are raised.
+    The results are in the order of the keys.
+    """
+    is_retryable = is_retryable or is_transient_error
+
+    def fetch_with_retry(key: K) -> V:
+        for attempt in range(retries + 1):
+            try:
+                return fetch(key)
+            except Exception as e:
+                if attempt == retries or not is_retryable(e):
+                    raise
+                delay = backoff_seconds * 2**attempt * random.uniform(0.5, 1.5)
+                logging.info(f"Fetching {key} failed with {e}, retrying in {delay:.1f} seconds")
+                time.sleep(delay)
+
+    keys = list(keys)
+    if len(keys) <= 1 or max_workers <= 1:
+        return [fetch_with_retry(key) for key in keys]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="datacontract-import") as executor:
+        return list(executor.map(fetch_with_retry, keys))
+
+
+def is_transient_error(e: Exception) -> bool:
+    """Whether an error of a cloud API client is worth retrying, e.g., a rate limit or a timeout."""
+    if isinstance(e, (ConnectionError, TimeoutError)):
+        return True
+    # google.api_core exceptions have the HTTP status as `code`, other clients as `status_code`
+    for attribute in ("code", "status_code"):
+        if getattr(e, attribute, None) in TRANSIENT_STATUS_CODES:
+            return True
+    return getattr(e, "error_code", None) in TRANSIENT_ERROR_CODES
@@ -1,28 +1,86 @@
+import csv
+import io
 import os
+import random
+import warnings
 
+import chardet
 import clevercsv
+import duckdb
+import pandas as pd
+from clevercsv.dialect import SimpleDialect
 
 from datacontract.imports.importer import Importer
 from datacontract.model.data_contract_specification import DataContractSpecification, Example, Field, Model, Server
+from datacontract.model.exceptions import DataContractException
+
+# the encoding and the dialect are detected from the head of the file
+ENCODING_DETECTION_BYTES = 1_000_000
+DIALECT_DETECTION_CHARS = 10000
+# the sample is read from the head of the file and from this many chunks at random positions
+SAMPLE_CHUNKS = 10
+TYPE_INFERENCES = ["pandas", "duckdb"]
 
 
 class CsvImporter(Importer):
     def import_source(
         self, data_contract_specification: DataContractSpecification, source: str, import_args: dict
     ) -> DataContractSpecification:
-        return import_csv(data_contract_specification, self.import_format, source)
+        return import_csv(
+            data_contract_specification,
+            self.import_format,
+            source,
+            sample_size=import_args.get("csv_sample_size"),
+            type_inference=import_args.get("csv_type_inference") or "pandas",
+            profile=import_args.get("csv_profile") or False,
+        )
+
 
+def import_csv(
+    data_contract_specification: DataContractSpecification,
+    format: str,
+    source: str,
+    sample_size: int = None,
+    type_inference: str = "pandas",
+    profile: bool = False,
+):
+    """
+    Import the columns of a CSV file as a model.
 
-def import_csv(data_contract_specification: DataContractSpecification, format: str, source: str):
+    The encoding and the dialect are detected once from the head of the file. The types are inferred by pandas from
+    all rows, or from a sample of `sample_size` rows of the head and of random chunks of the file, or by the CSV
+    auto-detection of DuckDB with `type_inference="duckdb"`. With `profile`, the minimum, maximum, null rate and
+    distinct count of each column are computed in one streaming pass with DuckDB, and seed the field constraints.
+    """
     include_example = False
 
+    if type_inference not in TYPE_INFERENCES:
+        raise DataContractException(
+            type="schema",
+            name="Import csv",
+            reason=f"Unknown type inference {type_inference}, use one of {', '.join(TYPE_INFERENCES)}",
+            engine="datacontract",
+        )
+
     # detect encoding and dialect
-    encoding = clevercsv.encoding.get_encoding(source)
-    with open(source, "r", newline="") as fp:
-        dialect = clevercsv.Sniffer().sniff(fp.read(10000))
+    encoding = detect_encoding(source)
+    # an ascii head may be followed by other characters, and utf-8 reads ascii as well
+    read_encoding = "utf-8" if encoding in (None, "ascii") else encoding
+    with open(source, "r", newline="", encoding=read_encoding, errors="replace") as fp:
+        dialect = clevercsv.Sniffer().sniff(fp.read(DIALECT_DETECTION_CHARS))
 
-    # using auto detecting of the format and encoding
-    df = clevercsv.read_dataframe(source)
+    if type_inference == "duckdb":
+        fields = infer_fields_with_duckdb(source, encoding, dialect, sample_size)
+    else:
+        df = read_dataframe(source, read_encoding, dialect, sample_size)
+        fields = {}
+        for column, dtype in df.dtypes.items():
+            field = Field()
+            field.type = map_type_from_pandas(dtype.name)
+            fields[column] = field
+
+    if profile:
+        profile_fields(source, encoding, dialect, fields)
 
     if data_contract_specification.models is None:
         data_contract_specification.models = {}
@@ -37,12 +95,6 @@ def import_csv(data_contract_specification: DataContractSpecification, format: s
         type="local", path=source, format="csv", delimiter=dialect.delimiter
     )
 
-    fields = {}
-    for column, dtype in df.dtypes.items():
-        field = Field()
-        field.type = map_type_from_pandas(dtype.name)
-        fields[column] = field
-
     data_contract_specification.models[table_name] = Model(
         type="table",
         description=f"Csv file with encoding {encoding}",
@@ -63,6 +115,179 @@ def import_csv(data_contract_specification: DataContractSpecification, format: s
     return data_contract_specification
 
 
+def detect_encoding(source: str) -> str | None:
+    detector = chardet.UniversalDetector()
+    with open(source, "rb") as file:
+        while not detector.done and file.tell() < ENCODING_DETECTION_BYTES:
+            chunk = file.read(65536)
+            if not chunk:
+                break
+            detector.feed(chunk)
+    detector.close()
+    return detector.result["encoding"]
+
+
+def read_dataframe(source: str, encoding: str, dialect: SimpleDialect, sample_size: int = None):
+    """Read all rows of the file, or a sample of `sample_size` rows, into a dataframe to infer the types."""
+    csv_dialect = dialect.to_csv_dialect()
+    if sample_size is not None:
+        source = io.StringIO(read_sample(source, encoding, csv_dialect, sample_size))
+    # pandas warns that the dialect overrides its defaults, as clevercsv does
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="^Conflicting values for .*", category=pd.errors.ParserWarning)
+        return pd.read_csv(source, dialect=csv_dialect, encoding=encoding)
+
+
+def read_sample(source: str, encoding: str, csv_dialect, sample_size: int) -> str:
+    """
+    Read the header and a sample of about `sample_size` rows of a CSV file, without reading the whole file.
+
+    Half of the sample are the first rows, the other half are chunks of rows at random positions, which are the
+    same for each import of the same file. Rows that are cut at the start of a chunk, or that span several lines,
+    are only kept if they have as many values as the header.
+    """
+    head_size = max(sample_size // 2, 1)
+    size = os.path.getsize(source)
+    with open(source, "rb") as file:
+        lines = [file.readline() for _ in range(head_size + 1)]
+        start = file.tell()
+        if start < size:
+            chunk_size = max((sample_size - head_size) // SAMPLE_CHUNKS, 1)
+            positions = sorted(random.Random(size).randrange(start, size) for _ in range(SAMPLE_CHUNKS))
+            for position in positions:
+                file.seek(position)
+                # skip the rest of the line at the random position
+                file.readline()
+                lines.extend(file.readline() for _ in range(chunk_size))
+
+    text = b"".join(lines).decode(encoding, errors="replace")
+    rows = list(csv.reader(io.StringIO(text, newline=""), dialect=csv_dialect))
+    if not rows:
+        return text
+    sample = io.StringIO()
+    writer = csv.writer(sample, dialect=csv_dialect)
+    writer.writerow(rows[0])
+    writer.writerows(row for row in rows[1:] if len(row) == len(rows[0]))
+    return sample.getvalue()
+
+
+def infer_fields_with_duckdb(source: str, encoding: str, dialect: SimpleDialect, sample_size: int = None) -> dict:
+    """Infer the types with the CSV auto-detection of DuckDB, which samples rows from the whole file."""
+    options, parameters = _read_csv_options(encoding, dialect)
+    options.append("sample_size = ?")
+    parameters.append(sample_size or -1)
+    columns = _execute_duckdb(
+        source, encoding, f"DESCRIBE SELECT * FROM read_csv(?, {', '.join(options)})", [source, *parameters]
+    )
+    fields = {}
+    for column_name, column_type, *_ in columns:
+        field = Field()
+        field.type = map_type_from_duckdb(column_type)
+        if field.type == "decimal":
+            precision, scale = column_type[len("DECIMAL(") : -1].split(",")
+            field.precision = int(precision)
+            field.scale = int(scale)
+        fields[column_name] = field
+    return fields
+
+
+def profile_fields(source: str, encoding: str, dialect: SimpleDialect, fields: dict[str, Field]):
+    """
+    Compute statistics of the columns in one streaming pass over the file with DuckDB, and seed the constraints.
+
+    Columns without empty values are required, the minimum and maximum of integers and the lengths of strings are
+    the observed ones, and the null rate and the estimated distinct count are added to the config of the field.
+    The columns are matched by position, as pandas and DuckDB name empty and duplicate headers differently.
+    """
+    options, parameters = _read_csv_options(encoding, dialect)
+    options.append("all_varchar = true")
+    names = [f"'c{index}'" for index in range(len(fields))]
+    options.append(f"names = [{', '.join(names)}]")
+    aggregates = ["count(*)"]
+    for index, field in enumerate(fields.values()):
+        column = f"c{index}"
+        aggregates.append(f"count({column})")
+        aggregates.append(f"approx_count_distinct({column})")
+        if field.type in ("integer", "long"):
+            aggregates.append(f"min(TRY_CAST({column} AS HUGEINT))")
+            aggregates.append(f"max(TRY_CAST({column} AS HUGEINT))")
+        elif field.type == "string":
+            aggregates.append(f"min(length({column}))")
+            aggregates.append(f"max(length({column}))")
+        else:
+            aggregates.append("NULL")
+            aggregates.append("NULL")
+
+    statistics = _execute_duckdb(
+        source,
+        encoding,
+        f"SELECT {', '.join(aggregates)} FROM read_csv(?, {', '.join(options)})",
+        [source, *parameters],
+    )[0]
+
+    row_count = statistics[0]
+    for index, field in enumerate(fields.values()):
+        value_count, distinct_count, minimum, maximum = statistics[1 + 4 * index : 5 + 4 * index]
+        if row_count == 0:
+            continue
+        field.required = value_count == row_count
+        if field.type in ("integer", "long"):
+            field.minimum = int(minimum) if minimum is not None else None
+            field.maximum = int(maximum) if maximum is not None else None
+        elif field.type == "string":
+            field.minLength = minimum
+            field.maxLength = maximum
+        if field.config is None:
+            field.config = {}
+        field.config["nullRate"] = round(1 - value_count / row_count, 4)
+        field.config["distinctCountEstimate"] = distinct_count
+
+
+def _read_csv_options(encoding: str, dialect: SimpleDialect) -> tuple[list[str], list]:
+    options = ["header = true", "delim = ?"]
+    parameters = [dialect.delimiter]
+    # DuckDB reads utf-8 by default, other encodings need DuckDB 1.1 or later
+    duckdb_encoding = _to_duckdb_encoding(encoding)
+    if duckdb_encoding is not None:
+        options.append("encoding = ?")
+        parameters.append(duckdb_encoding)
+    if dialect.quotechar:
+        options.append("quote = ?")
+        parameters.append(dialect.quotechar)
+    if dialect.escapechar:
+        options.append("escape = ?")
+        parameters.append(dialect.escapechar)
+    return options, parameters
+
+
+def _to_duckdb_encoding(encoding: str | None) -> str | None:
+    if encoding is None:
+        return None
+    encoding = encoding.lower()
+    if encoding in ("ascii", "utf-8", "utf-8-sig"):
+        return None
+    if encoding in ("iso-8859-1", "latin-1", "windows-1252"):
+        return "latin-1"
+    if encoding.startswith("utf-16"):
+        return "utf-16"
+    return encoding
+
+
+def _execute_duckdb(source: str, encoding: str, query: str, parameters: list) -> list[tuple]:
+    """Run a query on a new in-memory DuckDB database, which is closed after the rows are fetched."""
+    try:
+        with duckdb.connect() as con:
+            return con.execute(query, parameters).fetchall()
+    except duckdb.Error as e:
+        raise DataContractException(
+            type="schema",
+            name="Import csv",
+            reason=f"Failed to read the csv file {source} with encoding {encoding} with DuckDB: {e}",
+            engine="datacontract",
+            original_exception=e,
+        )
+
+
 def map_type_from_pandas(sql_type: str):
     if sql_type is None:
         return None
@@ -87,3 +312,35 @@ def map_type_from_pandas(sql_type: str):
         return "timestamp_ntz"
     else:
         return "variant"
+
+
+def map_type_from_duckdb(sql_type: str):
+    if sql_type is None:
+        return None
+
+    sql_type_normed = sql_type.upper().strip()
+
+    if sql_type_normed == "VARCHAR":
+        return "string"
+    elif sql_type_normed in ("BIGINT", "HUGEINT", "UBIGINT", "UHUGEINT"):
+        return "long"
+    elif sql_type_normed in ("TINYINT", "SMALLINT", "INTEGER", "UTINYINT", "USMALLINT", "UINTEGER"):
+        return "integer"
+    elif sql_type_normed == "DOUBLE":
+        return "double"
+    elif sql_type_normed == "FLOAT":
+        return "float"
+    elif sql_type_normed.startswith("DECIMAL"):
+        return "decimal"
+    elif sql_type_normed == "BOOLEAN":
+        return "boolean"
+    elif sql_type_normed == "DATE":
+        return "date"
+    elif sql_type_normed == "TIME":
+        return "time"
+    elif sql_type_normed == "TIMESTAMP WITH TIME ZONE":
+        return "timestamp_tz"
+    elif sql_type_normed.startswith("TIMESTAMP"):
+        return "timestamp_ntz"
+    else:
+        return "variant"
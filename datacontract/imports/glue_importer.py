@@ -1,4 +1,5 @@
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generator, List
 
 import boto3
@@ -19,16 +20,17 @@ class GlueImporter(Importer):
         return import_glue(data_contract_specification, source, import_args.get("glue_table"))
 
 
-def get_glue_database(database_name: str):
+def get_glue_database(database_name: str, glue=None):
     """Get the details Glue database.
 
     Args:
         database_name (str): glue database to request.
+        glue: The Glue client to use. If None, a new client is created.
 
     Returns:
         set: catalogid and locationUri
     """
-    glue = boto3.client("glue")
+    glue = glue or boto3.client("glue")
     try:
         response = glue.get_database(Name=database_name)
     except glue.exceptions.EntityNotFoundException:
@@ -45,27 +47,43 @@ def get_glue_database(database_name: str):
     )
 
 
-def get_glue_tables(database_name: str) -> List[str]:
+def get_glue_tables(database_name: str, glue=None) -> List[str]:
     """Get the list of tables in a Glue database.
 
     Args:
         database_name (str): Glue database to request.
+        glue: The Glue client to use. If None, a new client is created.
 
     Returns:
         List[str]: List of table names
     """
-    glue = boto3.client("glue")
+    return [table["Name"] for table in get_glue_table_definitions(database_name, glue) if "Name" in table]
+
+
+def get_glue_table_definitions(database_name: str, glue=None) -> List[Dict]:
+    """Get the definitions of all tables in a Glue database, including their columns.
+
+    The tables are fetched with the paginated `get_tables` operation, 100 tables per request.
+
+    Args:
+        database_name (str): Glue database to request.
+        glue: The Glue client to use. If None, a new client is created.
+
+    Returns:
+        List[Dict]: List of table definitions, as returned by Glue
+    """
+    glue = glue or boto3.client("glue")
 
     # Set the paginator
     paginator = glue.get_paginator("get_tables")
 
-    # Initialize an empty list to store the table names
-    table_names = []
+    # Initialize an empty list to store the tables
+    tables = []
     try:
         # Paginate through the tables
         for page in paginator.paginate(DatabaseName=database_name, PaginationConfig={"PageSize": 100}):
             # Add the tables from the current page to the list
-            table_names.extend([table["Name"] for table in page["TableList"] if "Name" in table])
+            tables.extend(page["TableList"])
     except glue.exceptions.EntityNotFoundException:
         print(f"Database {database_name} not found.")
         return []
@@ -74,21 +92,22 @@ def get_glue_tables(database_name: str) -> List[str]:
         print(f"Error: {e}")
         return []
 
-    return table_names
+    return tables
 
 
-def get_glue_table_schema(database_name: str, table_name: str) -> List[Dict]:
+def get_glue_table_schema(database_name: str, table_name: str, glue=None) -> List[Dict]:
     """Get the schema of a Glue table.
 
     Args:
         database_name (str): Glue database name.
         table_name (str): Glue table name.
+        glue: The Glue client to use. If None, a new client is created.
 
     Returns:
         dict: Table schema
     """
 
-    glue = boto3.client("glue")
+    glue = glue or boto3.client("glue")
 
     # Get the table schema
     try:
@@ -101,11 +120,23 @@ def get_glue_table_schema(database_name: str, table_name: str) -> List[Dict]:
         print(f"Error: {e}")
         return []
 
-    table_schema = response["Table"]["StorageDescriptor"]["Columns"]
+    return get_table_schema(response["Table"])
+
+
+def get_table_schema(table: Dict) -> List[Dict]:
+    """Get the schema of a Glue table definition.
+
+    Args:
+        table (dict): The table definition, as returned by `get_table` or `get_tables`.
+
+    Returns:
+        dict: Table schema
+    """
+    table_schema = list(table.get("StorageDescriptor", {}).get("Columns", []))
 
     # when using hive partition keys, the schema is stored in the PartitionKeys field
-    if response["Table"].get("PartitionKeys") is not None:
-        for pk in response["Table"]["PartitionKeys"]:
+    if table.get("PartitionKeys") is not None:
+        for pk in table["PartitionKeys"]:
             table_schema.append(
                 {
                     "Name": pk["Name"],
@@ -121,25 +152,44 @@ def import_glue(
     data_contract_specification: DataContractSpecification,
     source: str,
     table_names: List[str],
+    max_workers: int = 8,
 ) -> DataContractSpecification:
     """Import the schema of a Glue database.
 
+    All tables of the database are fetched with their columns in pages of 100 tables. Selected tables are fetched
+    concurrently. All requests share one Glue client.
+
     Args:
         data_contract_specification (DataContractSpecification): The data contract specification to update.
         source (str): The name of the Glue database.
         table_names (List[str]): List of table names to import. If None, all tables in the database are imported.
+        max_workers (int): The maximum number of tables that are fetched concurrently.
 
     Returns:
         DataContractSpecification: The updated data contract specification.
     """
-    catalogid, location_uri = get_glue_database(source)
+    glue = boto3.client("glue")
+    catalogid, location_uri = get_glue_database(source, glue)
 
     # something went wrong
     if catalogid is None:
         return data_contract_specification
 
     if table_names is None:
-        table_names = get_glue_tables(source)
+        table_schemas = {
+            table["Name"]: get_table_schema(table)
+            for table in get_glue_table_definitions(source, glue)
+            if "Name" in table
+        }
+    else:
+        # boto3 clients are thread-safe
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="datacontract-glue") as executor:
+            table_schemas = dict(
+                zip(
+                    table_names,
+                    executor.map(lambda table_name: get_glue_table_schema(source, table_name, glue), table_names),
+                )
+            )
 
     server_kwargs = {"type": "glue", "account": catalogid, "database": source}
 
@@ -150,12 +200,10 @@ def import_glue(
         "production": Server(**server_kwargs),
     }
 
-    for table_name in table_names:
+    for table_name, table_schema in table_schemas.items():
         if data_contract_specification.models is None:
             data_contract_specification.models = {}
 
-        table_schema = get_glue_table_schema(source, table_name)
-
         fields = {}
         for column in table_schema:
             field = create_typed_field(column["Type"])
@@ -1,5 +1,4 @@
-import yaml
-
+from datacontract import yaml_io
 from datacontract.imports.importer import Importer
 from datacontract.lint.resources import read_resource
 from datacontract.model.data_contract_specification import (
@@ -17,7 +16,7 @@ class OdcsImporter(Importer):
 
 def import_odcs(data_contract_specification: DataContractSpecification, source: str) -> DataContractSpecification:
     try:
-        odcs_contract = yaml.safe_load(read_resource(source))
+        odcs_contract = yaml_io.safe_load(read_resource(source))
 
     except Exception as e:
         raise DataContractException(
@@ -3,8 +3,7 @@ import logging
 from typing import Any, Dict, List
 from venv import logger
 
-import yaml
-
+from datacontract import yaml_io
 from datacontract.imports.importer import Importer
 from datacontract.lint.resources import read_resource
 from datacontract.model.data_contract_specification import (
@@ -40,7 +39,7 @@ def import_odcs_v3_from_str(
     data_contract_specification: DataContractSpecification, source_str: str
 ) -> DataContractSpecification:
     try:
-        odcs_contract = yaml.safe_load(source_str)
+        odcs_contract = yaml_io.safe_load(source_str)
     except Exception as e:
         raise DataContractException(
             type="schema",
@@ -6,6 +6,7 @@ from databricks.sdk import WorkspaceClient
 from databricks.sdk.service.catalog import ColumnInfo, TableInfo
 from pyspark.sql import types
 
+from datacontract.imports.concurrent_fetch import fetch_concurrently
 from datacontract.imports.importer import Importer
 from datacontract.imports.spark_importer import _field_from_struct_type
 from datacontract.model.data_contract_specification import DataContractSpecification, Field, Model
@@ -34,6 +35,10 @@ class UnityImporter(Importer):
         """
         if source is not None:
             data_contract_specification = import_unity_from_json(data_contract_specification, source)
+        elif import_args.get("unity_schema_full_name") is not None:
+            data_contract_specification = import_unity_schema_from_api(
+                data_contract_specification, import_args.get("unity_schema_full_name")
+            )
         else:
             data_contract_specification = import_unity_from_api(
                 data_contract_specification, import_args.get("unity_table_full_name")
@@ -101,6 +106,62 @@ def import_unity_from_api(
     return data_contract_specification
 
 
+def import_unity_schema_from_api(
+    data_contract_specification: DataContractSpecification,
+    unity_schema_full_name: str,
+    workspace_client: Optional[WorkspaceClient] = None,
+    max_workers: int = 8,
+) -> DataContractSpecification:
+    """
+    Import data contract specification from all tables of a schema in Unity Catalog.
+
+    The tables are listed with their columns in one paginated request. Tables that are listed without columns are
+    fetched concurrently, with at most `max_workers` requests at a time, and requests that hit a rate limit or a
+    temporary error are retried.
+
+    :param data_contract_specification: The data contract specification to be imported.
+    :type data_contract_specification: DataContractSpecification
+    :param unity_schema_full_name: The full name of the Unity schema, i.e., `catalog.schema`.
+    :type unity_schema_full_name: str
+    :param workspace_client: The workspace client, by default one of the databricks profile.
+    :type workspace_client: Optional[WorkspaceClient]
+    :param max_workers: The maximum number of concurrent requests.
+    :type max_workers: int
+    :return: The imported data contract specification.
+    :rtype: DataContractSpecification
+    :raises DataContractException: If there is an error retrieving the schema from the API.
+    """
+    if unity_schema_full_name.count(".") != 1:
+        raise DataContractException(
+            type="schema",
+            name="Retrieve unity catalog schema",
+            reason=f"The schema name {unity_schema_full_name} is not of the form catalog.schema",
+            engine="datacontract",
+        )
+    catalog_name, schema_name = unity_schema_full_name.split(".")
+
+    try:
+        workspace_client = workspace_client or WorkspaceClient()
+        unity_schemas: List[TableInfo] = list(
+            workspace_client.tables.list(catalog_name=catalog_name, schema_name=schema_name)
+        )
+        incomplete = [unity_schema.full_name for unity_schema in unity_schemas if unity_schema.columns is None]
+        fetched = dict(zip(incomplete, fetch_concurrently(incomplete, workspace_client.tables.get, max_workers)))
+    except Exception as e:
+        raise DataContractException(
+            type="schema",
+            name="Retrieve unity catalog schema",
+            reason=f"Failed to retrieve unity catalog schema {unity_schema_full_name} from databricks profile: {os.getenv('DATABRICKS_CONFIG_PROFILE')}",
+            engine="datacontract",
+            original_exception=e,
+        )
+
+    for unity_schema in unity_schemas:
+        convert_unity_schema(data_contract_specification, fetched.get(unity_schema.full_name, unity_schema))
+
+    return data_contract_specification
+
+
 def convert_unity_schema(
     data_contract_specification: DataContractSpecification, unity_schema: TableInfo
 ) -> DataContractSpecification:
@@ -25,16 +25,14 @@ def publish_test_results_to_datamesh_manager(run: Run, publish_url: str, ssl_ver
             raise Exception("Cannot publish run results for unknown data contract ID")
 
         headers = {"Content-Type": "application/json", "x-api-key": api_key}
-        request_body = run.model_dump_json()
-        # print("Request Body:", request_body)
+        # a bytes body with a Content-Length, as a generator would be sent with chunked transfer encoding
+        request_body = "".join(run.iter_json()).encode("utf-8")
         response = requests.post(
             url,
             data=request_body,
             headers=headers,
             verify=ssl_verification,
         )
-        # print("Status Code:", response.status_code)
-        # print("Response Body:", response.text)
         if response.status_code != 200:
             run.log_error(f"Error publishing test results to Data Mesh Manager: {response.text}")
             return
@@ -1,5 +1,4 @@
-import yaml
-
+from datacontract import yaml_io
 from datacontract.model.data_contract_specification import DataContractSpecification, Model
 
 from ..lint import Linter, LinterResult
@@ -37,7 +36,7 @@ class QualityUsesSchemaLinter(Linter):
         if not check.specification:
             return LinterResult.cautious("Quality check without specification.")
         if isinstance(check.specification, str):
-            check_specification = yaml.safe_load(check.specification)
+            check_specification = yaml_io.safe_load(check.specification)
         else:
             check_specification = check.specification
         match check.type:
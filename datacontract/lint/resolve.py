@@ -1,14 +1,16 @@
+import functools
 import logging
 import os
 
 import fastjsonschema
-import yaml
 from fastjsonschema import JsonSchemaValueException
 
+from datacontract import yaml_io
 from datacontract.imports.odcs_v3_importer import import_odcs_v3_from_str
 from datacontract.lint.resources import read_resource
 from datacontract.lint.schema import fetch_schema
 from datacontract.lint.urls import fetch_resource
+from datacontract.model.construct import construct_model, is_read_only, to_read_only
 from datacontract.model.data_contract_specification import (
     DataContractSpecification,
     Definition,
@@ -16,8 +18,11 @@ from datacontract.model.data_contract_specification import (
 )
 from datacontract.model.exceptions import DataContractException
 from datacontract.model.odcs import is_open_data_contract_standard
+from datacontract.snapshot import is_snapshot_location, read_snapshot
+from datacontract.telemetry import traced
 
 
+@traced("datacontract.resolve")
 def resolve_data_contract(
     data_contract_location: str = None,
     data_contract_str: str = None,
@@ -25,13 +30,26 @@ def resolve_data_contract(
     schema_location: str = None,
     inline_definitions: bool = False,
     inline_quality: bool = False,
+    strict: bool = None,
+    read_only: bool = False,
 ) -> DataContractSpecification:
+    """
+    Resolve a data contract from a location, a string, or a data contract object.
+
+    A data contract snapshot, compiled with `datacontract compile`, is loaded as it is.
+    A data contract that passed the validation against the JSON Schema is built without validating it again with
+    Pydantic, which is much faster for large data contracts. With `strict`, or the environment variable
+    `DATACONTRACT_STRICT_VALIDATION=true`, it is validated with Pydantic, too.
+    With `read_only`, the data contract cannot be modified and takes considerably less memory.
+    """
     if data_contract_location is not None:
         return resolve_data_contract_from_location(
-            data_contract_location, schema_location, inline_definitions, inline_quality
+            data_contract_location, schema_location, inline_definitions, inline_quality, strict, read_only
         )
     elif data_contract_str is not None:
-        return _resolve_data_contract_from_str(data_contract_str, schema_location, inline_definitions, inline_quality)
+        return _resolve_data_contract_from_str(
+            data_contract_str, schema_location, inline_definitions, inline_quality, strict, read_only
+        )
     elif data_contract is not None:
         return data_contract
     else:
@@ -50,6 +68,8 @@ def resolve_data_contract_dict(
     data_contract: DataContractSpecification = None,
 ) -> dict:
     if data_contract_location is not None:
+        if is_snapshot_location(data_contract_location):
+            return read_snapshot(data_contract_location).model_dump()
         return _to_yaml(read_resource(data_contract_location))
     elif data_contract_str is not None:
         return _to_yaml(data_contract_str)
@@ -66,10 +86,20 @@ def resolve_data_contract_dict(
 
 
 def resolve_data_contract_from_location(
-    location, schema_location: str = None, inline_definitions: bool = False, inline_quality: bool = False
+    location,
+    schema_location: str = None,
+    inline_definitions: bool = False,
+    inline_quality: bool = False,
+    strict: bool = None,
+    read_only: bool = False,
 ) -> DataContractSpecification:
+    if is_snapshot_location(location):
+        # compiled with `datacontract compile`, already resolved
+        return read_snapshot(location, read_only)
     data_contract_str = read_resource(location)
-    return _resolve_data_contract_from_str(data_contract_str, schema_location, inline_definitions, inline_quality)
+    return _resolve_data_contract_from_str(
+        data_contract_str, schema_location, inline_definitions, inline_quality, strict, read_only
+    )
 
 
 def inline_definitions_into_data_contract(spec: DataContractSpecification):
@@ -241,9 +271,14 @@ def _get_quality_ref_file(quality_spec: str | object) -> str | object:
 
 
 def _resolve_data_contract_from_str(
-    data_contract_str, schema_location: str = None, inline_definitions: bool = False, inline_quality: bool = False
+    data_contract_str,
+    schema_location: str = None,
+    inline_definitions: bool = False,
+    inline_quality: bool = False,
+    strict: bool = None,
+    read_only: bool = False,
 ) -> DataContractSpecification:
-    yaml_dict = _to_yaml(data_contract_str)
+    yaml_dict = _to_yaml(data_contract_str, cached=True)
 
     if is_open_data_contract_standard(yaml_dict):
         logging.info("Importing ODCS v3")
@@ -255,19 +290,39 @@ def _resolve_data_contract_from_str(
 
     _validate_data_contract_specification_schema(yaml_dict, schema_location)
     data_contract_specification = yaml_dict
-    spec = DataContractSpecification(**data_contract_specification)
+    if is_strict_validation(strict):
+        spec = DataContractSpecification(**data_contract_specification)
+    else:
+        # already validated against the JSON Schema
+        # inlining modifies the data contract, so it is made read-only afterwards, if there is anything to inline
+        needs_inlining = (inline_definitions and "$ref" in data_contract_str) or (
+            inline_quality and "quality" in data_contract_specification
+        )
+        spec = construct_model(
+            DataContractSpecification, data_contract_specification, read_only=read_only and not needs_inlining
+        )
 
     if inline_definitions:
         inline_definitions_into_data_contract(spec)
     if spec.quality and inline_quality:
         _resolve_quality_ref(spec.quality)
 
+    if read_only and not is_read_only(spec):
+        spec = to_read_only(spec)
+
     return spec
 
 
-def _to_yaml(data_contract_str) -> dict:
+def is_strict_validation(strict: bool = None) -> bool:
+    if strict is not None:
+        return strict
+    return os.getenv("DATACONTRACT_STRICT_VALIDATION", "false").lower() in ("true", "1")
+
+
+def _to_yaml(data_contract_str, cached: bool = False) -> dict:
     try:
-        yaml_dict = yaml.safe_load(data_contract_str)
+        # the cached documents are shared, so only for callers that do not modify them
+        yaml_dict = yaml_io.safe_load_cached(data_contract_str) if cached else yaml_io.safe_load(data_contract_str)
         return yaml_dict
     except Exception as e:
         logging.warning(f"Cannot parse YAML. Error: {str(e)}")
@@ -281,9 +336,9 @@ def _to_yaml(data_contract_str) -> dict:
 
 
 def _validate_data_contract_specification_schema(data_contract_yaml, schema_location: str = None):
-    schema = fetch_schema(schema_location)
+    validate = _compile_schema(schema_location)
     try:
-        fastjsonschema.validate(schema, data_contract_yaml, use_default=False)
+        validate(data_contract_yaml)
         logging.debug("YAML data is valid.")
     except JsonSchemaValueException as e:
         logging.warning(f"Data Contract YAML is invalid. Validation error: {e.message}")
@@ -303,3 +358,15 @@ def _validate_data_contract_specification_schema(data_contract_yaml, schema_loca
             reason=str(e),
             engine="datacontract",
         )
+
+
+def _compile_schema(schema_location: str = None):
+    if schema_location is None:
+        return _compile_bundled_schema()
+    return fastjsonschema.compile(fetch_schema(schema_location), use_default=False)
+
+
+@functools.cache
+def _compile_bundled_schema():
+    # compiling the schema takes longer than validating most data contracts
+    return fastjsonschema.compile(fetch_schema(None), use_default=False)
@@ -2,7 +2,8 @@ import os
 from typing import Any, Dict, List
 
 import pydantic as pyd
-import yaml
+
+from datacontract import yaml_io
 
 DATACONTRACT_TYPES = [
     "string",
@@ -316,11 +317,11 @@ class DataContractSpecification(pyd.BaseModel):
 
     @classmethod
     def from_string(cls, data_contract_str):
-        data = yaml.safe_load(data_contract_str)
+        data = yaml_io.safe_load_cached(data_contract_str)
         return DataContractSpecification(**data)
 
     def to_yaml(self):
-        return yaml.safe_dump(
+        return yaml_io.safe_dump(
             self.model_dump(mode="json", exclude_defaults=True, exclude_none=True, by_alias=True),
             sort_keys=False,
             allow_unicode=True,
@@ -1,10 +1,13 @@
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List
+from typing import Iterator, List
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 
 class ResultEnum(str, Enum):
@@ -16,6 +19,15 @@ class ResultEnum(str, Enum):
     unknown = "unknown"
 
 
+_RESULT_SEVERITY = {
+    ResultEnum.unknown: 0,
+    ResultEnum.passed: 1,
+    ResultEnum.warning: 2,
+    ResultEnum.failed: 3,
+    ResultEnum.error: 4,
+}
+
+
 class Check(BaseModel):
     id: str | None = None
     key: str | None = None
@@ -24,6 +36,7 @@ class Check(BaseModel):
     name: str | None = None
     model: str | None = None
     field: str | None = None
+    server: str | None = None
 
     engine: str | None = None
     language: str | None = None
@@ -35,6 +48,19 @@ class Check(BaseModel):
     diagnostics: dict | None = None
 
 
+class ModelMetrics(BaseModel):
+    durationSeconds: float = 0
+    rowsScanned: int | None = None
+    bytesRead: int | None = None
+
+
+class RunMetrics(BaseModel):
+    """Timings of the engine phases in seconds, and the scan metrics of each model."""
+
+    phases: dict[str, float] = {}
+    models: dict[str, ModelMetrics] = {}
+
+
 class Log(BaseModel):
     level: str
     message: str
@@ -51,9 +77,16 @@ class Run(BaseModel):
     timestampStart: datetime | None
     timestampEnd: datetime | None
     result: ResultEnum = ResultEnum.unknown
+    metrics: RunMetrics | None = None
     checks: List[Check] | None
     logs: List[Log] | None
 
+    _checks_by_key: dict = PrivateAttr(default_factory=dict)
+    _checks_by_id: dict = PrivateAttr(default_factory=dict)
+    _indexed_checks: List[Check] | None = PrivateAttr(default=None)
+    _indexed_checks_count: int = PrivateAttr(default=0)
+    _metrics_lock: threading.Lock = PrivateAttr(default_factory=threading.Lock)
+
     def has_passed(self):
         self.calculate_result()
         return self.result == ResultEnum.passed
@@ -63,32 +96,141 @@ class Run(BaseModel):
         self.calculate_result()
 
     def calculate_result(self):
-        if any(check.result == ResultEnum.error for check in self.checks):
-            self.result = ResultEnum.error
-        elif any(check.result == ResultEnum.failed for check in self.checks):
-            self.result = ResultEnum.failed
-        elif any(check.result == ResultEnum.warning for check in self.checks):
-            self.result = ResultEnum.warning
-        elif any(check.result == ResultEnum.passed for check in self.checks):
-            self.result = ResultEnum.passed
-        else:
-            self.result = ResultEnum.unknown
+        # single pass over all checks, stopping early as soon as the most severe result is found
+        result = ResultEnum.unknown
+        for check in self.checks:
+            check_result = check.result
+            if check_result == ResultEnum.error:
+                result = ResultEnum.error
+                break
+            if _RESULT_SEVERITY.get(check_result, 0) > _RESULT_SEVERITY[result]:
+                result = check_result
+        self.result = result
+
+    def add_check(self, check: Check) -> Check:
+        """Register a check with this run, making it available for lookup by key and id."""
+        self.checks.append(check)
+        self._update_check_index()
+        return check
+
+    def add_checks(self, checks: List[Check]):
+        """Register multiple checks with this run, making them available for lookup by key and id."""
+        self.checks.extend(checks)
+        self._update_check_index()
+
+    def get_check_by_key(self, key: str) -> Check | None:
+        """Return the first registered check with the given key in O(1), or None."""
+        self._update_check_index()
+        return self._checks_by_key.get(key)
+
+    def get_check_by_id(self, id: str) -> Check | None:
+        """Return the first registered check with the given id in O(1), or None."""
+        self._update_check_index()
+        return self._checks_by_id.get(id)
+
+    def _update_check_index(self):
+        # checks may also be appended to `checks` directly, so index everything not seen yet
+        if self._indexed_checks is not self.checks or self._indexed_checks_count > len(self.checks):
+            self._checks_by_key = {}
+            self._checks_by_id = {}
+            self._indexed_checks = self.checks
+            self._indexed_checks_count = 0
+        if self.checks is None:
+            return
+        for check in self.checks[self._indexed_checks_count :]:
+            if check.key is not None:
+                self._checks_by_key.setdefault(check.key, check)
+            if check.id is not None:
+                self._checks_by_id.setdefault(check.id, check)
+        self._indexed_checks_count = len(self.checks)
+
+    @contextmanager
+    def timed(self, phase: str):
+        """Add the wall time of the block to the engine phase, e.g., `resolve`, `connect`, `execute`, or `merge`."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase_time(phase, time.perf_counter() - start)
+
+    def add_phase_time(self, phase: str, seconds: float):
+        # models and servers may be tested concurrently, so phases add up the time of all threads
+        with self._metrics_lock:
+            metrics = self._get_metrics()
+            metrics.phases[phase] = metrics.phases.get(phase, 0) + seconds
+
+    def add_model_metrics(
+        self, model: str, duration_seconds: float = 0, rows_scanned: int = None, bytes_read: int = None
+    ):
+        with self._metrics_lock:
+            model_metrics = self._get_metrics().models.setdefault(model, ModelMetrics())
+            model_metrics.durationSeconds += duration_seconds
+            if rows_scanned is not None:
+                model_metrics.rowsScanned = (model_metrics.rowsScanned or 0) + rows_scanned
+            if bytes_read is not None:
+                model_metrics.bytesRead = (model_metrics.bytesRead or 0) + bytes_read
+
+    def merge_metrics(self, other: "Run", prefix: str = None):
+        """Add the metrics of another run, with its model names prefixed, e.g., with the server name."""
+        if other.metrics is None:
+            return
+        for phase, seconds in other.metrics.phases.items():
+            self.add_phase_time(phase, seconds)
+        for model, model_metrics in other.metrics.models.items():
+            self.add_model_metrics(
+                f"{prefix}.{model}" if prefix else model,
+                model_metrics.durationSeconds,
+                model_metrics.rowsScanned,
+                model_metrics.bytesRead,
+            )
+
+    def _get_metrics(self) -> RunMetrics:
+        if self.metrics is None:
+            self.metrics = RunMetrics()
+        return self.metrics
 
     def log_info(self, message: str):
         logging.info(message)
-        self.logs.append(Log(level="INFO", message=message, timestamp=datetime.now(timezone.utc)))
+        self._append_log("INFO", message)
 
     def log_warn(self, message: str):
         logging.warning(message)
-        self.logs.append(Log(level="WARN", message=message, timestamp=datetime.now(timezone.utc)))
+        self._append_log("WARN", message)
 
     def log_error(self, message: str):
         logging.error(message)
-        self.logs.append(Log(level="ERROR", message=message, timestamp=datetime.now(timezone.utc)))
+        self._append_log("ERROR", message)
+
+    def _append_log(self, level: str, message: str):
+        # level, message and timestamp are well-typed here, so skip pydantic validation for each log entry
+        self.logs.append(Log.model_construct(level=level, message=message, timestamp=datetime.now(timezone.utc)))
 
     def pretty(self):
         return self.model_dump_json(indent=2)
 
+    def iter_json(self, batch_size: int = 1000) -> Iterator[str]:
+        """
+        Serialize the run as compact JSON in chunks, so that runs with many checks and logs
+        do not need to be materialized as a single string.
+
+        The concatenation of all chunks is equal to `model_dump_json()`.
+
+        :param batch_size: The number of checks or logs serialized per chunk.
+        :return: An iterator over the JSON chunks.
+        """
+        header = self.model_dump_json(exclude={"checks", "logs"})
+        yield header[:-1]
+        for name, items in (("checks", self.checks), ("logs", self.logs)):
+            if items is None:
+                yield f',"{name}":null'
+                continue
+            yield f',"{name}":['
+            for start in range(0, len(items), batch_size):
+                chunk = ",".join(item.model_dump_json() for item in items[start : start + batch_size])
+                yield chunk if start == 0 else "," + chunk
+            yield "]"
+        yield "}"
+
     def pretty_logs(self) -> str:
         return "\n".join(f"[{log.timestamp.isoformat()}] {log.level}: {log.message}" for log in self.logs)
 
@@ -107,4 +249,5 @@ class Run(BaseModel):
             timestampEnd=now,
             checks=[],
             logs=[],
+            metrics=RunMetrics(),
         )
@@ -0,0 +1,15 @@
+from pathlib import Path
+
+from datacontract.model.run import Run
+
+
+def write_json_test_results(run: Run, console, output_path: Path):
+    if not output_path:
+        console.print("No output path specified for JSON test results. Skip writing JSON test results.")
+        return
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        for chunk in run.iter_json():
+            f.write(chunk)
+    console.print(f"JSON test results written to {output_path}")
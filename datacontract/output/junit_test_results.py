@@ -1,9 +1,7 @@
-import xml.etree.ElementTree as ET
 from pathlib import Path
-from xml.dom import minidom
-
-import yaml
+from xml.sax.saxutils import escape
 
+from datacontract import yaml_io
 from datacontract.model.run import ResultEnum, Run
 
 
@@ -12,76 +10,107 @@ def write_junit_test_results(run: Run, console, output_path: Path):
         console.print("No output path specified for JUnit test results. Skip writing JUnit test results.")
         return
 
-    testsuite = ET.Element(
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        for chunk in iter_junit_xml(run):
+            f.write(chunk)
+    console.print(f"JUnit test results written to {output_path}")
+
+
+def iter_junit_xml(run: Run):
+    """Yield the JUnit XML document for a run element by element, without building a DOM of all checks in memory."""
+    errors, failures, skipped = count_results(run)
+    yield '<?xml version="1.0" ?>\n'
+    yield _start_tag(
         "testsuite",
-        id=str(run.runId),
-        name=run.dataContractId if run.dataContractId else "Data Contract",
-        tests=str(len(run.checks)),
-        errors=str(count_errors(run)),
-        failures=str(count_failed(run)),
-        skipped=str(count_skipped(run)),
-        timestamp=run.timestampStart.replace(tzinfo=None).isoformat(),
-        time=str((run.timestampEnd - run.timestampStart).total_seconds()),
+        {
+            "id": str(run.runId),
+            "name": run.dataContractId if run.dataContractId else "Data Contract",
+            "tests": str(len(run.checks)),
+            "errors": str(errors),
+            "failures": str(failures),
+            "skipped": str(skipped),
+            "timestamp": run.timestampStart.replace(tzinfo=None).isoformat(),
+            "time": str((run.timestampEnd - run.timestampStart).total_seconds()),
+        },
     )
-
-    testsuiteProperties = ET.SubElement(testsuite, "properties")
-    if run.dataContractId is not None:
-        ET.SubElement(testsuiteProperties, "property", name="dataContractId", value=run.dataContractId)
-    if run.dataContractVersion is not None:
-        ET.SubElement(testsuiteProperties, "property", name="dataContractVersion", value=run.dataContractVersion)
-    if run.dataProductId is not None:
-        ET.SubElement(testsuiteProperties, "property", name="dataProductId", value=run.dataProductId)
-    if run.outputPortId is not None:
-        ET.SubElement(testsuiteProperties, "property", name="outputPortId", value=run.outputPortId)
-    if run.server is not None:
-        ET.SubElement(testsuiteProperties, "property", name="server", value=run.server)
+    yield "\n"
+
+    properties = [
+        ("dataContractId", run.dataContractId),
+        ("dataContractVersion", run.dataContractVersion),
+        ("dataProductId", run.dataProductId),
+        ("outputPortId", run.outputPortId),
+        ("server", run.server),
+        *to_metrics_properties(run),
+    ]
+    properties = [(name, value) for name, value in properties if value is not None]
+    if properties:
+        yield "  <properties>\n"
+        for name, value in properties:
+            yield "    " + _start_tag("property", {"name": name, "value": value}, empty=True) + "\n"
+        yield "  </properties>\n"
+    else:
+        yield "  <properties/>\n"
 
     for check in run.checks:
-        testcase = ET.SubElement(testsuite, "testcase", classname=to_class_name(check), name=to_testcase_name(check))
+        testcase_attributes = {"classname": to_class_name(check), "name": to_testcase_name(check)}
+        duration_seconds = (check.diagnostics or {}).get("durationSeconds")
+        if duration_seconds is not None:
+            testcase_attributes["time"] = str(duration_seconds)
         if check.result == ResultEnum.passed:
-            pass
-        elif check.result == ResultEnum.failed:
-            failure = ET.SubElement(
-                testcase,
-                "failure",
-                message=check.reason if check.reason else "Failed",
-                type=check.category if check.category else "General",
-            )
-            failure.text = to_failure_text(check)
+            yield "  " + _start_tag("testcase", testcase_attributes, empty=True) + "\n"
+            continue
+
+        if check.result == ResultEnum.failed:
+            tag, default_message, text = "failure", "Failed", to_failure_text(check)
         elif check.result == ResultEnum.error:
-            error = ET.SubElement(
-                testcase,
-                "error",
-                message=check.reason if check.reason else "Error",
-                type=check.category if check.category else "General",
-            )
-            error.text = to_failure_text(check)
+            tag, default_message, text = "error", "Error", to_failure_text(check)
         elif check.result is ResultEnum.warning:
-            skipped = ET.SubElement(
-                testcase,
-                "skipped",
-                message=check.reason if check.reason else "Warning",
-                type=check.category if check.category else "General",
-            )
-            skipped.skipped = to_failure_text(check)
+            tag, default_message, text = "skipped", "Warning", to_failure_text(check)
         else:
-            ET.SubElement(
-                testcase,
-                "skipped",
-                message=check.reason if check.reason else "None",
-                type=check.category if check.category else "General",
-            )
+            tag, default_message, text = "skipped", "None", None
+        attributes = {
+            "message": check.reason if check.reason else default_message,
+            "type": check.category if check.category else "General",
+        }
+        yield "  " + _start_tag("testcase", testcase_attributes) + "\n"
+        if text is None:
+            yield "    " + _start_tag(tag, attributes, empty=True) + "\n"
+        else:
+            yield "    " + _start_tag(tag, attributes) + _escape_text(text) + f"</{tag}>\n"
+        yield "  </testcase>\n"
 
     if run.logs:
-        system_out = ET.SubElement(testsuite, "system-out")
-        system_out.text = logs_to_system_out(run)
+        yield "  <system-out>"
+        for log in run.logs:
+            yield _escape_text(f"{log.timestamp} {log.level}: {log.message}\n")
+        yield "</system-out>\n"
 
-    xml_str: str = ET.tostring(testsuite, xml_declaration=True, encoding="utf-8")
-    xml_str_pretty = minidom.parseString(xml_str).toprettyxml(indent="  ")
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(xml_str_pretty)
-    console.print(f"JUnit test results written to {output_path}")
+    yield "</testsuite>\n"
+
+
+def to_metrics_properties(run: Run) -> list[tuple[str, str | None]]:
+    if run.metrics is None:
+        return []
+    properties = [(f"metrics.phases.{phase}", str(seconds)) for phase, seconds in run.metrics.phases.items()]
+    for model_name, model_metrics in run.metrics.models.items():
+        for name, value in model_metrics.model_dump().items():
+            properties.append((f"metrics.models.{model_name}.{name}", None if value is None else str(value)))
+    return properties
+
+
+def _start_tag(tag: str, attributes: dict, empty: bool = False) -> str:
+    attributes_str = "".join(f" {name}={_quote_attribute(value)}" for name, value in attributes.items())
+    return f"<{tag}{attributes_str}{'/' if empty else ''}>"
+
+
+def _escape_text(text: str) -> str:
+    return escape(text, {'"': "&quot;"})
+
+
+def _quote_attribute(value: str) -> str:
+    return '"' + escape(value, {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}) + '"'
 
 
 def to_testcase_name(check):
@@ -94,21 +123,21 @@ def to_testcase_name(check):
 
 
 def logs_to_system_out(run):
-    result = ""
-    for log in run.logs:
-        result += f"{log.timestamp} {log.level}: {log.message}\n"
-    return result
+    return "".join(f"{log.timestamp} {log.level}: {log.message}\n" for log in run.logs)
 
 
 def to_class_name(check):
     if check.model and check.field:
-        return f"{check.model}.{check.field}"
+        class_name = f"{check.model}.{check.field}"
     elif check.model:
-        return check.model
+        class_name = check.model
     elif check.field:
-        return check.field
+        class_name = check.field
     else:
-        return "general"
+        class_name = "general"
+    if check.server:
+        return f"{check.server}.{class_name}"
+    return class_name
 
 
 def to_failure_text(check):
@@ -119,10 +148,23 @@ def to_failure_text(check):
         f"Result: {check.result.value if check.result is not None else ''}\n"
         f"Reason: {check.reason}\n"
         f"Details: {check.details}\n"
-        f"Diagnostics:\n{yaml.dump(check.diagnostics, default_flow_style=False)}"
+        f"Diagnostics:\n{yaml_io.dump(check.diagnostics, default_flow_style=False)}"
     )
 
 
+def count_results(run) -> tuple[int, int, int]:
+    """Count errors, failures and skipped checks in a single pass."""
+    errors = failures = skipped = 0
+    for check in run.checks:
+        if check.result == ResultEnum.error:
+            errors += 1
+        elif check.result == ResultEnum.failed:
+            failures += 1
+        elif check.result is None:
+            skipped += 1
+    return errors, failures, skipped
+
+
 def count_errors(run):
     return sum(1 for check in run.checks if check.result == ResultEnum.error)
 
@@ -6,6 +6,7 @@ from rich.console import Console
 from rich.table import Table
 
 from datacontract.model.run import Run
+from datacontract.output.json_test_results import write_json_test_results
 from datacontract.output.junit_test_results import write_junit_test_results
 from datacontract.output.output_format import OutputFormat
 
@@ -13,8 +14,11 @@ from datacontract.output.output_format import OutputFormat
 def write_test_result(run: Run, console: Console, output_format: OutputFormat, output_path: Path):
     if output_format == OutputFormat.junit:
         write_junit_test_results(run, console, output_path)
+    elif output_format == OutputFormat.json:
+        write_json_test_results(run, console, output_path)
 
-    _print_table(run, console)
+    multiple_models = has_multiple_models(run)
+    _print_table(run, console, multiple_models)
     if run.result == "passed":
         console.print(
             f"🟢 data contract is valid. Run {len(run.checks)} checks. Took {(run.timestampEnd - run.timestampStart).total_seconds()} seconds."
@@ -24,7 +28,7 @@ def write_test_result(run: Run, console: Console, output_format: OutputFormat, o
         i = 1
         for check in run.checks:
             if check.result != "passed":
-                field = to_field(run, check)
+                field = to_field(run, check, multiple_models)
                 if field:
                     field = field + " "
                 else:
@@ -36,7 +40,7 @@ def write_test_result(run: Run, console: Console, output_format: OutputFormat, o
         i = 1
         for check in run.checks:
             if check.result != "passed":
-                field = to_field(run, check)
+                field = to_field(run, check, multiple_models)
                 if field:
                     field = field + " "
                 else:
@@ -46,25 +50,34 @@ def write_test_result(run: Run, console: Console, output_format: OutputFormat, o
         raise typer.Exit(code=1)
 
 
-def _print_table(run, console):
+def _print_table(run, console, multiple_models: bool):
     table = Table(box=box.ROUNDED)
     table.add_column("Result", no_wrap=True)
     table.add_column("Check", max_width=100)
     table.add_column("Field", max_width=32)
     table.add_column("Details", max_width=50)
     for check in sorted(run.checks, key=lambda c: (c.result or "", c.model or "", c.field or "")):
-        table.add_row(with_markup(check.result), check.name, to_field(run, check), check.reason)
+        table.add_row(with_markup(check.result), check.name, to_field(run, check, multiple_models), check.reason)
     console.print(table)
 
 
-def to_field(run, check):
-    models = [c.model for c in run.checks]
-    if len(set(models)) > 1:
+def has_multiple_models(run) -> bool:
+    return len({c.model for c in run.checks}) > 1
+
+
+def to_field(run, check, multiple_models: bool = None):
+    if multiple_models is None:
+        multiple_models = has_multiple_models(run)
+    if multiple_models:
         if check.field is None:
-            return check.model
-        return check.model + "." + check.field
+            field = check.model
+        else:
+            field = check.model + "." + check.field
     else:
-        return check.field
+        field = check.field
+    if check.server is not None:
+        return f"{check.server}: {field}" if field else check.server
+    return field
 
 
 def with_markup(result):
@@ -0,0 +1,209 @@
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from rich.console import Console
+
+from datacontract.data_contract import DataContract
+from datacontract.engines.data_contract_checks import period_to_seconds
+from datacontract.engines.soda.connections.duckdb_connection import (
+    enable_duckdb_connection_pool,
+    get_duckdb_connection_pool,
+)
+from datacontract.engines.soda.connections.warehouse_session_pool import (
+    enable_warehouse_session_pool,
+    get_warehouse_session_pool,
+)
+from datacontract.lint import resolve
+from datacontract.model.data_contract_specification import DataContractSpecification
+from datacontract.model.run import Run
+from datacontract.output.json_test_results import write_json_test_results
+from datacontract.output.junit_test_results import write_junit_test_results
+from datacontract.output.output_format import OutputFormat
+
+
+@dataclass
+class ScheduledContract:
+    """A data contract file of the scheduled directory and the state of its tests."""
+
+    path: Path
+    modified: float
+    interval_seconds: float
+    data_contract: DataContractSpecification | None = None
+    next_run: float = 0
+    running: bool = False
+    last_run: Run | None = None
+
+
+class ContractScheduler:
+    """
+    Tests all data contracts of a directory on an interval, in a single long-running process.
+
+    Data contracts are resolved once and re-resolved only when their file changes. Tests of all contracts share a
+    global limit of `max_parallel_tests`, as well as the pooled DuckDB connections and warehouse sessions.
+    A contract is tested every `interval_seconds`, unless its `servicelevels.frequency.interval` is a period
+    such as `1h` or `PT30M`. The results are written in `output_format` to `output_directory`
+    and published to `publish_url`, like `datacontract test` does.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        interval_seconds: float = 3600,
+        max_parallel_tests: int = 4,
+        pattern: str = "**/*.yaml",
+        server: str = "all",
+        publish_url: str = None,
+        ssl_verification: bool = True,
+        output_format: OutputFormat = None,
+        output_directory: str | Path = None,
+        engine: str = "soda",
+        max_parallel_servers: int = 4,
+        server_timeout: float = None,
+        console: Console = None,
+    ):
+        self.directory = Path(directory)
+        self.interval_seconds = interval_seconds
+        self.max_parallel_tests = max_parallel_tests
+        self.pattern = pattern
+        self.server = server
+        self.publish_url = publish_url
+        self.ssl_verification = ssl_verification
+        self.output_format = output_format
+        self.output_directory = Path(output_directory) if output_directory is not None else None
+        self.engine = engine
+        self.max_parallel_servers = max_parallel_servers
+        self.server_timeout = server_timeout
+        self.console = console if console is not None else Console()
+        self.contracts: dict[Path, ScheduledContract] = {}
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=max_parallel_tests, thread_name_prefix="datacontract-scheduler")
+
+        # share connections across the tests of all contracts
+        if get_duckdb_connection_pool() is None:
+            enable_duckdb_connection_pool(max_size=max_parallel_tests * 2)
+        if get_warehouse_session_pool() is None:
+            enable_warehouse_session_pool(max_size=max_parallel_tests * 2)
+
+    def load_contracts(self):
+        """Add new and changed data contract files of the directory and remove deleted ones."""
+        paths = {path: path.stat().st_mtime for path in sorted(self.directory.glob(self.pattern)) if path.is_file()}
+        with self._lock:
+            for path in list(self.contracts):
+                if path not in paths:
+                    logging.info(f"Removing data contract {path} from the schedule")
+                    del self.contracts[path]
+            for path, modified in paths.items():
+                contract = self.contracts.get(path)
+                if contract is not None and contract.modified == modified:
+                    continue
+                data_contract = self._resolve(path)
+                interval_seconds = self._to_interval_seconds(data_contract)
+                if contract is None:
+                    logging.info(f"Scheduling data contract {path} every {interval_seconds} seconds")
+                    self.contracts[path] = ScheduledContract(path, modified, interval_seconds, data_contract)
+                else:
+                    contract.modified = modified
+                    contract.data_contract = data_contract
+                    contract.next_run = min(contract.next_run, time.monotonic() + interval_seconds)
+                    contract.interval_seconds = interval_seconds
+
+    def run_pending(self) -> list[Future]:
+        """Reload the directory and start the tests of all contracts that are due."""
+        self.load_contracts()
+        now = time.monotonic()
+        futures = []
+        with self._lock:
+            for contract in self.contracts.values():
+                if contract.running or contract.next_run > now:
+                    continue
+                contract.running = True
+                futures.append(self._executor.submit(self._test_scheduled_contract, contract))
+        return futures
+
+    def run_once(self) -> list[Run]:
+        """Test all contracts of the directory once and wait for the results."""
+        return [future.result() for future in self.run_pending()]
+
+    def run_forever(self, poll_seconds: float = 1):
+        """Run the due tests until `stop()` is called."""
+        self.console.print(f"Scheduling data contract tests in {self.directory}")
+        try:
+            while not self._stopped.is_set():
+                self.run_pending()
+                self._stopped.wait(poll_seconds)
+        finally:
+            self.shutdown()
+
+    def stop(self):
+        self._stopped.set()
+
+    def shutdown(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def test_contract(self, contract: ScheduledContract) -> Run:
+        data_contract = DataContract(
+            data_contract_file=str(contract.path) if contract.data_contract is None else None,
+            data_contract=contract.data_contract,
+            server=self.server,
+            publish_url=self.publish_url,
+            ssl_verification=self.ssl_verification,
+            max_parallel_servers=self.max_parallel_servers,
+            server_timeout=self.server_timeout,
+            engine=self.engine,
+            read_only=True,
+        )
+        run = data_contract.test()
+        self.write_test_result(contract, run)
+        return run
+
+    def write_test_result(self, contract: ScheduledContract, run: Run):
+        self.console.print(
+            f"{run.result} {contract.path}: {len(run.checks)} checks, "
+            f"took {(run.timestampEnd - run.timestampStart).total_seconds()} seconds"
+        )
+        if self.output_format is None or self.output_directory is None:
+            return
+        output_path = self.output_directory / self._to_output_name(contract.path)
+        if self.output_format == OutputFormat.junit:
+            write_junit_test_results(run, self.console, output_path.with_suffix(".xml"))
+        elif self.output_format == OutputFormat.json:
+            write_json_test_results(run, self.console, output_path.with_suffix(".json"))
+
+    def _test_scheduled_contract(self, contract: ScheduledContract) -> Run:
+        try:
+            run = self.test_contract(contract)
+            contract.last_run = run
+            return run
+        finally:
+            with self._lock:
+                contract.running = False
+                contract.next_run = time.monotonic() + contract.interval_seconds
+
+    def _to_output_name(self, path: Path) -> str:
+        # one result file per contract, named after its path relative to the directory
+        return "TEST-" + "_".join(path.relative_to(self.directory).with_suffix("").parts)
+
+    @staticmethod
+    def _resolve(path: Path) -> DataContractSpecification | None:
+        try:
+            # cached for the lifetime of the scheduler, so read-only to save memory
+            return resolve.resolve_data_contract(
+                str(path), inline_definitions=True, inline_quality=True, read_only=True
+            )
+        except Exception as e:
+            # tested from the file, so that the error is reported as the result of the test
+            logging.warning(f"Cannot resolve data contract {path}: {e}")
+            return None
+
+    def _to_interval_seconds(self, data_contract: DataContractSpecification | None) -> float:
+        if data_contract is None or data_contract.servicelevels is None:
+            return self.interval_seconds
+        frequency = data_contract.servicelevels.frequency
+        if frequency is None or frequency.interval is None:
+            return self.interval_seconds
+        return period_to_seconds(frequency.interval) or self.interval_seconds
@@ -0,0 +1,223 @@
+import base64
+import datetime
+import functools
+import hashlib
+import json
+import os
+import struct
+import zlib
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+
+from datacontract.model.construct import construct_model
+from datacontract.model.data_contract_specification import DataContractSpecification
+from datacontract.model.exceptions import DataContractException
+
+SNAPSHOT_SUFFIX = ".dcsnap"
+SNAPSHOT_FORMAT_VERSION = 1
+
+# magic, format version, length of the header
+_MAGIC = b"DCSNAP"
+_PREAMBLE = struct.Struct(">6sHI")
+_TYPE_KEY = "$snapshotType"
+
+
+@dataclass
+class SnapshotHeader:
+    """The header of a data contract snapshot, which is read without decoding the data contract."""
+
+    format_version: int
+    cli_version: str
+    source_digest: str
+    source_location: str | None
+    digest: str
+    tagged: bool
+
+
+def dumps_snapshot(data_contract: DataContractSpecification, source: str, source_location: str = None) -> bytes:
+    """
+    Serialize a resolved data contract into a snapshot.
+
+    A snapshot is a binary file with a small JSON header and the zlib compressed JSON of the data contract.
+    The digest of the header ties the data contract to the content of its source and the CLI version, and is
+    verified on load. Values that JSON cannot represent, such as dates parsed from YAML, are tagged.
+    """
+    tagged = False
+
+    def encode_value(value):
+        nonlocal tagged
+        tagged = True
+        if isinstance(value, datetime.datetime):
+            return {_TYPE_KEY: "datetime", "value": value.isoformat()}
+        if isinstance(value, datetime.date):
+            return {_TYPE_KEY: "date", "value": value.isoformat()}
+        if isinstance(value, datetime.time):
+            return {_TYPE_KEY: "time", "value": value.isoformat()}
+        if isinstance(value, bytes):
+            return {_TYPE_KEY: "bytes", "value": base64.b64encode(value).decode("ascii")}
+        if isinstance(value, (set, frozenset)):
+            return list(value)
+        raise TypeError(f"Cannot serialize {type(value).__name__} into a data contract snapshot")
+
+    data = data_contract.model_dump(mode="python", by_alias=True, exclude_unset=True)
+    try:
+        payload = json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=encode_value)
+    except TypeError as e:
+        raise DataContractException(
+            type="snapshot",
+            name="Compile data contract snapshot",
+            reason=str(e),
+            engine="datacontract",
+            original_exception=e,
+        )
+    payload = zlib.compress(payload.encode("utf-8"))
+
+    cli_version = _cli_version()
+    digest = source_digest(source)
+    header = {
+        "cliVersion": cli_version,
+        "sourceDigest": digest,
+        "sourceLocation": source_location,
+        "digest": _digest(cli_version, digest, payload),
+        "tagged": tagged,
+    }
+    header = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    return _PREAMBLE.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, len(header)) + header + payload
+
+
+def loads_snapshot(content: bytes, read_only: bool = False) -> DataContractSpecification:
+    """
+    Load a resolved data contract from a snapshot, without parsing YAML, validating, or inlining definitions.
+    With `read_only`, the data contract cannot be modified and takes considerably less memory.
+
+    Raises a DataContractException if the snapshot is corrupt, or was compiled with another CLI version.
+    """
+    header, payload = _split(content)
+    if header.cli_version != _cli_version():
+        _raise_invalid(
+            f"The snapshot was compiled with datacontract-cli {header.cli_version}, "
+            f"but this is {_cli_version()}. Compile the data contract again."
+        )
+    if header.digest != _digest(header.cli_version, header.source_digest, payload):
+        _raise_invalid("The digest of the snapshot does not match its content.")
+
+    data = json.loads(zlib.decompress(payload).decode("utf-8"), object_hook=_decode_value if header.tagged else None)
+    return construct_model(DataContractSpecification, data, read_only)
+
+
+def read_snapshot_header(content: bytes) -> SnapshotHeader:
+    header, _ = _split(content)
+    return header
+
+
+def write_snapshot(
+    path: str | Path, data_contract: DataContractSpecification, source: str, source_location: str = None
+):
+    Path(path).write_bytes(dumps_snapshot(data_contract, source, source_location))
+
+
+def read_snapshot(path: str | Path, read_only: bool = False) -> DataContractSpecification:
+    if not os.path.exists(path):
+        raise DataContractException(
+            type="lint",
+            name=f"Reading data contract snapshot from {path}",
+            reason=f"The file '{path}' does not exist.",
+            engine="datacontract",
+            result="error",
+        )
+    return loads_snapshot(Path(path).read_bytes(), read_only)
+
+
+def is_snapshot_location(location: str) -> bool:
+    return location.endswith(SNAPSHOT_SUFFIX) and not location.startswith(("http://", "https://"))
+
+
+def is_snapshot_current(path: str | Path, source: str) -> bool:
+    """Whether the snapshot exists and was compiled from this source with this CLI version."""
+    path = Path(path)
+    if not path.exists():
+        return False
+    with path.open("rb") as file:
+        preamble = file.read(_PREAMBLE.size)
+        if len(preamble) < _PREAMBLE.size:
+            return False
+        magic, format_version, header_length = _PREAMBLE.unpack(preamble)
+        if magic != _MAGIC or format_version != SNAPSHOT_FORMAT_VERSION:
+            return False
+        try:
+            header = _to_header(format_version, file.read(header_length))
+        except DataContractException:
+            return False
+    return header.cli_version == _cli_version() and header.source_digest == source_digest(source)
+
+
+def source_digest(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+
+def _split(content: bytes) -> tuple[SnapshotHeader, bytes]:
+    if len(content) < _PREAMBLE.size:
+        _raise_invalid("The file is not a data contract snapshot.")
+    magic, format_version, header_length = _PREAMBLE.unpack_from(content)
+    if magic != _MAGIC:
+        _raise_invalid("The file is not a data contract snapshot.")
+    if format_version != SNAPSHOT_FORMAT_VERSION:
+        _raise_invalid(
+            f"The snapshot format version {format_version} is not supported. Compile the data contract again."
+        )
+    header_end = _PREAMBLE.size + header_length
+    return _to_header(format_version, content[_PREAMBLE.size : header_end]), content[header_end:]
+
+
+def _to_header(format_version: int, header: bytes) -> SnapshotHeader:
+    try:
+        header = json.loads(header)
+        return SnapshotHeader(
+            format_version=format_version,
+            cli_version=header["cliVersion"],
+            source_digest=header["sourceDigest"],
+            source_location=header.get("sourceLocation"),
+            digest=header["digest"],
+            tagged=header.get("tagged", False),
+        )
+    except (ValueError, KeyError) as e:
+        _raise_invalid(f"The header of the snapshot is corrupt: {e}")
+
+
+def _digest(cli_version: str, source_digest: str, payload: bytes) -> str:
+    digest = hashlib.sha256(f"{SNAPSHOT_FORMAT_VERSION}\0{cli_version}\0{source_digest}\0".encode("utf-8"))
+    digest.update(payload)
+    return digest.hexdigest()
+
+
+def _decode_value(value: dict):
+    value_type = value.get(_TYPE_KEY)
+    if value_type is None or len(value) != 2:
+        return value
+    if value_type == "datetime":
+        return datetime.datetime.fromisoformat(value["value"])
+    if value_type == "date":
+        return datetime.date.fromisoformat(value["value"])
+    if value_type == "time":
+        return datetime.time.fromisoformat(value["value"])
+    if value_type == "bytes":
+        return base64.b64decode(value["value"])
+    return value
+
+
+@functools.cache
+def _cli_version() -> str:
+    try:
+        return metadata.version("datacontract-cli")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _raise_invalid(reason: str):
+    raise DataContractException(
+        type="snapshot",
+        name="Load data contract snapshot",
+        reason=reason,
+        engine="datacontract",
+    )
@@ -0,0 +1,117 @@
+import functools
+import logging
+import os
+import typing
+from contextlib import nullcontext
+
+if typing.TYPE_CHECKING:
+    from opentelemetry.trace import Tracer, TracerProvider
+
+TRACER_NAME = "datacontract"
+
+_tracer: "Tracer | None" = None
+# the tracer provider that is configured by the environment variables, which is shut down on reconfiguration
+_provider: "TracerProvider | None" = None
+_configured = False
+
+
+def configure_tracing(tracer_provider: "TracerProvider" = None) -> bool:
+    """
+    Enable OpenTelemetry spans for resolving, linting, testing, connecting and exporting.
+
+    Spans are recorded with the given tracer provider, e.g., the one of an application that uses datacontract as
+    a library. Without a tracer provider, the exporter is configured with the environment variable
+    `DATACONTRACT_OTEL_TRACES_EXPORTER`:
+
+    - `console` prints the spans to stdout,
+    - `file` appends the spans as JSON to the file `DATACONTRACT_OTEL_TRACES_FILE` (default: `datacontract-traces.json`),
+    - `otlp` sends the spans to an OpenTelemetry collector, configured with the `OTEL_EXPORTER_OTLP_*` variables.
+
+    Tracing stays disabled if the variable is not set or OpenTelemetry is not installed.
+    Returns whether tracing is enabled.
+    """
+    global _tracer, _provider, _configured
+    _configured = True
+    if _provider is not None:
+        # flushes the spans and closes the traces file
+        _provider.shutdown()
+        _provider = None
+    if tracer_provider is not None:
+        _tracer = tracer_provider.get_tracer(TRACER_NAME)
+        return True
+
+    exporter_name = os.getenv("DATACONTRACT_OTEL_TRACES_EXPORTER")
+    if exporter_name is None or exporter_name == "" or exporter_name == "none":
+        _tracer = None
+        return False
+    try:
+        from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter, SimpleSpanProcessor
+    except ImportError as e:
+        logging.warning(f"Cannot enable tracing, as OpenTelemetry is not installed: {e}")
+        _tracer = None
+        return False
+
+    # an own provider instead of the global one, which may be set up by other libraries, such as soda-core
+    provider = TracerProvider(resource=Resource.create({SERVICE_NAME: "datacontract-cli"}))
+    if exporter_name == "console":
+        provider.add_span_processor(SimpleSpanProcessor(ConsoleSpanExporter()))
+    elif exporter_name == "file":
+        traces_file = open(os.getenv("DATACONTRACT_OTEL_TRACES_FILE", "datacontract-traces.json"), "a")
+
+        class FileSpanExporter(ConsoleSpanExporter):
+            def shutdown(self):
+                # on exit or reconfiguration, as the provider shuts down its span processors and their exporters
+                self.out.close()
+
+        provider.add_span_processor(
+            SimpleSpanProcessor(
+                FileSpanExporter(out=traces_file, formatter=lambda span: span.to_json(indent=None) + os.linesep)
+            )
+        )
+    elif exporter_name == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError as e:
+            logging.warning(f"Cannot enable tracing, as the OpenTelemetry OTLP exporter is not installed: {e}")
+            _tracer = None
+            return False
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    else:
+        logging.warning(f"Unknown traces exporter {exporter_name}, use console, file, or otlp")
+        _tracer = None
+        return False
+    _provider = provider
+    _tracer = provider.get_tracer(TRACER_NAME)
+    return True
+
+
+def get_tracer() -> "Tracer | None":
+    if not _configured:
+        configure_tracing()
+    return _tracer
+
+
+def trace_span(name: str, **attributes):
+    """Return a context manager that records a span, or does nothing if tracing is disabled."""
+    tracer = get_tracer()
+    if tracer is None:
+        return nullcontext()
+    return tracer.start_as_current_span(
+        name, attributes={key: value for key, value in attributes.items() if value is not None}
+    )
+
+
+def traced(name: str):
+    """Decorate a function to record a span for each of its calls."""
+
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            with trace_span(name):
+                return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,107 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+import yaml
+
+from datacontract.model.construct import ReadOnlyDict, ReadOnlyList
+
+# the libyaml based loader, which is several times faster, with the same results
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# the pure Python dumpers, as libyaml folds long double-quoted strings differently
+class SafeDumper(yaml.SafeDumper):
+    """`yaml.SafeDumper` that also dumps the lists and dicts of read-only data contracts."""
+
+
+class Dumper(yaml.Dumper):
+    """`yaml.Dumper` that also dumps the lists and dicts of read-only data contracts."""
+
+
+# registered on the subclasses only, so that the dumpers of PyYAML stay unchanged for other libraries
+for _dumper in [SafeDumper, Dumper]:
+    _dumper.add_representer(ReadOnlyList, yaml.representer.SafeRepresenter.represent_list)
+    _dumper.add_representer(ReadOnlyDict, yaml.representer.SafeRepresenter.represent_dict)
+
+
+def safe_load(stream) -> Any:
+    """Parse a YAML document like `yaml.safe_load`, with libyaml if it is available."""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def safe_dump(data, stream=None, **kwargs):
+    """Serialize to YAML like `yaml.safe_dump`."""
+    return yaml.dump(data, stream, Dumper=SafeDumper, **kwargs)
+
+
+def dump(data, stream=None, **kwargs):
+    """Serialize to YAML like `yaml.dump`."""
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
+
+
+class YamlParseCache:
+    """
+    A bounded cache of parsed YAML documents, keyed by the hash of their content.
+
+    The cached documents are shared between all callers and must not be modified. Use it for documents that are
+    parsed repeatedly, such as the data contracts of a long-running API or scheduler process.
+    """
+
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._documents: OrderedDict[bytes, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def safe_load(self, content: str) -> Any:
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+        with self._lock:
+            if key in self._documents:
+                self.hits += 1
+                self._documents.move_to_end(key)
+                return self._documents[key]
+            self.misses += 1
+        document = safe_load(content)
+        with self._lock:
+            self._documents[key] = document
+            while len(self._documents) > self.max_size:
+                self._documents.popitem(last=False)
+        return document
+
+    def clear(self):
+        with self._lock:
+            self._documents.clear()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._documents)
+
+
+_yaml_parse_cache: YamlParseCache | None = None
+
+
+def enable_yaml_parse_cache(max_size: int = 128) -> YamlParseCache:
+    """Cache the parsed data contracts of resolve and `DataContractSpecification.from_string` by content hash."""
+    global _yaml_parse_cache
+    _yaml_parse_cache = YamlParseCache(max_size=max_size)
+    return _yaml_parse_cache
+
+
+def disable_yaml_parse_cache():
+    global _yaml_parse_cache
+    _yaml_parse_cache = None
+
+
+def get_yaml_parse_cache() -> YamlParseCache | None:
+    return _yaml_parse_cache
+
+
+def safe_load_cached(content: str) -> Any:
+    """Parse a YAML document, from the parse cache if it is enabled. The result must not be modified."""
+    cache = _yaml_parse_cache
+    if cache is None or not isinstance(content, str):
+        return safe_load(content)
+    return cache.safe_load(content)
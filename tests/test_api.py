@@ -33,3 +33,12 @@ def test_export_jsonschema():
         expected_json_schema = file.read()
     print(expected_json_schema)
     assert response.text == expected_json_schema
+
+
+def test_metrics():
+    client.post(url="/lint", json="dataContractSpecification: 1.1.0")
+    response = client.get(url="/metrics")
+    assert response.status_code == 200
+    assert 'datacontract_api_request_duration_seconds_count{method="POST",path="/lint",status="200"}' in response.text
+    assert "datacontract_api_tests_in_progress 0.0" in response.text
+    assert 'datacontract_connection_pool_hits_total{pool="duckdb"}' in response.text
@@ -0,0 +1,91 @@
+import shutil
+import subprocess
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from datacontract.breaking.batch_breaking import (
+    batch_breaking_changes,
+    read_directory_contract_files,
+    read_git_contract_files,
+)
+from datacontract.breaking.breaking_change import Severity
+from datacontract.cli import app
+
+runner = CliRunner()
+
+FIXTURES = Path("fixtures/breaking")
+
+
+def write_contracts(directory: Path, version: str):
+    """Write a changed, an unchanged, a removed or added contract, and a file that is no data contract."""
+    directory.mkdir(parents=True, exist_ok=True)
+    shutil.copy(FIXTURES / f"datacontract-fields-{version}.yaml", directory / "orders.yaml")
+    unchanged = (FIXTURES / "datacontract-models-v1.yaml").read_text()
+    (directory / "unchanged.yaml").write_text(unchanged.replace("my-data-contract-id", "unchanged-id"))
+    other_id = "removed-id" if version == "v1" else "added-id"
+    (directory / "nested").mkdir(exist_ok=True)
+    (directory / "nested" / f"{other_id}.yaml").write_text(unchanged.replace("my-data-contract-id", other_id))
+    (directory / "dbt_project.yaml").write_text("name: my_project\n")
+
+
+def test_breaking_batch_directories(tmp_path):
+    write_contracts(tmp_path / "old", "v1")
+    write_contracts(tmp_path / "new", "v2")
+
+    result = runner.invoke(app, ["breaking-batch", str(tmp_path / "old"), str(tmp_path / "new")])
+
+    assert result.exit_code == 1
+    assert "16 breaking changes: 1 error, 15 warning\n" in result.stdout
+    assert "[contract_removed] at nested/removed-id.yaml" in result.stdout
+    assert "[field_type_added] at orders.yaml" in result.stdout
+    assert "contract_added" not in result.stdout
+
+
+def test_breaking_batch_changelog(tmp_path):
+    write_contracts(tmp_path / "old", "v1")
+    write_contracts(tmp_path / "new", "v2")
+
+    result = batch_breaking_changes(
+        read_directory_contract_files(tmp_path / "old"),
+        read_directory_contract_files(tmp_path / "new"),
+        include_severities=list(Severity),
+    )
+
+    check_names = [breaking_change.check_name for breaking_change in result.breaking_changes]
+    assert check_names.count("contract_added") == 1
+    assert check_names.count("contract_removed") == 1
+    assert not any(breaking_change.location.path == "unchanged.yaml" for breaking_change in result.breaking_changes)
+
+
+def test_breaking_batch_git(tmp_path):
+    def git(*args):
+        subprocess.run(
+            ["git", "-C", str(tmp_path), "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+            check=True,
+            capture_output=True,
+        )
+
+    git("init", "-q")
+    write_contracts(tmp_path / "contracts", "v1")
+    git("add", ".")
+    git("commit", "-q", "-m", "v1")
+    shutil.rmtree(tmp_path / "contracts")
+    write_contracts(tmp_path / "contracts", "v2")
+    git("add", "-A")
+    git("commit", "-q", "-m", "v2")
+
+    assert [contract_file.path for contract_file in read_git_contract_files("HEAD", tmp_path)] == [
+        "contracts/nested/added-id.yaml",
+        "contracts/orders.yaml",
+        "contracts/unchanged.yaml",
+    ]
+
+    result = runner.invoke(
+        app,
+        ["breaking-batch", "HEAD~1", "HEAD", "--git", "--repository", str(tmp_path), "--pattern", "contracts/*.yaml"],
+    )
+
+    assert result.exit_code == 1
+    assert "16 breaking changes: 1 error, 15 warning\n" in result.stdout
+    assert "[contract_removed] at contracts/nested/removed-id.yaml" in result.stdout
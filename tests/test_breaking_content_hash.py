@@ -0,0 +1,70 @@
+from datacontract.breaking.breaking import models_breaking_changes
+from datacontract.breaking.breaking_change import Severity
+from datacontract.breaking.content_hash import ContentHashes
+from datacontract.model.data_contract_specification import Field, Model
+
+ALL_SEVERITIES = [Severity.ERROR, Severity.WARNING, Severity.INFO]
+
+
+def to_models(order_type: str = "string", line_item_type: str = "string") -> dict[str, Model]:
+    return {
+        "orders": Model(
+            fields={
+                "order_id": Field(type=order_type, required=True),
+                "line_items": Field(
+                    type="array",
+                    items=Field(type="object", fields={"sku": Field(type=line_item_type)}),
+                ),
+            }
+        ),
+        "customers": Model(fields={"customer_id": Field(type="string", unique=True)}),
+    }
+
+
+def test_identical_nodes_have_the_same_hash():
+    content_hashes = ContentHashes()
+    old_models, new_models = to_models(), to_models()
+
+    assert content_hashes.same_model(old_models["orders"], new_models["orders"])
+    assert not content_hashes.same_model(old_models["orders"], to_models(line_item_type="long")["orders"])
+    assert not content_hashes.same_field(Field(type="string", config={"a": 1}), Field(type="string", config={"a": 2}))
+    assert not content_hashes.same_model(
+        Model(fields={"a": Field(type="string")}), Model(fields={"b": Field(type="string")})
+    )
+
+
+def test_only_changed_subtrees_are_reported():
+    changes = models_breaking_changes(
+        old_models=to_models(),
+        new_models=to_models(line_item_type="long"),
+        new_path="datacontract.yaml",
+        include_severities=ALL_SEVERITIES,
+    )
+
+    assert len(changes) == 1
+    assert changes[0].check_name == "field_type_updated"
+    assert changes[0].location.composition == [
+        "models",
+        "orders",
+        "fields",
+        "line_items",
+        "items",
+        "fields",
+        "sku",
+        "type",
+    ]
+
+
+def test_reordered_fields_are_no_change():
+    old_models = to_models()
+    new_models = to_models()
+    new_models["orders"].fields = dict(reversed(new_models["orders"].fields.items()))
+
+    changes = models_breaking_changes(
+        old_models=old_models,
+        new_models=new_models,
+        new_path="datacontract.yaml",
+        include_severities=ALL_SEVERITIES,
+    )
+
+    assert changes == []
@@ -0,0 +1,78 @@
+from datacontract.breaking.breaking import fields_breaking_changes
+from datacontract.breaking.breaking_change import Severity
+from datacontract.model.data_contract_specification import Field
+
+ALL_SEVERITIES = [Severity.ERROR, Severity.WARNING, Severity.INFO]
+
+
+def to_changes(old_fields: dict[str, Field], new_fields: dict[str, Field]) -> list[tuple[str, str, str]]:
+    changes = fields_breaking_changes(
+        old_fields=old_fields,
+        new_fields=new_fields,
+        new_path="datacontract.yaml",
+        composition=["models", "orders", "fields"],
+        include_severities=ALL_SEVERITIES,
+    )
+    return [(change.check_name, ".".join(change.location.composition[3:]), change.description) for change in changes]
+
+
+def test_identical_field_renamed():
+    old_fields = {"id": Field(type="string", required=True), "amount": Field(type="long")}
+    new_fields = {"order_id": Field(type="string", required=True), "amount": Field(type="long")}
+
+    assert to_changes(old_fields, new_fields) == [("field_renamed", "order_id", "renamed the field from `id`")]
+
+
+def test_field_with_same_ref_renamed_and_updated():
+    old_fields = {"id": Field(**{"$ref": "#/definitions/order_id"}, description="The id")}
+    new_fields = {"order_id": Field(**{"$ref": "#/definitions/order_id"}, description="The order id")}
+
+    assert to_changes(old_fields, new_fields) == [
+        ("field_renamed", "order_id", "renamed the field from `id`"),
+        ("field_description_updated", "order_id.description", "changed from `The id` to `The order id`"),
+    ]
+
+
+def test_nested_field_with_same_signature_renamed():
+    old_fields = {
+        "line_items": Field(
+            type="array",
+            items=Field(type="object", fields={"qty": Field(type="int", minimum=1), "sku": Field(type="string")}),
+        )
+    }
+    new_fields = {
+        "line_items": Field(
+            type="array",
+            items=Field(
+                type="object",
+                fields={"quantity": Field(type="int", minimum=1, description="Units"), "sku": Field(type="string")},
+            ),
+        )
+    }
+
+    assert to_changes(old_fields, new_fields) == [
+        ("field_renamed", "line_items.items.fields.quantity", "renamed the field from `qty`"),
+        ("field_description_added", "line_items.items.fields.quantity.description", "added with value: `Units`"),
+    ]
+
+
+def test_ambiguous_fields_are_removed_and_added():
+    old_fields = {"a": Field(type="string"), "b": Field(type="string")}
+    new_fields = {"c": Field(type="string"), "d": Field(type="string")}
+
+    assert to_changes(old_fields, new_fields) == [
+        ("field_added", "c", "added the field"),
+        ("field_added", "d", "added the field"),
+        ("field_removed", "a", "removed the field"),
+        ("field_removed", "b", "removed the field"),
+    ]
+
+
+def test_unrelated_fields_with_only_the_same_type_are_removed_and_added():
+    old_fields = {"email": Field(type="string", description="The email of the customer")}
+    new_fields = {"note": Field(type="string", description="A note for the delivery")}
+
+    assert to_changes(old_fields, new_fields) == [
+        ("field_added", "note", "added the field"),
+        ("field_removed", "email", "removed the field"),
+    ]
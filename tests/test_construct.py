@@ -0,0 +1,115 @@
+import re
+
+import pytest
+
+from datacontract import yaml_io
+from datacontract.data_contract import DataContract
+from datacontract.export.exporter import ExportFormat
+from datacontract.lint import resolve
+from datacontract.model.construct import construct_model, is_read_only
+from datacontract.model.data_contract_specification import DataContractSpecification
+
+
+def test_construct_model_equals_validated_model():
+    data = yaml_io.safe_load(open("fixtures/export/datacontract.yaml").read())
+    data["models"]["orders"]["fields"]["order_id"]["x-custom"] = "extra"
+    data["models"]["orders"]["fields"]["customer"] = {"$ref": "#/definitions/customer_id"}
+
+    constructed = construct_model(DataContractSpecification, data)
+    validated = DataContractSpecification(**data)
+
+    assert constructed == validated
+    assert constructed.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+    assert constructed.models["orders"].fields["customer"].ref == "#/definitions/customer_id"
+    assert constructed.models["orders"].fields["order_id"].model_extra["x-custom"] == "extra"
+    assert constructed.model_fields_set == validated.model_fields_set
+    assert (
+        constructed.models["orders"].fields["order_id"].model_fields_set
+        == validated.models["orders"].fields["order_id"].model_fields_set
+    )
+    assert constructed.to_yaml() == validated.to_yaml()
+
+
+def test_construct_model_does_not_share_containers():
+    data = {"models": {"orders": {"fields": {"order_id": {"type": "string", "tags": ["pii"]}}}}}
+
+    first = construct_model(DataContractSpecification, data)
+    first.models["orders"].fields["order_id"].tags.append("key")
+    first.models["orders"].fields["order_id"].enum.append("a")
+    second = construct_model(DataContractSpecification, data)
+
+    assert data["models"]["orders"]["fields"]["order_id"]["tags"] == ["pii"]
+    assert second.models["orders"].fields["order_id"].tags == ["pii"]
+    assert second.models["orders"].fields["order_id"].enum == []
+
+
+def test_strict_validation(monkeypatch):
+    monkeypatch.delenv("DATACONTRACT_STRICT_VALIDATION", raising=False)
+    assert not resolve.is_strict_validation()
+    assert resolve.is_strict_validation(strict=True)
+
+    monkeypatch.setenv("DATACONTRACT_STRICT_VALIDATION", "true")
+    assert resolve.is_strict_validation()
+    assert not resolve.is_strict_validation(strict=False)
+
+    data_contract_str = open("fixtures/export/datacontract.yaml").read()
+    strict = resolve.resolve_data_contract(data_contract_str=data_contract_str)
+    fast = resolve.resolve_data_contract(data_contract_str=data_contract_str, strict=False)
+    assert strict == fast
+
+
+def test_construct_read_only_model():
+    data = yaml_io.safe_load(open("fixtures/export/datacontract.yaml").read())
+
+    read_only = construct_model(DataContractSpecification, data, read_only=True)
+    assert read_only == construct_model(DataContractSpecification, data)
+    assert read_only.to_yaml() == DataContractSpecification(**data).to_yaml()
+
+    field = read_only.models["orders"].fields["order_id"]
+    with pytest.raises(TypeError, match="read-only"):
+        field.required = False
+    with pytest.raises(TypeError, match="read-only"):
+        field.tags.append("pii")
+    with pytest.raises(TypeError, match="read-only"):
+        read_only.models["orders"].fields["other"] = field
+
+    copy = read_only.model_copy(deep=True)
+    copy.models["orders"].fields["order_id"].required = False
+    copy.models["orders"].fields["order_id"].tags.append("pii")
+    assert field.required is True
+
+
+def test_resolve_read_only_with_definitions():
+    data_contract = resolve.resolve_data_contract(
+        "fixtures/lint/valid_datacontract_ref.yaml", inline_definitions=True, read_only=True
+    )
+
+    assert is_read_only(data_contract)
+    assert data_contract == resolve.resolve_data_contract(
+        "fixtures/lint/valid_datacontract_ref.yaml", inline_definitions=True
+    )
+
+
+def test_read_only_data_contract_with_enums_in_test_and_exports():
+    data_contract_file = "fixtures/local-json/datacontract.yaml"
+    read_only = DataContract(data_contract_file=data_contract_file, read_only=True)
+    mutable = DataContract(data_contract_file=data_contract_file)
+    assert any(
+        field.enum
+        for field in read_only.get_data_contract_specification().models["verbraucherpreisindex"].fields.values()
+    )
+
+    assert read_only.test().result == mutable.test().result
+
+    def export(data_contract, export_format):
+        try:
+            # without the time of the html export
+            return re.sub(r"\d\d:\d\d:\d\d UTC", "", data_contract.export(export_format))
+        except Exception as e:
+            # e.g., exports that need a server or an extra, which fail for both
+            return type(e)
+
+    for export_format in ExportFormat:
+        if export_format == ExportFormat.custom:
+            continue
+        assert export(read_only, export_format) == export(mutable, export_format), export_format
@@ -0,0 +1,30 @@
+from datacontract.data_contract import DataContract
+from datacontract.engines.soda.connections.duckdb_connection import (
+    disable_duckdb_connection_pool,
+    enable_duckdb_connection_pool,
+)
+
+
+def test_pooled_connection_is_reused():
+    pool = enable_duckdb_connection_pool(max_size=2)
+    try:
+        run = DataContract(data_contract_file="fixtures/parquet/datacontract.yaml").test()
+        assert run.result == "passed"
+        assert pool.size() == 1
+
+        run = DataContract(data_contract_file="fixtures/parquet/datacontract.yaml").test()
+        assert run.result == "passed"
+        assert pool.size() == 1
+        assert any(log.message.startswith("Reusing table") for log in run.logs)
+    finally:
+        disable_duckdb_connection_pool()
+
+
+def test_idle_connections_are_evicted():
+    pool = enable_duckdb_connection_pool(max_size=2, max_idle_seconds=0)
+    try:
+        DataContract(data_contract_file="fixtures/parquet/datacontract.yaml").test()
+        pool.evict_idle()
+        assert pool.size() == 0
+    finally:
+        disable_duckdb_connection_pool()
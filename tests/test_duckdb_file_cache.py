@@ -0,0 +1,29 @@
+import os
+
+import duckdb
+
+from datacontract.data_contract import DataContract
+from datacontract.engines.soda.connections.duckdb_connection import prune_cache_directory
+
+
+def test_object_cache_enabled_with_cache_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATACONTRACT_DUCKDB_CACHE_DIRECTORY", str(tmp_path))
+    con = duckdb.connect(database=":memory:")
+
+    run = DataContract(data_contract_file="fixtures/parquet/datacontract.yaml", duckdb_connection=con).test()
+
+    assert run.result == "passed"
+    assert con.sql("SELECT current_setting('enable_object_cache')").fetchone()[0] is True
+
+
+def test_prune_cache_directory(tmp_path):
+    for i in range(5):
+        file_path = tmp_path / "blocks" / f"block-{i}"
+        file_path.parent.mkdir(exist_ok=True)
+        file_path.write_bytes(b"x" * 100)
+        os.utime(file_path, (i, i))
+
+    prune_cache_directory(str(tmp_path), 250)
+
+    remaining = sorted(p.name for p in (tmp_path / "blocks").iterdir())
+    assert remaining == ["block-3", "block-4"]
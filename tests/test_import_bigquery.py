@@ -1,9 +1,14 @@
+import json
+import threading
+from types import SimpleNamespace
+
 import yaml
 from typer.testing import CliRunner
 
 from datacontract.cli import app
 from datacontract.data_contract import DataContract
-from datacontract.imports.bigquery_importer import import_bigquery_from_json
+from datacontract.imports import concurrent_fetch
+from datacontract.imports.bigquery_importer import import_bigquery_from_json, import_bigquery_tables
 
 # logging.basicConfig(level=logging.DEBUG, force=True)
 
@@ -46,3 +51,60 @@ def test_import_multiple_bigquery_schemas_with_different_types():
         expected = file.read()
     assert yaml.safe_load(result.to_yaml()) == yaml.safe_load(expected)
     assert DataContract(data_contract_str=expected).lint(enabled_linters="none").has_passed()
+
+
+class ServiceUnavailable(Exception):
+    code = 503
+
+
+class RecordedBigQueryClient:
+    """A bigquery client that serves recorded API responses, and fails the first request of a table once."""
+
+    def __init__(self, fixtures: list[str]):
+        self.tables = {}
+        for fixture in fixtures:
+            with open(fixture) as file:
+                api_repr = json.load(file)
+            self.tables[api_repr["tableReference"]["tableId"]] = api_repr
+        self.failed = set()
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def list_tables(self, dataset):
+        return [SimpleNamespace(table_id=table_id) for table_id in self.tables]
+
+    def get_table(self, table_ref):
+        table_id = table_ref.split(".")[-1]
+        with self.lock:
+            self.requests.append(table_id)
+            if table_id not in self.failed:
+                self.failed.add(table_id)
+                raise ServiceUnavailable("rate limit exceeded")
+        return SimpleNamespace(to_api_repr=lambda: self.tables[table_id])
+
+
+def test_import_bigquery_dataset_concurrently(monkeypatch):
+    monkeypatch.setattr(concurrent_fetch.time, "sleep", lambda seconds: None)
+    client = RecordedBigQueryClient(
+        [
+            "fixtures/bigquery/import/multi_import_table.json",
+            "fixtures/bigquery/import/multi_import_external_table.json",
+            "fixtures/bigquery/import/multi_import_snapshot.json",
+            "fixtures/bigquery/import/multi_import_view.json",
+            "fixtures/bigquery/import/multi_import_materialized_view.json",
+        ]
+    )
+
+    result = import_bigquery_tables(
+        DataContract().import_from_source("bigquery", "fixtures/bigquery/import/multi_import_table.json"),
+        client,
+        "bigquery-test-423213",
+        "test_dataset",
+    )
+
+    with open("fixtures/bigquery/import/datacontract_multi_import.yaml") as file:
+        expected = file.read()
+    assert yaml.safe_load(result.to_yaml()) == yaml.safe_load(expected)
+    assert list(result.models) == list(client.tables)
+    # each table is requested twice, as the first request fails
+    assert sorted(client.requests) == sorted(list(client.tables) * 2)
@@ -1,8 +1,11 @@
+import duckdb
+import pytest
 import yaml
 from typer.testing import CliRunner
 
 from datacontract.cli import app
 from datacontract.data_contract import DataContract
+from datacontract.model.exceptions import DataContractException
 
 # logging.basicConfig(level=logging.DEBUG, force=True)
 
@@ -54,3 +57,80 @@ models:
     assert yaml.safe_load(result.to_yaml()) == yaml.safe_load(expected)
     # Disable linters so we don't get "missing description" warnings
     assert DataContract(data_contract_str=expected).lint(enabled_linters=set()).has_passed()
+
+
+def test_import_csv_sample_with_profile():
+    result = DataContract().import_from_source("csv", csv_file_path, csv_sample_size=4, csv_profile=True)
+
+    fields = yaml.safe_load(result.to_yaml())["models"]["sample_data"]["fields"]
+    assert fields["field_one"] == {
+        "type": "string",
+        "required": True,
+        "minLength": 9,
+        "maxLength": 9,
+        "config": {"nullRate": 0.0, "distinctCountEstimate": 10},
+    }
+    assert fields["field_two"] == {
+        "type": "integer",
+        "required": True,
+        "minimum": 14,
+        "maximum": 89,
+        "config": {"nullRate": 0.0, "distinctCountEstimate": 10},
+    }
+
+
+def test_import_csv_with_duckdb():
+    result = DataContract().import_from_source("csv", csv_file_path, csv_type_inference="duckdb")
+
+    fields = yaml.safe_load(result.to_yaml())["models"]["sample_data"]["fields"]
+    assert fields == {
+        "field_one": {"type": "string"},
+        "field_two": {"type": "long"},
+        "field_three": {"type": "timestamp_ntz"},
+    }
+
+
+def test_import_csv_sample_of_large_file(tmp_path):
+    source = tmp_path / "large.csv"
+    with open(source, "w") as file:
+        file.write("id;amount;comment\n")
+        for i in range(100_000):
+            # quoted values that span several lines, which random chunks may start in
+            file.write(f'{i};{i / 4};"note\nof {i}"\n')
+
+    result = DataContract().import_from_source("csv", str(source), csv_sample_size=1000, csv_profile=True)
+
+    fields = result.models["large"].fields
+    assert result.servers["production"].delimiter == ";"
+    assert [field.type for field in fields.values()] == ["integer", "float", "string"]
+    assert (fields["id"].minimum, fields["id"].maximum) == (0, 99_999)
+    assert fields["comment"].config["nullRate"] == 0.0
+
+
+def test_import_csv_profile_with_empty_and_duplicate_headers(tmp_path):
+    source = tmp_path / "headers.csv"
+    source.write_text("id,,id\n1,a,2\n3,,4\n")
+
+    for type_inference in ["pandas", "duckdb"]:
+        result = DataContract().import_from_source(
+            "csv", str(source), csv_type_inference=type_inference, csv_profile=True
+        )
+
+        fields = list(result.models["headers"].fields.values())
+        assert [(field.minimum, field.maximum) for field in (fields[0], fields[2])] == [(1, 3), (2, 4)]
+        assert fields[1].config["nullRate"] == 0.5
+
+
+def test_import_csv_with_duckdb_and_latin_1(tmp_path):
+    source = tmp_path / "latin_1.csv"
+    source.write_bytes(
+        "id,name\n".encode() + "".join(f"{i},Ren\xe9e \xc9l\xe9onore\n" for i in range(100)).encode("latin-1")
+    )
+
+    if tuple(int(part) for part in duckdb.__version__.split(".")[:2]) < (1, 1):
+        # DuckDB reads other encodings than utf-8 since 1.1
+        with pytest.raises(DataContractException, match="encoding"):
+            DataContract().import_from_source("csv", str(source), csv_type_inference="duckdb")
+    else:
+        result = DataContract().import_from_source("csv", str(source), csv_type_inference="duckdb", csv_profile=True)
+        assert result.models["latin_1"].fields["name"].maxLength == len("Ren\xe9e \xc9l\xe9onore")
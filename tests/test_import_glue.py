@@ -194,3 +194,45 @@ def test_import_glue_schema_with_non_existent_glue_table_filter(setup_mock_glue)
     assert yaml.safe_load(result.to_yaml()) == yaml.safe_load(expected)
     # Disable linters so we don't get "missing description" warnings
     assert DataContract(data_contract_str=expected).lint(enabled_linters=set()).has_passed()
+
+
+@mock_aws
+def test_import_glue_many_tables_with_one_client(setup_mock_glue, monkeypatch):
+    for index in range(150):
+        setup_mock_glue.create_table(
+            DatabaseName=db_name,
+            TableInput={
+                "Name": f"table_{index}",
+                "StorageDescriptor": {"Columns": [{"Name": "id", "Type": "bigint"}]},
+            },
+        )
+
+    clients = []
+    operations = []
+    create_client = boto3.client
+
+    def client(*args, **kwargs):
+        glue = create_client(*args, **kwargs)
+        glue.meta.events.register(
+            "before-call.glue.*", lambda model, **kwargs: operations.append(model.name), unique_id="count"
+        )
+        clients.append(glue)
+        return glue
+
+    monkeypatch.setattr(boto3, "client", client)
+
+    result = DataContract().import_from_source("glue", db_name)
+
+    assert len(result.models) == 151
+    assert result.models["table_42"].fields["id"].type == "bigint"
+    assert result.models[table_name].fields["part_one"].required
+    assert len(clients) == 1
+    # the columns are part of the paginated GetTables responses, so no request per table
+    assert set(operations) == {"GetDatabase", "GetTables"}
+
+    operations.clear()
+    result = DataContract().import_from_source("glue", db_name, glue_table=["table_1", "table_2", "table_3"])
+
+    assert list(result.models) == ["table_1", "table_2", "table_3"]
+    assert len(clients) == 2
+    assert sorted(operations) == ["GetDatabase", "GetTable", "GetTable", "GetTable"]
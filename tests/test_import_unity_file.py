@@ -1,8 +1,13 @@
+import json
+from types import SimpleNamespace
+
 import yaml
+from databricks.sdk.service.catalog import TableInfo
 from typer.testing import CliRunner
 
 from datacontract.cli import app
 from datacontract.data_contract import DataContract
+from datacontract.imports.unity_importer import import_unity_schema_from_api
 
 # logging.basicConfig(level=logging.DEBUG, force=True)
 
@@ -63,3 +68,51 @@ def test_import_unity_complex_types():
     print("Result:\n", result.to_yaml())
     assert yaml.safe_load(result.to_yaml()) == yaml.safe_load(expected)
     assert DataContract(data_contract_str=expected).lint(enabled_linters="none").has_passed()
+
+
+class RecordedTablesAPI:
+    """The tables API of a workspace client that serves recorded API responses."""
+
+    def __init__(self, fixtures: dict[str, str]):
+        self.tables = {}
+        for name, fixture in fixtures.items():
+            with open(fixture) as file:
+                table_info = TableInfo.from_dict(json.load(file))
+            table_info.name = name
+            table_info.full_name = f"{table_info.catalog_name}.{table_info.schema_name}.{name}"
+            self.tables[table_info.full_name] = table_info
+        self.requested = []
+
+    def list(self, catalog_name, schema_name):
+        # the first table is listed without columns, so that it is fetched
+        listed = [TableInfo.from_dict(table_info.as_dict()) for table_info in self.tables.values()]
+        listed[0].columns = None
+        return iter(listed)
+
+    def get(self, full_name):
+        self.requested.append(full_name)
+        return self.tables[full_name]
+
+
+def test_import_unity_schema_concurrently():
+    tables_api = RecordedTablesAPI(
+        {
+            "test_table": "fixtures/databricks-unity/import/unity_table_schema.json",
+            "test_table_complex_types": "fixtures/databricks-unity/import/unity_table_schema_complex_types.json",
+        }
+    )
+
+    result = import_unity_schema_from_api(
+        DataContract.init(template=None), "my_catalog.my_schema", SimpleNamespace(tables=tables_api)
+    )
+
+    with open("fixtures/databricks-unity/import/datacontract.yaml") as file:
+        expected = yaml.safe_load(file)
+    with open("fixtures/databricks-unity/import/datacontract_complex_types.yaml") as file:
+        expected_complex_types = yaml.safe_load(file)
+    expected_complex_types["models"]["test_table"]["title"] = "test_table_complex_types"
+    models = yaml.safe_load(result.to_yaml())["models"]
+    assert list(models) == ["test_table", "test_table_complex_types"]
+    assert models["test_table"] == expected["models"]["test_table"]
+    assert models["test_table_complex_types"] == expected_complex_types["models"]["test_table"]
+    assert tables_api.requested == [next(iter(tables_api.tables))]
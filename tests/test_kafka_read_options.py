@@ -0,0 +1,75 @@
+import json
+
+from datacontract.engines.soda.connections import kafka
+from datacontract.engines.soda.connections.kafka import KafkaReadOptions, to_epoch_millis, to_offset_range
+from datacontract.model.data_contract_specification import Server
+
+server = Server(type="kafka", host="localhost:9092", topic="orders", format="json")
+
+
+def test_reads_whole_topic_by_default(monkeypatch):
+    for name in [
+        "DATACONTRACT_KAFKA_MAX_MESSAGES_PER_PARTITION",
+        "DATACONTRACT_KAFKA_START_TIMESTAMP",
+        "DATACONTRACT_KAFKA_END_TIMESTAMP",
+        "DATACONTRACT_KAFKA_MAX_AGE",
+        "DATACONTRACT_KAFKA_STARTING_OFFSETS",
+        "DATACONTRACT_KAFKA_ENDING_OFFSETS",
+        "DATACONTRACT_KAFKA_MIN_PARTITIONS",
+    ]:
+        monkeypatch.delenv(name, raising=False)
+    assert KafkaReadOptions.from_env().to_spark_options(server) == {"startingOffsets": "earliest"}
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.setenv("DATACONTRACT_KAFKA_MAX_MESSAGES_PER_PARTITION", "1000")
+    monkeypatch.setenv("DATACONTRACT_KAFKA_START_TIMESTAMP", "2025-01-01T00:00:00")
+    monkeypatch.setenv("DATACONTRACT_KAFKA_END_TIMESTAMP", "1735693200000")
+    monkeypatch.setenv("DATACONTRACT_KAFKA_MAX_AGE", "PT1H")
+    monkeypatch.setenv("DATACONTRACT_KAFKA_MIN_PARTITIONS", "16")
+    read_options = KafkaReadOptions.from_env()
+    assert read_options == KafkaReadOptions(
+        max_messages_per_partition=1000,
+        start_timestamp=1735689600000,
+        end_timestamp=1735693200000,
+        max_age_seconds=3600,
+        min_partitions=16,
+    )
+
+
+def test_time_window():
+    read_options = KafkaReadOptions(start_timestamp=1735689600000, end_timestamp=1735693200000, min_partitions=8)
+    assert read_options.to_spark_options(server) == {
+        "startingOffsets": "earliest",
+        "startingTimestamp": "1735689600000",
+        "endingTimestamp": "1735693200000",
+        "minPartitions": "8",
+    }
+
+
+def test_explicit_offsets_take_precedence():
+    read_options = KafkaReadOptions(
+        max_messages_per_partition=10,
+        starting_offsets='{"orders":{"0":5}}',
+        ending_offsets='{"orders":{"0":50}}',
+    )
+    assert read_options.to_spark_options(server) == {
+        "startingOffsets": '{"orders":{"0":5}}',
+        "endingOffsets": '{"orders":{"0":50}}',
+    }
+
+
+def test_last_messages_per_partition(monkeypatch):
+    def get_partition_offset_ranges(server, read_options):
+        return {0: to_offset_range(0, 5000, 100), 1: to_offset_range(40, 90, 100)}
+
+    monkeypatch.setattr(kafka, "get_partition_offset_ranges", get_partition_offset_ranges)
+    options = KafkaReadOptions(max_messages_per_partition=100).to_spark_options(server)
+    assert json.loads(options["startingOffsets"]) == {"orders": {"0": 4900, "1": 40}}
+    assert json.loads(options["endingOffsets"]) == {"orders": {"0": 5000, "1": 90}}
+
+
+def test_to_epoch_millis():
+    assert to_epoch_millis(None) is None
+    assert to_epoch_millis("1735689600000") == 1735689600000
+    assert to_epoch_millis("2025-01-01T01:00:00+01:00") == 1735689600000
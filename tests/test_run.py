@@ -0,0 +1,60 @@
+from datacontract.model.run import Check, ResultEnum, Run
+
+
+def test_get_check_by_key_and_id():
+    run = Run.create_run()
+    run.add_checks(
+        [Check(id=str(i), key=f"orders__field_{i}__field_is_present", type="field_is_present") for i in range(100)]
+    )
+    # checks appended directly are indexed as well
+    run.checks.append(Check(id="direct", key="orders__direct", type="field_is_present"))
+
+    assert run.get_check_by_key("orders__field_42__field_is_present").id == "42"
+    assert run.get_check_by_id("7").key == "orders__field_7__field_is_present"
+    assert run.get_check_by_key("orders__direct").id == "direct"
+    assert run.get_check_by_key("unknown") is None
+
+
+def test_get_check_by_key_after_checks_replaced():
+    run = Run.create_run()
+    run.add_check(Check(key="a", type="custom"))
+    run.checks = [Check(key="b", type="custom")]
+
+    assert run.get_check_by_key("a") is None
+    assert run.get_check_by_key("b") is not None
+
+
+def test_calculate_result():
+    run = Run.create_run()
+    run.calculate_result()
+    assert run.result == ResultEnum.unknown
+
+    run.add_check(Check(type="custom", result=ResultEnum.info))
+    run.calculate_result()
+    assert run.result == ResultEnum.unknown
+
+    run.add_check(Check(type="custom", result=ResultEnum.passed))
+    run.add_check(Check(type="custom", result=ResultEnum.warning))
+    run.calculate_result()
+    assert run.result == ResultEnum.warning
+
+    run.add_check(Check(type="custom", result=ResultEnum.error))
+    run.add_check(Check(type="custom", result=ResultEnum.failed))
+    run.calculate_result()
+    assert run.result == ResultEnum.error
+
+
+def test_merge_metrics():
+    run = Run.create_run()
+    server_run = Run.create_run()
+    with server_run.timed("execute"):
+        pass
+    server_run.add_model_metrics("orders", 1.5, rows_scanned=10, bytes_read=100)
+    run.add_phase_time("execute", 1)
+
+    run.merge_metrics(server_run, prefix="production")
+
+    assert run.metrics.phases["execute"] > 1
+    assert run.metrics.models["production.orders"].durationSeconds == 1.5
+    assert run.metrics.models["production.orders"].rowsScanned == 10
+    assert run.metrics.models["production.orders"].bytesRead == 100
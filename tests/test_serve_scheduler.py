@@ -0,0 +1,89 @@
+import os
+import shutil
+
+from typer.testing import CliRunner
+
+from datacontract.cli import app
+from datacontract.scheduler.contract_scheduler import ContractScheduler
+
+
+def copy_contracts(tmp_path):
+    shutil.copy("fixtures/parquet/datacontract.yaml", tmp_path / "combined.yaml")
+    os.makedirs(tmp_path / "types")
+    shutil.copy("fixtures/parquet/datacontract_string.yaml", tmp_path / "types" / "string.yaml")
+
+
+def test_cli(tmp_path):
+    copy_contracts(tmp_path)
+    runner = CliRunner()
+    result = runner.invoke(
+        app,
+        [
+            "serve-scheduler",
+            str(tmp_path),
+            "--once",
+            "--output-format",
+            "junit",
+            "--output",
+            str(tmp_path / "results"),
+        ],
+    )
+    assert result.exit_code == 0
+    assert (tmp_path / "results" / "TEST-combined.xml").exists()
+    assert (tmp_path / "results" / "TEST-types_string.xml").exists()
+
+
+def test_cli_failed(tmp_path):
+    shutil.copy("fixtures/parquet/datacontract_invalid.yaml", tmp_path / "invalid.yaml")
+    runner = CliRunner()
+    result = runner.invoke(app, ["serve-scheduler", str(tmp_path), "--once"])
+    assert result.exit_code == 1
+
+
+def test_contracts_are_tested_on_their_interval(tmp_path):
+    copy_contracts(tmp_path)
+    scheduler = ContractScheduler(tmp_path, interval_seconds=3600)
+    try:
+        runs = scheduler.run_once()
+        assert [run.result for run in runs] == ["passed", "passed"]
+        # not due again until the interval has passed
+        assert scheduler.run_pending() == []
+    finally:
+        scheduler.shutdown()
+
+
+def test_changed_contracts_are_reloaded(tmp_path):
+    copy_contracts(tmp_path)
+    scheduler = ContractScheduler(tmp_path, interval_seconds=0)
+    try:
+        scheduler.run_once()
+        data_contract = scheduler.contracts[tmp_path / "combined.yaml"].data_contract
+        scheduler.run_once()
+        assert scheduler.contracts[tmp_path / "combined.yaml"].data_contract is data_contract
+
+        os.remove(tmp_path / "types" / "string.yaml")
+        contract_file = tmp_path / "combined.yaml"
+        contract_file.write_text(contract_file.read_text().replace("version: 1.0.0", "version: 2.0.0"))
+        os.utime(contract_file, (0, 0))
+        runs = scheduler.run_once()
+        assert [run.dataContractVersion for run in runs] == ["2.0.0"]
+    finally:
+        scheduler.shutdown()
+
+
+def test_interval_from_servicelevels(tmp_path):
+    contract_file = tmp_path / "datacontract.yaml"
+    contract_file.write_text(
+        open("fixtures/parquet/datacontract.yaml").read()
+        + """
+servicelevels:
+  frequency:
+    interval: 1h
+"""
+    )
+    scheduler = ContractScheduler(tmp_path, interval_seconds=60)
+    try:
+        scheduler.load_contracts()
+        assert scheduler.contracts[contract_file].interval_seconds == 3600
+    finally:
+        scheduler.shutdown()
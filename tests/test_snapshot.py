@@ -0,0 +1,54 @@
+import datetime
+
+import pytest
+from typer.testing import CliRunner
+
+from datacontract import snapshot
+from datacontract.cli import app
+from datacontract.data_contract import DataContract
+from datacontract.lint import resolve
+from datacontract.model.exceptions import DataContractException
+
+
+def test_snapshot_round_trip():
+    data_contract_str = open("fixtures/export/datacontract.yaml").read()
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_str, inline_definitions=True)
+    data_contract.models["orders"].examples = [{"order_date": datetime.date(2024, 1, 31)}]
+
+    content = snapshot.dumps_snapshot(data_contract, data_contract_str, "datacontract.yaml")
+    loaded = snapshot.loads_snapshot(content)
+
+    assert loaded == data_contract
+    assert loaded.to_yaml() == data_contract.to_yaml()
+    assert loaded.models["orders"].examples[0]["order_date"] == datetime.date(2024, 1, 31)
+    assert snapshot.read_snapshot_header(content).source_location == "datacontract.yaml"
+
+
+def test_snapshot_integrity():
+    data_contract_str = open("fixtures/export/datacontract.yaml").read()
+    data_contract = resolve.resolve_data_contract(data_contract_str=data_contract_str)
+    content = snapshot.dumps_snapshot(data_contract, data_contract_str)
+
+    with pytest.raises(DataContractException, match="digest"):
+        snapshot.loads_snapshot(content[:-1] + bytes([content[-1] ^ 1]))
+    with pytest.raises(DataContractException, match="not a data contract snapshot"):
+        snapshot.loads_snapshot(data_contract_str.encode("utf-8"))
+
+
+def test_compile_cli(tmp_path):
+    runner = CliRunner()
+    result = runner.invoke(app, ["compile", "fixtures/export/datacontract.yaml", "--output", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "compiled" in result.stdout
+
+    snapshot_location = tmp_path / "datacontract.dcsnap"
+    assert snapshot.is_snapshot_current(snapshot_location, open("fixtures/export/datacontract.yaml").read())
+    result = runner.invoke(app, ["compile", "fixtures/export/datacontract.yaml", "--output", str(tmp_path)])
+    assert result.exit_code == 0
+    # rich may wrap the output, as the path is long
+    assert "up to date" in " ".join(result.stdout.split())
+
+    loaded = DataContract(data_contract_file=str(snapshot_location)).get_data_contract_specification()
+    assert (
+        loaded == DataContract(data_contract_file="fixtures/export/datacontract.yaml").get_data_contract_specification()
+    )
@@ -0,0 +1,42 @@
+import json
+
+from datacontract import telemetry
+from datacontract.data_contract import DataContract
+from datacontract.telemetry import configure_tracing
+
+
+def test_traces_file(tmp_path, monkeypatch):
+    traces_file = tmp_path / "traces.json"
+    monkeypatch.setenv("DATACONTRACT_OTEL_TRACES_EXPORTER", "file")
+    monkeypatch.setenv("DATACONTRACT_OTEL_TRACES_FILE", str(traces_file))
+    try:
+        assert configure_tracing()
+        run = DataContract(data_contract_file="fixtures/parquet/datacontract.yaml").test()
+        assert run.result == "passed"
+        DataContract(data_contract_file="fixtures/parquet/datacontract.yaml").export("jsonschema")
+        (span_processor,) = telemetry._provider._active_span_processor._span_processors
+        traces_file_handle = span_processor.span_exporter.out
+    finally:
+        monkeypatch.delenv("DATACONTRACT_OTEL_TRACES_EXPORTER")
+        configure_tracing()
+
+    assert traces_file_handle.closed
+
+    spans = [json.loads(line) for line in traces_file.read_text().splitlines()]
+    span_names = [span["name"] for span in spans]
+    for span_name in [
+        "datacontract.test",
+        "datacontract.resolve",
+        "datacontract.test.server",
+        "datacontract.engine.soda",
+        "datacontract.connect",
+        "datacontract.export",
+    ]:
+        assert span_name in span_names
+    connect_span = next(span for span in spans if span["name"] == "datacontract.connect")
+    assert connect_span["attributes"]["server_type"] == "local"
+
+
+def test_tracing_disabled(monkeypatch):
+    monkeypatch.delenv("DATACONTRACT_OTEL_TRACES_EXPORTER", raising=False)
+    assert not configure_tracing()
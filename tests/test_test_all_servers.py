@@ -0,0 +1,59 @@
+import threading
+import time
+
+from typer.testing import CliRunner
+
+from datacontract.cli import app
+from datacontract.data_contract import DataContract
+
+runner = CliRunner()
+
+
+def test_cli_all_servers():
+    result = runner.invoke(app, ["test", "--server", "all", "./fixtures/all-servers/datacontract.yaml"])
+    assert result.exit_code == 1
+    assert "development" in result.stdout
+
+
+def test_all_servers():
+    run = DataContract(data_contract_file="fixtures/all-servers/datacontract.yaml", server="all").test()
+
+    assert run.result == "failed"
+    assert {check.server for check in run.checks} == {"production", "staging", "development"}
+    assert all(check.result == "passed" for check in run.checks if check.server in ["production", "staging"])
+    assert any(check.result == "failed" for check in run.checks if check.server == "development")
+
+
+def test_all_servers_timeout(monkeypatch):
+    from concurrent.futures import wait
+
+    from datacontract.engines import data_contract_test
+
+    check_soda_execute = data_contract_test.check_soda_execute
+
+    def slow_check_soda_execute(run, data_contract, server, *args):
+        if server.path.endswith("string.parquet"):
+            time.sleep(10)
+        check_soda_execute(run, data_contract, server, *args)
+
+    monkeypatch.setattr(data_contract_test, "check_soda_execute", slow_check_soda_execute)
+    waits = []
+
+    def counting_wait(*args, **kwargs):
+        waits.append(kwargs.get("timeout"))
+        return wait(*args, **kwargs)
+
+    monkeypatch.setattr(data_contract_test, "wait", counting_wait)
+
+    run = DataContract(
+        data_contract_file="fixtures/all-servers/datacontract.yaml", server="all", server_timeout=4
+    ).test()
+
+    timed_out = [check for check in run.checks if check.server == "development"]
+    assert len(timed_out) == 1
+    assert timed_out[0].result == "error"
+    assert all(check.result == "passed" for check in run.checks if check.server in ["production", "staging"])
+    # finished servers do not shorten the timeout of the others
+    assert len(waits) < 10
+    # the test that timed out does not keep the process alive
+    assert all(thread.daemon for thread in threading.enumerate() if thread.name == "datacontract-test")
@@ -0,0 +1,104 @@
+from typer.testing import CliRunner
+
+from datacontract.cli import app
+from datacontract.data_contract import DataContract
+
+datacontract = "fixtures/duckdb-engine/datacontract.yaml"
+
+
+def read_datacontract():
+    with open(datacontract) as file:
+        return file.read()
+
+
+def test_cli():
+    runner = CliRunner()
+    result = runner.invoke(app, ["test", "--engine", "duckdb", datacontract])
+    assert result.exit_code == 0
+
+
+def test_duckdb_engine():
+    run = DataContract(data_contract_file=datacontract, engine="duckdb").test()
+    print(run.pretty())
+    assert run.result == "passed"
+    assert all(check.engine == "duckdb" for check in run.checks if check.key is not None)
+    assert len([check for check in run.checks if check.type == "model_quality_sql"]) == 1
+
+
+def test_duckdb_engine_same_checks_as_soda():
+    soda_run = DataContract(data_contract_file=datacontract).test()
+    duckdb_run = DataContract(data_contract_file=datacontract, engine="duckdb").test()
+    assert {(check.key, check.result) for check in duckdb_run.checks} == {
+        (check.key, check.result) for check in soda_run.checks
+    }
+
+
+def test_duckdb_engine_failed():
+    data_contract_str = (
+        read_datacontract()
+        .replace("maxLength: 7", "maxLength: 5")
+        .replace("minimum: 100", "minimum: 150")
+        .replace("type: timestamp_tz", "type: date")
+        .replace("mustBe: 600", "mustBe: 500")
+    )
+    run = DataContract(data_contract_str=data_contract_str, engine="duckdb").test()
+    print(run.pretty())
+    assert run.result == "failed"
+    failed = {check.key: check for check in run.checks if check.result == "failed"}
+    assert set(failed) == {
+        "combined__string_field__field_max_length",
+        "combined__integer_field__field_minimum",
+        "combined__timestamp_field__field_type",
+        "combined__integer_field__quality_sql_0",
+    }
+    assert failed["combined__string_field__field_max_length"].reason == "Found 1 values longer than 5"
+    assert failed["combined__integer_field__field_minimum"].diagnostics["value"] == 1
+    assert failed["combined__timestamp_field__field_type"].reason == (
+        "Type Mismatch, Expected Type: DATE; Actual Type: TIMESTAMP WITH TIME ZONE"
+    )
+
+
+def test_duckdb_engine_servicelevels():
+    data_contract_str = (
+        read_datacontract()
+        + """
+servicelevels:
+  freshness:
+    threshold: 1d
+    timestampField: combined.timestamp_field
+  retention:
+    period: P100Y
+    timestampField: combined.timestamp_field
+"""
+    )
+    run = DataContract(data_contract_str=data_contract_str, engine="duckdb").test()
+    print(run.pretty())
+    checks = {check.key: check for check in run.checks}
+    assert checks["servicelevel_freshness"].result == "failed"
+    assert checks["servicelevel_freshness"].diagnostics["value"] == "2024-01-03T00:00:00+00:00"
+    assert checks["servicelevel_retention"].result == "passed"
+
+
+def test_duckdb_engine_falls_back_to_soda():
+    data_contract_str = (
+        read_datacontract()
+        + """
+quality:
+  type: SodaCL
+  specification:
+    checks for combined:
+      - row_count = 3
+"""
+    )
+    run = DataContract(data_contract_str=data_contract_str, engine="duckdb").test()
+    print(run.pretty())
+    assert run.result == "passed"
+    sodacl_check = next(check for check in run.checks if check.key == "quality__sodacl")
+    assert sodacl_check.engine == "soda"
+    assert next(check for check in run.checks if check.name == "row_count = 3").result == "passed"
+
+
+def test_unsupported_engine():
+    run = DataContract(data_contract_file=datacontract, engine="unknown").test()
+    assert run.result == "error"
+    assert run.checks[0].reason == "Engine unknown is not supported, use soda or duckdb"
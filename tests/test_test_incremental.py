@@ -0,0 +1,75 @@
+import json
+
+import duckdb
+
+from datacontract.data_contract import DataContract
+from datacontract.engines.incremental import IncrementalTest
+
+DATA_CONTRACT = """
+dataContractSpecification: 1.1.0
+id: orders-incremental
+info:
+  title: Orders
+  version: 1.0.0
+servers:
+  local:
+    type: local
+    path: {path}/**/*.parquet
+    format: parquet
+models:
+  orders:
+    type: table
+    fields:
+      order_id:
+        type: long
+        required: true
+      dt:
+        type: long
+"""
+
+
+def write_partitions(path, days):
+    con = duckdb.connect()
+    for day in days:
+        con.sql(
+            f"COPY (SELECT range AS order_id, {day} AS dt FROM range(10)) TO '{path}' (FORMAT PARQUET, PARTITION_BY (dt), OVERWRITE_OR_IGNORE true, FILENAME_PATTERN 'orders_{day}_{{i}}')"
+        )
+
+
+def test_partition_filter(tmp_path):
+    write_partitions(tmp_path / "orders", [20250101, 20250102, 20250103])
+    con = duckdb.connect()
+
+    run = DataContract(
+        data_contract_str=DATA_CONTRACT.format(path=tmp_path / "orders"),
+        duckdb_connection=con,
+        incremental=IncrementalTest(partition_filter="dt >= 20250102", state_file=str(tmp_path / "state.json")),
+    ).test()
+
+    assert run.result == "passed"
+    assert con.sql("SELECT count(*) FROM orders").fetchone()[0] == 20
+    # only some partitions are read, so the total size of the files is not reported
+    assert run.metrics.models["orders"].bytesRead is None
+
+
+def test_incremental_watermark(tmp_path):
+    write_partitions(tmp_path / "orders", [20250101, 20250102])
+    state_file = tmp_path / "state.json"
+
+    run = DataContract(
+        data_contract_str=DATA_CONTRACT.format(path=tmp_path / "orders"),
+        incremental=IncrementalTest(watermark_column="dt", state_file=str(state_file)),
+    ).test()
+    assert run.result == "passed"
+    assert json.loads(state_file.read_text()) == {"orders-incremental/local/orders": 20250102}
+
+    write_partitions(tmp_path / "orders", [20250103])
+    con = duckdb.connect()
+    run = DataContract(
+        data_contract_str=DATA_CONTRACT.format(path=tmp_path / "orders"),
+        duckdb_connection=con,
+        incremental=IncrementalTest(watermark_column="dt", state_file=str(state_file)),
+    ).test()
+    assert run.result == "passed"
+    assert con.sql("SELECT count(*) FROM orders").fetchone()[0] == 20
+    assert json.loads(state_file.read_text()) == {"orders-incremental/local/orders": 20250103}
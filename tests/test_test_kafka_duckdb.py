@@ -0,0 +1,105 @@
+import io
+import struct
+from datetime import datetime, timezone
+
+import avro.io
+import avro.schema
+import pytest
+
+from datacontract.data_contract import DataContract
+from datacontract.engines.soda.connections import kafka
+from datacontract.export.avro_converter import to_avro_schema_json
+from datacontract.lint.resolve import resolve_data_contract
+
+
+@pytest.fixture
+def kafka_messages(monkeypatch):
+    """Replace the Kafka broker with recorded messages in a single partition."""
+    messages = []
+
+    def get_partition_offset_ranges(server, read_options):
+        return {0: (0, len(messages))}
+
+    def consume_kafka_messages(server, offset_ranges, batch_size=10000):
+        for i in range(0, len(messages), 2):
+            yield messages[i : i + 2]
+
+    monkeypatch.setattr(kafka, "get_partition_offset_ranges", get_partition_offset_ranges)
+    monkeypatch.setattr(kafka, "consume_kafka_messages", consume_kafka_messages)
+    monkeypatch.setattr(kafka, "create_spark_session", lambda: pytest.fail("Spark must not be used"))
+    return messages
+
+
+def test_kafka_json(kafka_messages, monkeypatch):
+    monkeypatch.setenv("DATACONTRACT_KAFKA_READER", "python")
+    with open("fixtures/kafka/data/messages.json", "rb") as messages_file:
+        kafka_messages.extend(line.strip() for line in messages_file)
+    with open("fixtures/kafka/datacontract.yaml") as data_contract_file:
+        data_contract_str = data_contract_file.read().replace("__KAFKA_HOST__", "localhost:9092")
+
+    run = DataContract(data_contract_str=data_contract_str, engine="duckdb").test()
+
+    print(run.pretty())
+    assert run.result == "passed"
+    assert any(check.engine == "duckdb" for check in run.checks)
+    assert any(check.name == "row_count >= 10" and check.result == "passed" for check in run.checks)
+
+
+def test_kafka_json_invalid_message(kafka_messages):
+    kafka_messages.extend(
+        [
+            b'{"updated_at":"2022-04-20T13:50:34Z","available":17,"location":"18","sku":"9521582929054"}',
+            b"not json",
+        ]
+    )
+    data_contract_str = """
+dataContractSpecification: 1.1.0
+id: inventory-events
+info:
+  title: Inventory Events
+  version: 0.0.1
+servers:
+  production:
+    type: kafka
+    topic: inventory-events
+    host: localhost:9092
+    format: json
+models:
+  inventory:
+    fields:
+      sku:
+        type: string
+        required: true
+"""
+
+    run = DataContract(data_contract_str=data_contract_str, engine="duckdb").test()
+
+    assert run.result == "failed"
+    check = next(check for check in run.checks if check.key == "inventory__sku__field_required")
+    assert check.reason == "Found 1 missing values"
+
+
+def test_kafka_avro(kafka_messages):
+    data_contract = resolve_data_contract("fixtures/kafka-avro/datacontract.yaml")
+    schema = avro.schema.parse(to_avro_schema_json("orders", data_contract.models["orders"]))
+    writer = avro.io.DatumWriter(schema)
+    for i in range(5):
+        buffer = io.BytesIO()
+        # confluent schema registry wire format: magic byte and schema id
+        buffer.write(b"\x00" + struct.pack(">I", 1))
+        writer.write(
+            {"order_id": f"order-{i}", "amount": i * 100, "ordered_at": datetime(2025, 1, i + 1, tzinfo=timezone.utc)},
+            avro.io.BinaryEncoder(buffer),
+        )
+        kafka_messages.append(buffer.getvalue())
+
+    run = DataContract(data_contract_file="fixtures/kafka-avro/datacontract.yaml", engine="duckdb").test()
+
+    print(run.pretty())
+    assert run.result == "passed"
+    assert all(check.engine == "duckdb" for check in run.checks if check.key is not None)
+
+    kafka_messages.append(b"\x00\x00\x00\x00\x01invalid")
+    run = DataContract(data_contract_file="fixtures/kafka-avro/datacontract.yaml", engine="duckdb").test()
+
+    assert run.result == "failed"
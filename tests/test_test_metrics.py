@@ -0,0 +1,48 @@
+from datacontract.data_contract import DataContract
+from datacontract.engines.soda.check_soda_execute import add_scan_metrics
+from datacontract.model.run import Check, Run
+from datacontract.output.junit_test_results import iter_junit_xml
+
+datacontract = "fixtures/duckdb-engine/datacontract.yaml"
+
+
+def test_metrics_soda():
+    run = DataContract(data_contract_file=datacontract).test()
+    assert run.result == "passed"
+    assert {"resolve", "check_generation", "connect", "execute", "merge"} <= set(run.metrics.phases)
+    assert run.metrics.models["combined"].durationSeconds > 0
+    assert run.metrics.models["combined"].bytesRead > 0
+    check = run.get_check_by_key("combined__string_field__field_required")
+    assert check.diagnostics["durationSeconds"] > 0
+
+
+def test_metrics_soda_without_query_internals():
+    class SodaCheck:
+        name = "check"
+        metrics = ["a soda-core version with other internals"]
+
+    class Scan:
+        _checks = [SodaCheck()]
+
+    run = Run.create_run()
+    run.checks = [Check(key="check", type="schema", name="check", result="passed")]
+    add_scan_metrics(run, Scan())
+    assert run.metrics is None or run.metrics.models == {}
+    assert run.checks[0].diagnostics is None
+
+
+def test_metrics_duckdb_engine():
+    run = DataContract(data_contract_file=datacontract, engine="duckdb").test()
+    assert run.result == "passed"
+    assert {"resolve", "check_generation", "connect", "execute"} <= set(run.metrics.phases)
+    assert run.metrics.models["combined"].rowsScanned == 3
+    assert run.metrics.models["combined"].bytesRead > 0
+    assert all(check.diagnostics["durationSeconds"] > 0 for check in run.checks if check.engine == "duckdb")
+
+
+def test_metrics_junit():
+    run = DataContract(data_contract_file=datacontract, engine="duckdb").test()
+    junit_xml = "".join(iter_junit_xml(run))
+    assert '<property name="metrics.models.combined.rowsScanned" value="3"/>' in junit_xml
+    assert '<property name="metrics.phases.execute"' in junit_xml
+    assert 'name="combined__string_field__field_required" time="' in junit_xml
@@ -0,0 +1,38 @@
+import json
+import os
+
+from typer.testing import CliRunner
+
+from datacontract.cli import app
+from datacontract.model.run import Check, ResultEnum, Run
+
+runner = CliRunner()
+
+
+def test_output_json_test_result(tmp_path):
+    runner.invoke(
+        app,
+        [
+            "test",
+            "--output",
+            tmp_path / "datacontract-test-results.json",
+            "--output-format",
+            "json",
+            "./fixtures/junit/datacontract.yaml",
+        ],
+    )
+    assert os.path.exists(tmp_path / "datacontract-test-results.json"), "Should write a JSON test result file"
+    with open(tmp_path / "datacontract-test-results.json") as f:
+        result = json.load(f)
+    assert result["dataContractId"] is not None
+    assert len(result["checks"]) > 0
+
+
+def test_iter_json_equals_model_dump_json():
+    run = Run.create_run()
+    for i in range(25):
+        run.checks.append(Check(type="field_is_present", name=f"Check {i}", model="orders", result=ResultEnum.passed))
+        run.log_info(f"Log {i}")
+    run.finish()
+
+    assert "".join(run.iter_json(batch_size=10)) == run.model_dump_json()
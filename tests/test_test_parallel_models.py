@@ -0,0 +1,14 @@
+from datacontract.data_contract import DataContract
+
+
+def test_parallel_models():
+    serial_run = DataContract(data_contract_file="fixtures/parallel-models/datacontract.yaml").test()
+    parallel_run = DataContract(
+        data_contract_file="fixtures/parallel-models/datacontract.yaml", max_parallel_models=3
+    ).test()
+
+    assert parallel_run.result == serial_run.result
+    assert {(check.key, check.result) for check in parallel_run.checks} == {
+        (check.key, check.result) for check in serial_run.checks
+    }
+    assert any("soda scans" in log.message for log in parallel_run.logs)
@@ -0,0 +1,117 @@
+from contextlib import ExitStack
+
+import duckdb
+import yaml
+
+from datacontract.engines.soda.check_soda_execute import execute_scan, to_configuration_data_source
+from datacontract.engines.soda.connections.warehouse_session_pool import (
+    WarehouseSession,
+    add_warehouse_session,
+    disable_warehouse_session_pool,
+    enable_warehouse_session_pool,
+)
+
+sodacl_yaml_str = """
+checks for orders:
+  - row_count = 2
+"""
+
+
+# a duckdb database file stands in for a warehouse that soda-core connects to from its configuration
+def to_soda_configuration(tmp_path, database: str = "warehouse") -> str:
+    path = str(tmp_path / f"{database}.duckdb")
+    con = duckdb.connect(path)
+    con.execute("CREATE TABLE orders AS SELECT * FROM (VALUES (1), (2)) t(id)")
+    con.close()
+    return yaml.dump({"data_source warehouse": {"type": "duckdb", "path": path}})
+
+
+def execute(soda_configuration_str: str):
+    with ExitStack() as resources:
+        add_data_source = to_configuration_data_source("warehouse", soda_configuration_str, resources)
+        scan = execute_scan(add_data_source, sodacl_yaml_str, concurrent=False)
+    assert not scan.has_error_logs()
+    assert scan.get_scan_results()["checks"][0]["outcome"] == "pass"
+    return scan._data_source_manager.data_sources["warehouse"].connection
+
+
+def test_pooled_session_is_reused(tmp_path):
+    soda_configuration_str = to_soda_configuration(tmp_path)
+    pool = enable_warehouse_session_pool(max_size=2)
+    try:
+        connection = execute(soda_configuration_str)
+        assert pool.size() == 1
+        assert execute(soda_configuration_str) is connection
+        assert pool.size() == 1
+    finally:
+        disable_warehouse_session_pool()
+
+
+def test_sessions_are_not_shared_between_configurations(tmp_path):
+    soda_configuration_str = to_soda_configuration(tmp_path)
+    pool = enable_warehouse_session_pool(max_size=1)
+    try:
+        connection = execute(soda_configuration_str)
+        assert execute(to_soda_configuration(tmp_path, "other")) is not connection
+        assert pool.size() == 1
+    finally:
+        disable_warehouse_session_pool()
+
+
+def test_idle_sessions_are_evicted(tmp_path):
+    soda_configuration_str = to_soda_configuration(tmp_path)
+    pool = enable_warehouse_session_pool(max_size=2, max_idle_seconds=0)
+    try:
+        execute(soda_configuration_str)
+        pool.evict_idle()
+        assert pool.size() == 0
+    finally:
+        disable_warehouse_session_pool()
+
+
+def test_without_pool_every_scan_connects(tmp_path):
+    disable_warehouse_session_pool()
+    soda_configuration_str = to_soda_configuration(tmp_path)
+    assert execute(soda_configuration_str) is not execute(soda_configuration_str)
+
+
+def test_soda_core_does_not_close_pooled_data_sources():
+    # the pool relies on soda-core closing only the connections it opened by name at the end of a scan
+    from soda.scan import Scan
+
+    class Closeable:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+        def disconnect(self):
+            self.closed = True
+
+    data_source = Closeable()
+    data_source.data_source_name = "warehouse"
+    data_source.connection = Closeable()
+    scan = Scan()
+    add_warehouse_session(scan, WarehouseSession(key="key", data_source=data_source))
+    scan._data_source_manager.close_all_connections()
+    assert not data_source.closed
+    assert not data_source.connection.closed
+
+
+def test_scan_without_soda_core_internals_is_not_pooled(tmp_path):
+    class Scan:
+        def add_configuration_yaml_str(self, configuration_yaml_str):
+            pass
+
+        def set_data_source_name(self, data_source_name):
+            pass
+
+    pool = enable_warehouse_session_pool(max_size=1)
+    try:
+        with ExitStack() as resources:
+            add_data_source = to_configuration_data_source("warehouse", to_soda_configuration(tmp_path), resources)
+            add_data_source(Scan(), False)
+        assert pool.size() == 0
+        assert pool.misses == 0
+    finally:
+        disable_warehouse_session_pool()
@@ -0,0 +1,47 @@
+import yaml
+
+from datacontract import yaml_io
+from datacontract.data_contract import DataContract
+from datacontract.model.construct import ReadOnlyDict, ReadOnlyList
+
+
+def test_same_output_as_pure_python_yaml():
+    data_contract_str = open("fixtures/export/datacontract.yaml").read()
+    data = yaml.safe_load(data_contract_str)
+    assert yaml_io.safe_load(data_contract_str) == data
+
+    data["info"]["description"] = "A description\nwith line breaks\n"
+    # libyaml folds long double-quoted strings without the line continuation of pure Python
+    data["info"]["title"] = "A long title with a tab\tcharacter that is longer than the line width of eighty characters"
+    assert yaml_io.safe_dump(data, sort_keys=False, allow_unicode=True) == yaml.safe_dump(
+        data, sort_keys=False, allow_unicode=True
+    )
+    assert yaml_io.dump(data) == yaml.dump(data)
+    assert "description: |" in yaml_io.safe_dump(data)
+
+
+def test_read_only_containers_only_with_own_dumpers():
+    data = ReadOnlyDict({"fields": ReadOnlyList(["a", "b"])})
+    assert yaml_io.safe_dump(data) == yaml.safe_dump({"fields": ["a", "b"]})
+    assert yaml_io.dump(data) == yaml.dump({"fields": ["a", "b"]})
+    for dumper in [yaml.SafeDumper, yaml.Dumper, getattr(yaml, "CSafeDumper", None), getattr(yaml, "CDumper", None)]:
+        if dumper is not None:
+            assert ReadOnlyList not in dumper.yaml_representers
+            assert ReadOnlyDict not in dumper.yaml_representers
+
+
+def test_yaml_parse_cache():
+    cache = yaml_io.enable_yaml_parse_cache(max_size=1)
+    try:
+        data_contract_str = open("fixtures/export/datacontract.yaml").read()
+        first = DataContract(data_contract_str=data_contract_str).get_data_contract_specification()
+        second = DataContract(data_contract_str=data_contract_str).get_data_contract_specification()
+
+        assert first == second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+        yaml_io.safe_load_cached("id: other")
+        assert cache.size() == 1
+    finally:
+        yaml_io.disable_yaml_parse_cache()
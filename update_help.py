@@ -10,6 +10,7 @@ markdown_file_path = Path("README.md")
 commands = [
     "init",
     "lint",
+    "compile",
     "test",
     "export",
     "import",
@@ -17,8 +18,10 @@ commands = [
     "catalog",
     "breaking",
     "changelog",
+    "breaking-batch",
     "diff",
     "api",
+    "serve-scheduler",
 ]
 
 